@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Block-streaming ambient mixer (voice + ambient layers → mixed WAV).
+
+mix_ambient (vault-assemble.py) and mix_single_ambient (tools/remix-session.py)
+decoded the whole ambient into one int16 array and held voice, ambient, mix
+and float64 intermediates in memory together — several hundred MB for a
+45-minute sleep story. This mixer walks the output timeline in fixed frames
+(FRAME_SEC): voice and every ambient layer are read one frame at a time, the
+gain × fade-in × fade-out envelope is evaluated per frame, and the mix is
+written as it goes. Peak memory is a few frames regardless of length.
+
+Timeline (Bible Section 11 / 16D):
+    [pre-roll silence | voice | post-roll silence]
+    ambient × gain, linear ramp up over the pre-roll, down over the post-roll
+
+Ambient sources are decoded once into a PCM cache (AMBIENT_PCM_DIR: raw
+44.1kHz mono int16, one file per source content hash) and opened with
+np.memmap, so an offset or a span is a slice and repeat mixes cost no
+decode. A layer with loop=True wraps back to its offset when the file runs
+out; loop=False raises (vault rule: ambient must be longer than the voice,
+NEVER loop).
+
+Usage (library):
+    layers = [AmbientLayer(path, gain_db=-19), AmbientLayer(path2, -14, offset_sec=10)]
+    stats = mix_to_wav("final/x-vault-voice.wav", layers, "final/x-vault.wav",
+                       fade_in_sec=30, fade_out_sec=60)
+    stats['rms_db']['tail']
+
+    # Re-mix only some ranges of an existing mix (others copied from base_wav)
+    mix_to_wav(voice, layers, out, 30, 60, base_wav=out, spans=[(s0, s1)])
+
+Usage (CLI):
+    python3 ambient-mixer.py warm          # decode every ambient into the PCM cache
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+SAMPLE_RATE = 44100
+FRAME_SEC = 10
+VERIFY_WINDOW_SEC = 5
+
+PROJECT_ROOT = Path(__file__).parent
+AMBIENT_SOURCE_DIRS = [PROJECT_ROOT / "content/audio/ambient",
+                       PROJECT_ROOT / "content/audio/ambient/youtube-downloads",
+                       PROJECT_ROOT / "content/sounds"]
+AMBIENT_PCM_DIR = PROJECT_ROOT / "content/audio/ambient-pcm"
+
+
+@dataclass
+class AmbientLayer:
+    path: Path
+    gain_db: float
+    offset_sec: float = 0
+    loop: bool = False
+
+
+# ---------------------------------------------------------------------------
+# Sources
+# ---------------------------------------------------------------------------
+
+class PcmReader:
+    """Sequential mono int16 reader over a WAV (direct) or any file (ffmpeg).
+
+    read(n) returns up to n samples; fewer only at end of file.
+    """
+
+    def __init__(self, path, start_sample=0, sample_rate=SAMPLE_RATE):
+        self.path = Path(path)
+        self.sample_rate = sample_rate
+        self._wav = None
+        self._proc = None
+        self._channels = 1
+        try:
+            wf = wave.open(str(self.path), 'rb')
+        except (wave.Error, EOFError):
+            wf = None
+        if wf is not None and wf.getsampwidth() == 2 and wf.getframerate() == sample_rate:
+            self._wav = wf
+            self._channels = wf.getnchannels()
+            self._wav.setpos(min(start_sample, wf.getnframes()))
+        else:
+            if wf is not None:
+                wf.close()
+            cmd = ['ffmpeg', '-v', 'quiet']
+            if start_sample:
+                cmd += ['-ss', str(start_sample / sample_rate)]
+            cmd += ['-i', str(self.path), '-f', 's16le', '-ac', '1',
+                    '-ar', str(sample_rate), '-acodec', 'pcm_s16le', '-']
+            self._proc = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                          stderr=subprocess.DEVNULL)
+
+    def read(self, n):
+        if self._wav is not None:
+            data = np.frombuffer(self._wav.readframes(n), dtype=np.int16)
+            if self._channels > 1:
+                data = data.reshape(-1, self._channels).mean(axis=1).astype(np.int16)
+            return data
+        return np.frombuffer(self._proc.stdout.read(n * 2), dtype=np.int16)
+
+    def close(self):
+        if self._wav is not None:
+            self._wav.close()
+        if self._proc is not None:
+            self._proc.stdout.close()
+            self._proc.terminate()
+            self._proc.wait()
+
+
+def _file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _decode_to_pcm(src, dest):
+    """Decode src to raw mono int16 at SAMPLE_RATE (written to .part, then renamed)."""
+    part = dest.with_name(f"{dest.name}.{os.getpid()}.part")
+    reader = PcmReader(src)
+    try:
+        with open(part, 'wb') as f:
+            while True:
+                data = reader.read(SAMPLE_RATE * 60)
+                if not len(data):
+                    break
+                f.write(data.tobytes())
+    finally:
+        reader.close()
+    os.replace(part, dest)
+
+
+def ambient_pcm(path, cache_dir=AMBIENT_PCM_DIR):
+    """Memory-mapped mono int16 PCM of an ambient file, decoded on first use.
+
+    The per-source index (size + mtime → content hash) avoids re-hashing
+    unchanged files; the PCM is named by content hash, so an edited source
+    gets a fresh decode and identical copies share one.
+    """
+    src = Path(path).resolve()
+    st = src.stat()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    index = cache_dir / f"{hashlib.sha1(str(src).encode()).hexdigest()[:16]}.json"
+    entry = json.loads(index.read_text()) if index.exists() else None
+    if not entry or (entry['size'], entry['mtime_ns']) != (st.st_size, st.st_mtime_ns):
+        entry = {'source': str(src), 'size': st.st_size, 'mtime_ns': st.st_mtime_ns,
+                 'sha256': _file_sha256(src)}
+        tmp = index.with_name(f"{index.name}.{os.getpid()}.part")
+        tmp.write_text(json.dumps(entry, indent=2))
+        os.replace(tmp, index)
+
+    pcm = cache_dir / f"{entry['sha256'][:24]}-{SAMPLE_RATE}.s16"
+    if not pcm.exists():
+        print(f"  Ambient cache: decoding {src.name} (one-time)")
+        _decode_to_pcm(src, pcm)
+    if pcm.stat().st_size == 0:
+        return np.zeros(0, dtype=np.int16)
+    return np.memmap(pcm, dtype=np.int16, mode='r')
+
+
+def warm_cache(cache_dir=AMBIENT_PCM_DIR):
+    """Decode every ambient source into the cache and drop orphaned PCM files."""
+    sources = []
+    for d in AMBIENT_SOURCE_DIRS:
+        if d.is_dir():
+            sources += sorted(p for p in d.iterdir() if p.suffix in ('.mp3', '.wav'))
+    for src in sources:
+        pcm = ambient_pcm(src, cache_dir)
+        print(f"  {src.name}: {len(pcm) / SAMPLE_RATE / 60:.1f} min")
+
+    live = set()
+    for index in cache_dir.glob("*.json"):
+        entry = json.loads(index.read_text())
+        if Path(entry['source']).exists():
+            live.add(f"{entry['sha256'][:24]}-{SAMPLE_RATE}.s16")
+        else:
+            index.unlink()
+    for pcm in cache_dir.glob("*.s16"):
+        if pcm.name not in live:
+            print(f"  Removing stale {pcm.name}")
+            pcm.unlink()
+    return len(sources)
+
+
+class AmbientStream:
+    """One ambient layer positioned at mix sample `start` (a memmap slice)."""
+
+    def __init__(self, layer, start=0, sample_rate=SAMPLE_RATE):
+        if sample_rate != SAMPLE_RATE:
+            raise ValueError(f"Ambient cache is {SAMPLE_RATE}Hz")
+        self.layer = layer
+        self.gain = 10 ** (layer.gain_db / 20.0)
+        self._pcm = ambient_pcm(layer.path)
+        self._offset = min(int(round(layer.offset_sec * sample_rate)), len(self._pcm))
+        usable = len(self._pcm) - self._offset
+        if layer.loop and usable:
+            start %= usable
+        self._pos = self._offset + start
+
+    def read(self, n):
+        """Exactly n samples (wrapping if looping) or ValueError if too short."""
+        data = self._pcm[self._pos:self._pos + n]
+        self._pos += len(data)
+        if len(data) == n:
+            return np.asarray(data)
+        parts = [np.asarray(data)]
+        got = len(data)
+        while got < n:
+            if not self.layer.loop:
+                raise ValueError(
+                    f"Ambient too short: {self.layer.path.name} ran out. "
+                    f"Bible: ambient must be longer than voice, NEVER loop.")
+            if len(self._pcm) == self._offset:
+                raise ValueError(f"Ambient file is empty: {self.layer.path}")
+            self._pos = self._offset
+            more = np.asarray(self._pcm[self._pos:self._pos + n - got])
+            self._pos += len(more)
+            parts.append(more)
+            got += len(more)
+        return np.concatenate(parts)
+
+    def close(self):
+        self._pcm = None
+
+
+# ---------------------------------------------------------------------------
+# Envelope + mixing
+# ---------------------------------------------------------------------------
+
+def ambient_envelope(start, end, total_len, fade_in_samples, fade_out_samples,
+                     gain_linear=1.0):
+    """Ambient gain for mix samples [start, end) of a total_len mix: constant
+    gain, linear ramp up over the first fade_in_samples and down over the last
+    fade_out_samples (np.linspace ramps, evaluated per sample)."""
+    t = np.arange(start, end, dtype=np.float64)
+    env = np.full(end - start, gain_linear)
+    if 0 < fade_in_samples <= total_len:
+        ramp = t < fade_in_samples
+        step = 1.0 / (fade_in_samples - 1) if fade_in_samples > 1 else 0.0
+        env[ramp] *= t[ramp] * step
+    if 0 < fade_out_samples <= total_len:
+        fade_start = total_len - fade_out_samples
+        ramp = t >= fade_start
+        step = 1.0 / (fade_out_samples - 1) if fade_out_samples > 1 else 0.0
+        env[ramp] *= 1.0 - (t[ramp] - fade_start) * step
+    return env
+
+
+class _RmsProbe:
+    """Accumulates sum of squares over fixed mix ranges as frames pass by."""
+
+    def __init__(self, windows):
+        self.windows = {k: (a, b) for k, (a, b) in windows.items() if b > a}
+        self.sums = {k: 0.0 for k in self.windows}
+
+    def update(self, start, frame):
+        end = start + len(frame)
+        for k, (a, b) in self.windows.items():
+            lo, hi = max(a, start), min(b, end)
+            if hi > lo:
+                seg = frame[lo - start:hi - start].astype(np.float64)
+                self.sums[k] += float(np.dot(seg, seg))
+
+    def rms_db(self):
+        out = {}
+        for k, (a, b) in self.windows.items():
+            rms = np.sqrt(self.sums[k] / (b - a))
+            out[k] = float(20 * np.log10(max(rms, 1e-10) / 32768))
+        return out
+
+
+def verify_windows(total_len, preroll, sample_rate=SAMPLE_RATE):
+    """The Bible Section 11 checklist windows, in mix samples."""
+    w = int(VERIFY_WINDOW_SEC * sample_rate)
+    windows = {}
+    if preroll > w:
+        windows['preroll_start'] = (0, w)
+        windows['preroll_end'] = (preroll - w, preroll)
+    if preroll + w < total_len:
+        windows['voice_before'] = (max(0, preroll - w), preroll)
+        windows['voice_after'] = (preroll, preroll + w)
+    if total_len > w:
+        windows['tail'] = (total_len - w, total_len)
+    return windows
+
+
+def mix_to_wav(voice_wav, layers, output_wav, fade_in_sec=30, fade_out_sec=60,
+               base_wav=None, spans=None, sample_rate=SAMPLE_RATE,
+               frame_sec=FRAME_SEC):
+    """Stream voice + ambient layers into output_wav.
+
+    voice_wav is placed after fade_in_sec of pre-roll and followed by
+    fade_out_sec of post-roll. With base_wav + spans (mix-sample ranges),
+    only the spans are mixed and everything else is copied from base_wav —
+    the previous mix at the same settings (it may be output_wav itself).
+
+    Returns {'total_samples', 'voice_samples', 'rms_db': {window: dB}}.
+    """
+    sr = sample_rate
+    frame = int(frame_sec * sr)
+    with wave.open(str(voice_wav), 'rb') as wf:
+        if wf.getframerate() != sr:
+            raise ValueError(f"Voice WAV must be {sr}Hz: {voice_wav}")
+        voice_len = wf.getnframes()
+    preroll = int(fade_in_sec * sr)
+    postroll = int(fade_out_sec * sr)
+    total_len = preroll + voice_len + postroll
+
+    # Vault rule: a non-looping ambient must cover the whole mix — fail
+    # before anything is written rather than partway through
+    for layer in layers:
+        pcm = ambient_pcm(layer.path)
+        usable = len(pcm) - min(int(round(layer.offset_sec * sr)), len(pcm))
+        if layer.loop and not usable:
+            raise ValueError(f"Ambient file is empty: {layer.path}")
+        if not layer.loop and usable < total_len:
+            raise ValueError(
+                f"Ambient too short: {Path(layer.path).name} is {usable / sr:.0f}s "
+                f"(after offset), mix needs {total_len / sr:.0f}s. "
+                f"Bible: ambient must be longer than voice, NEVER loop.")
+
+    regions = [(0, total_len)] if base_wav is None else sorted(
+        (max(0, a), min(total_len, b)) for a, b in spans)
+    probe = _RmsProbe(verify_windows(total_len, preroll, sr))
+    voice = PcmReader(voice_wav, sample_rate=sr)
+    voice_pos = 0
+    base = PcmReader(base_wav, sample_rate=sr) if base_wav is not None else None
+    base_pos = 0
+
+    output_wav = Path(output_wav)
+    part = output_wav.with_name(output_wav.name + '.part')
+    out = wave.open(str(part), 'wb')
+    out.setnchannels(1)
+    out.setsampwidth(2)
+    out.setframerate(sr)
+
+    def emit(start, samples):
+        out.writeframes(np.ascontiguousarray(samples, dtype=np.int16).tobytes())
+        probe.update(start, samples)
+
+    def copy_base(start, end):
+        nonlocal base, base_pos
+        if base_pos != start:
+            base.close()
+            base = PcmReader(base_wav, start_sample=start, sample_rate=sr)
+        pos = start
+        while pos < end:
+            chunk = base.read(min(frame, end - pos))
+            if not len(chunk):
+                raise ValueError(f"Base mix {base_wav} is shorter than expected")
+            emit(pos, chunk)
+            pos += len(chunk)
+        base_pos = end
+
+    def voice_frame(start, end):
+        """Voice samples for mix [start, end) (zeros outside the voice)."""
+        nonlocal voice, voice_pos
+        buf = np.zeros(end - start, dtype=np.int16)
+        lo, hi = max(start, preroll), min(end, preroll + voice_len)
+        if hi > lo:
+            if voice_pos != lo - preroll:
+                voice.close()
+                voice = PcmReader(voice_wav, start_sample=lo - preroll, sample_rate=sr)
+            data = voice.read(hi - lo)
+            buf[lo - start:lo - start + len(data)] = data
+            voice_pos = lo - preroll + len(data)
+        return buf
+
+    try:
+        pos = 0
+        for a, b in regions:
+            if a < pos:
+                a = pos
+            if a >= b:
+                continue
+            if pos < a:
+                copy_base(pos, a)
+            streams = [AmbientStream(layer, a, sr) for layer in layers]
+            try:
+                start = a
+                while start < b:
+                    end = min(start + frame, b)
+                    mixed = voice_frame(start, end).astype(np.float64)
+                    envelope = ambient_envelope(start, end, total_len, preroll, postroll)
+                    for s in streams:
+                        mixed += s.read(end - start).astype(np.float64) * (envelope * s.gain)
+                    emit(start, np.clip(mixed, -32768, 32767).astype(np.int16))
+                    start = end
+            finally:
+                for s in streams:
+                    s.close()
+            pos = b
+        if pos < total_len:
+            copy_base(pos, total_len)
+    except BaseException:
+        out.close()
+        part.unlink(missing_ok=True)
+        raise
+    finally:
+        out.close()
+        voice.close()
+        if base is not None:
+            base.close()
+    os.replace(part, output_wav)
+
+    return {'total_samples': total_len, 'voice_samples': voice_len,
+            'rms_db': probe.rms_db()}
+
+
+def main():
+    if len(sys.argv) != 2 or sys.argv[1] != 'warm':
+        print(__doc__)
+        sys.exit(1)
+    n = warm_cache()
+    print(f"Ambient cache warm: {n} source(s) in {AMBIENT_PCM_DIR}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+ASR Server — keeps Whisper models warm for every ASR consumer in the repo.
+
+Clients go through asr_client.transcribe() / asr_client.embed(), which use
+this server when it is listening and load Whisper in-process when it is not.
+
+POST /transcribe  { paths: [...], model: "base", options: {...} }
+                  → { results: [whisper transcribe() result per path] }
+POST /embed       { paths: [...], model: "base" }
+                  → { embeddings: [base64 .npy (frames × d_model) per path] }
+GET  /health      → { status, models }
+
+Requests are served one at a time on the resident models.
+
+Run: python3 asr-server.py [--port 8112] [--preload base]
+Listens on http://localhost:8112
+"""
+
+import argparse
+import json
+import sys
+import time
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+import asr_client
+
+backend = asr_client.WhisperBackend()
+
+
+class ASRHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        if self.path not in ("/transcribe", "/embed"):
+            self._respond(404, {"error": f"unknown route {self.path}"})
+            return
+        body = self._read_body()
+        if body is None:
+            return
+
+        paths = body.get("paths", [])
+        model = body.get("model", asr_client.DEFAULT_MODEL)
+        missing = [p for p in paths if not Path(p).exists()]
+        if missing:
+            self._respond(400, {"error": f"missing files: {missing[:5]}"})
+            return
+
+        t0 = time.time()
+        try:
+            if self.path == "/transcribe":
+                data = {"results": backend.transcribe(paths, model, **body.get("options", {}))}
+            else:
+                data = {"embeddings": [asr_client.encode_array(e)
+                                       for e in backend.embed(paths, model)]}
+        except Exception as e:
+            self._respond(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+        print(f"  {self.path[1:]}: {len(paths)} file(s) on '{model}' in {time.time() - t0:.1f}s")
+        self._respond(200, data)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._respond(200, {"status": "ok", "models": backend.loaded})
+        else:
+            self._respond(404, {"error": f"unknown route {self.path}"})
+
+    def _read_body(self):
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            return json.loads(self.rfile.read(length))
+        except Exception as e:
+            self._respond(400, {"error": str(e)})
+            return None
+
+    def _respond(self, code, data):
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(json.dumps(data).encode())
+
+    def log_message(self, format, *args):
+        # Batches are logged with their timing in do_POST
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Warm Whisper ASR server")
+    parser.add_argument("--port", type=int, default=asr_client.ASR_PORT)
+    parser.add_argument("--preload", action="append", default=[],
+                        help="Whisper model to load at startup (repeatable)")
+    args = parser.parse_args()
+
+    for name in args.preload:
+        backend.model(name)
+    print(f"ASR server on http://localhost:{args.port} (models: {backend.loaded or 'on demand'})")
+    HTTPServer(("localhost", args.port), ASRHandler).serve_forever()
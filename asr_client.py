@@ -0,0 +1,145 @@
+"""
+Whisper ASR for every consumer in the repo, through a warm local worker.
+
+Loading a Whisper model costs seconds, and each tool used to load its own
+(QA Gates 8/10, whisper-confidence.py, score-chunks-whisper.py and the
+tools/whisper-* experiments). asr-server.py keeps models resident and takes
+batches of file paths over HTTP on localhost; transcribe() and embed() here
+send the batch there when the server is up and otherwise fall back to an
+in-process WhisperBackend, loaded once per process.
+
+  transcribe(paths, **options)  → whisper transcribe() results (JSON-safe),
+                                  with word timestamps/probabilities when asked
+  embed(paths)                  → encoder output (frames × d_model) per file,
+                                  first 30 s window, encoded in padded batches
+
+Paths are resolved before they are sent, so the server's working directory
+does not matter.
+
+A plain importable module (not hyphenated + importlib) for the same reason
+as fish_client.py: the fallback backend is process-wide state.
+"""
+
+import base64
+import io
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import numpy as np
+
+import profiling
+
+ASR_PORT = 8112
+ASR_URL = os.getenv("ASR_URL", f"http://localhost:{ASR_PORT}")
+DEFAULT_MODEL = "base"
+EMBED_BATCH = 16  # 30 s mel windows per encoder pass
+
+
+def _jsonable(obj):
+    """Whisper results hold numpy scalars in places; round-trip to plain JSON types."""
+    return json.loads(json.dumps(obj, default=float))
+
+
+def encode_array(arr):
+    buf = io.BytesIO()
+    np.save(buf, np.asarray(arr), allow_pickle=False)
+    return base64.b64encode(buf.getvalue()).decode('ascii')
+
+
+def decode_array(text):
+    return np.load(io.BytesIO(base64.b64decode(text)), allow_pickle=False)
+
+
+class WhisperBackend:
+    """Resident Whisper models (loaded on first use, one per model name)."""
+
+    def __init__(self):
+        self._models = {}
+        self._lock = threading.Lock()
+
+    def model(self, name=DEFAULT_MODEL):
+        with self._lock:
+            if name not in self._models:
+                import whisper
+                print(f"  ASR: loading Whisper '{name}'...")
+                self._models[name] = whisper.load_model(name)
+            return self._models[name]
+
+    @property
+    def loaded(self):
+        return sorted(self._models)
+
+    @profiling.span('whisper.transcribe', 'asr')
+    def transcribe(self, paths, model=DEFAULT_MODEL, **options):
+        m = self.model(model)
+        return [_jsonable(m.transcribe(str(p), **options)) for p in paths]
+
+    def embed(self, paths, model=DEFAULT_MODEL, batch_size=EMBED_BATCH):
+        """Encoder output for each file's first 30 s (padded), EMBED_BATCH files per pass."""
+        import torch
+        import whisper
+        m = self.model(model)
+        out = []
+        for i in range(0, len(paths), batch_size):
+            mels = [whisper.log_mel_spectrogram(whisper.pad_or_trim(whisper.load_audio(str(p))),
+                                                n_mels=m.dims.n_mels)
+                    for p in paths[i:i + batch_size]]
+            with torch.no_grad():
+                enc = m.encoder(torch.stack(mels).to(m.device))
+            out.extend(e.float().cpu().numpy() for e in enc)
+        return out
+
+
+_local_backend = None
+
+
+def local_backend():
+    """Process-wide WhisperBackend for when no server is running."""
+    global _local_backend
+    if _local_backend is None:
+        _local_backend = WhisperBackend()
+    return _local_backend
+
+
+def _request(route, payload, url=ASR_URL):
+    """POST to the server; None if nothing is listening."""
+    req = urllib.request.Request(f"{url}{route}", data=json.dumps(payload).encode(),
+                                 headers={'Content-Type': 'application/json'})
+    try:
+        with profiling.span(f"asr{route}", 'api', files=len(payload.get('paths', []))), \
+                urllib.request.urlopen(req) as resp:
+            return json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        raise RuntimeError(f"ASR server {route}: {e.code} {e.read().decode(errors='replace')}")
+    except (urllib.error.URLError, ConnectionError):
+        return None
+
+
+def server_available(url=ASR_URL):
+    try:
+        with urllib.request.urlopen(f"{url}/health", timeout=1) as resp:
+            return resp.status == 200
+    except (urllib.error.URLError, ConnectionError, OSError):
+        return False
+
+
+def transcribe(paths, model=DEFAULT_MODEL, **options):
+    """Whisper transcribe() result for each path (options as for model.transcribe)."""
+    paths = [str(Path(p).resolve()) for p in paths]
+    reply = _request('/transcribe', {'paths': paths, 'model': model, 'options': options})
+    if reply is not None:
+        return reply['results']
+    return local_backend().transcribe(paths, model, **options)
+
+
+def embed(paths, model=DEFAULT_MODEL):
+    """Whisper encoder embeddings (frames × d_model float32) for each path."""
+    paths = [str(Path(p).resolve()) for p in paths]
+    reply = _request('/embed', {'paths': paths, 'model': model})
+    if reply is not None:
+        return [decode_array(e) for e in reply['embeddings']]
+    return local_backend().embed(paths, model)
@@ -0,0 +1,655 @@
+#!/usr/bin/env python3
+"""
+Single-decode feature engine for candidate WAVs.
+
+Every scorer in the vault pipeline used to open the same candidate with its
+own librosa.load(sr=22050): score_chunk_quality + compute_mfcc_profile
+(build-session-v3.py), extract_gate16_features + extract_echo_v2_features
+(auto-picker.py) and extract_breakout_features (breakout-scanner.py). That is
+five decodes and five 44.1k→22.05k resamples per candidate.
+
+AudioFeatures decodes + resamples once, shares the STFT magnitude per hop
+length between every feature family, and returns the same values as the
+original functions (those functions now delegate here).
+
+FeatureStore persists computed families in SQLite keyed by WAV content hash +
+per-family extractor version (replaces the per-session gate-scores-cache.json,
+which was keyed only by c{ci}_v{v} and went stale when a version number was
+reused). Rows are upserted individually, so a pull or topup only computes
+features for audio the store has never seen.
+
+Usage (library):
+    feats = AudioFeatures("c03/c03_v12.wav")
+    feats.quality()        # score_chunk_quality dict
+    feats.mfcc_profile()   # compute_mfcc_profile vector
+    feats.gate16()         # extract_gate16_features dict
+    feats.echo_v2()        # extract_echo_v2_features dict
+    feats.breakout()       # extract_breakout_features dict
+    feats.extract_all()    # every family in one dict
+
+    store = FeatureStore()
+    store.features("c03/c03_v12.wav", ["quality", "mfcc_profile"])
+
+Usage (CLI):
+    python3 audio-features.py path/to/candidate.wav
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import librosa
+
+warnings.filterwarnings('ignore')
+
+SR = 22050
+N_FFT = 2048
+QUALITY_HOP = 512     # librosa default hop (n_fft // 4) — quality + MFCC profile
+DETAIL_HOP = 256      # Gate 16 / echo v2 / breakout
+BREAKOUT_TRIM_SEC = 0.1
+
+# Bump a family's version whenever its maths changes — old rows are then
+# ignored (not deleted) and recomputed on next access.
+FEATURE_VERSIONS = {
+    'quality': 1,
+    'mfcc_profile': 1,
+    'gate16': 1,
+    'echo_v2': 1,
+    'breakout': 1,
+}
+FEATURE_STORE_PATH = Path("content/audio-free/vault/feature-store.sqlite")
+
+
+class AudioFeatures:
+    """Decode a WAV once and compute every candidate feature family from it.
+
+    All intermediates (decoded signal, STFT magnitudes per hop length, mel
+    power spectrograms) are memoised on the instance, so calling several
+    feature methods on one object costs a single decode + resample.
+    """
+
+    def __init__(self, wav_path, sr=SR, y=None):
+        self.wav_path = str(wav_path)
+        self.sr = sr
+        self._y = y
+        self._memo = {}
+
+    # ------------------------------------------------------------------
+    # Shared intermediates
+    # ------------------------------------------------------------------
+
+    @property
+    def y(self):
+        """Mono float32 signal at self.sr (decoded + resampled once)."""
+        if self._y is None:
+            self._y, _ = librosa.load(self.wav_path, sr=self.sr, mono=True)
+        return self._y
+
+    def _memoised(self, key, fn):
+        if key not in self._memo:
+            self._memo[key] = fn()
+        return self._memo[key]
+
+    def stft_mag(self, hop_length, trimmed=False):
+        """|STFT| with n_fft=2048 for the full (or breakout-trimmed) signal."""
+        y = self.breakout_signal() if trimmed else self.y
+        return self._memoised(
+            ('stft', hop_length, trimmed),
+            lambda: np.abs(librosa.stft(y, n_fft=N_FFT, hop_length=hop_length)))
+
+    def power_spec(self, hop_length, trimmed=False):
+        return self._memoised(
+            ('power', hop_length, trimmed),
+            lambda: self.stft_mag(hop_length, trimmed) ** 2)
+
+    def mel_power(self, hop_length, n_mels, trimmed=False):
+        return self._memoised(
+            ('mel', hop_length, n_mels, trimmed),
+            lambda: librosa.feature.melspectrogram(
+                S=self.power_spec(hop_length, trimmed), sr=self.sr,
+                n_fft=N_FFT, n_mels=n_mels))
+
+    def mfcc(self, hop_length, trimmed=False, n_mfcc=13):
+        return self._memoised(
+            ('mfcc', hop_length, trimmed, n_mfcc),
+            lambda: librosa.feature.mfcc(
+                S=librosa.power_to_db(self.mel_power(hop_length, 128, trimmed)),
+                sr=self.sr, n_mfcc=n_mfcc))
+
+    def breakout_signal(self):
+        """Signal with the first/last 100ms trimmed (breakout edge rule)."""
+        def _trim():
+            y = self.y
+            trim_samples = int(self.sr * BREAKOUT_TRIM_SEC)
+            if len(y) > trim_samples * 3:
+                return y[trim_samples:-trim_samples]
+            return y
+        return self._memoised('breakout_y', _trim)
+
+    # ------------------------------------------------------------------
+    # Feature families
+    # ------------------------------------------------------------------
+
+    def quality(self):
+        """Per-chunk quality score (see build.score_chunk_quality)."""
+        y, sr = self.y, self.sr
+
+        if len(y) < 2048:
+            return {'score': 0.0, 'echo_risk': 1.0, 'hiss_risk': 0.0,
+                    'sp_contrast': 0.0, 'sp_flatness': 1.0, 'too_short': True}
+
+        # 1. Spectral flux variance — echo/reverb smooths transitions → higher variance
+        #    Best separator from calibration (Cohen's d = 1.046)
+        S = self.stft_mag(QUALITY_HOP)
+        S_norm = S / (S.sum(axis=0, keepdims=True) + 1e-10)
+        flux = np.sqrt(np.sum(np.diff(S_norm, axis=1)**2, axis=0))
+        echo_risk = float(np.var(flux))
+
+        # 2. HF energy ratio — hiss detection (energy above 6kHz / total)
+        freqs = librosa.fft_frequencies(sr=sr, n_fft=N_FFT)
+        hf_mask = freqs >= 6000
+        hf_energy = float(np.mean(S[hf_mask, :] ** 2))
+        total_energy = float(np.mean(S ** 2))
+        hiss_risk = 10 * np.log10(hf_energy / (total_energy + 1e-10) + 1e-10)
+
+        # 3. Spectral contrast — clean speech has higher contrast (d = 0.642)
+        contrast = librosa.feature.spectral_contrast(S=S, sr=sr)
+        sp_contrast = float(np.mean(contrast))
+
+        # 4. Spectral flatness — noise-like = higher, tonal = lower (d = 0.585)
+        sp_flatness = float(np.mean(librosa.feature.spectral_flatness(S=S)))
+
+        # Composite score: weighted combination, higher = better
+        # Weights from Cohen's d separation values (OK vs Echo calibration)
+        score = (
+            -echo_risk * 500.0       # flux variance ~0.001-0.002, penalty for higher
+            + sp_contrast * 0.05     # contrast ~19-21, reward for higher
+            - sp_flatness * 10.0     # flatness ~0.01-0.07, penalty for higher
+            - hiss_risk * 0.05       # hf ratio ~-17 to -10 dB, penalty for higher (less negative)
+        )
+
+        return {
+            'score': round(float(score), 4),
+            'echo_risk': round(echo_risk, 6),
+            'hiss_risk': round(hiss_risk, 2),
+            'sp_contrast': round(sp_contrast, 3),
+            'sp_flatness': round(sp_flatness, 5),
+        }
+
+    def mfcc_profile(self):
+        """Mean 13-coef MFCC for tonal distance (see build.compute_mfcc_profile)."""
+        if len(self.y) < 2048:
+            return None
+        return self.mfcc(QUALITY_HOP).mean(axis=1)
+
+    def gate16(self):
+        """The 11 Gate 16 echo features (see auto-picker extract_gate16_features)."""
+        from scipy.stats import kurtosis, skew
+
+        sr = self.sr
+        if len(self.y) < sr * 0.3:
+            return None
+
+        S = self.mel_power(DETAIL_HOP, 80)
+        S_db = librosa.power_to_db(S, ref=np.max)
+
+        mel_00_std = float(np.std(S_db[0, :]))
+        mel_01_std = float(np.std(S_db[1, :]))
+        mel_49_skew = float(skew(S_db[49, :]))
+        mel_00_kurt = float(kurtosis(S_db[0, :]))
+
+        band_corrs = []
+        for b in range(0, 79, 2):
+            corr = np.corrcoef(S_db[b, :], S_db[b + 1, :])[0, 1]
+            band_corrs.append(corr if not np.isnan(corr) else 0.0)
+        band_corr_mean = float(np.mean(band_corrs))
+        band_corr_std = float(np.std(band_corrs))
+        band_corr_min = float(np.min(band_corrs))
+
+        contrast = librosa.feature.spectral_contrast(
+            S=self.stft_mag(DETAIL_HOP), sr=sr, n_bands=6)
+        contrast_6_std = float(np.std(contrast[6]))
+
+        corr_range = band_corr_mean - band_corr_min
+        lm = np.mean([float(np.mean(S_db[b, :])) for b in range(10, 20)])
+        um = np.mean([float(np.mean(S_db[b, :])) for b in range(35, 50)])
+        ratio_lowmid_uppermid = lm - um
+        sub_std = np.mean([float(np.std(S_db[b, :])) for b in range(0, 5)])
+        overall_std = np.mean([float(np.std(S_db[b, :])) for b in range(0, 80)])
+        ratio_subbass_std_norm = sub_std / (overall_std + 1e-10)
+
+        return {
+            "mel_00_std": mel_00_std, "mel_01_std": mel_01_std,
+            "corr_range": corr_range, "band_corr_min": band_corr_min,
+            "band_corr_std": band_corr_std, "mel_49_skew": mel_49_skew,
+            "ratio_lowmid_uppermid": ratio_lowmid_uppermid,
+            "mel_00_kurt": mel_00_kurt, "band_corr_mean": band_corr_mean,
+            "contrast_6_std": contrast_6_std,
+            "ratio_subbass_std_norm": ratio_subbass_std_norm,
+        }
+
+    def echo_v2(self):
+        """Echo v2 physics features (see auto-picker extract_echo_v2_features)."""
+        y, sr = self.y, self.sr
+        if len(y) < sr * 0.3:
+            return None
+
+        min_q = int(15 * sr / 1000)   # 15ms — skip pitch region
+        max_q = int(200 * sr / 1000)  # 200ms — max echo delay
+
+        # --- Feature 1: Cepstral peak prominence ---
+        frame_size = 4096
+        hop_size = 1024
+        window = np.hanning(frame_size)
+        frame_prominences = []
+
+        for start in range(0, len(y) - frame_size, hop_size):
+            frame = y[start:start + frame_size]
+            Y = np.fft.rfft(frame * window)
+            power = np.abs(Y) ** 2
+            log_power = np.log(power + 1e-10)
+            cepstrum = np.fft.irfft(log_power)
+            echo_region = np.abs(cepstrum[min_q:min(max_q, len(cepstrum))])
+            if len(echo_region) == 0:
+                continue
+            peak = float(np.max(echo_region))
+            baseline = float(np.median(echo_region))
+            frame_prominences.append(peak - baseline)
+
+        ceps_prom_max = float(np.max(frame_prominences)) if frame_prominences else 0.0
+
+        # --- Feature 2: Energy Decay Rate (EDR slope) ---
+        y_sq = y ** 2
+        edr = np.cumsum(y_sq[::-1])[::-1]
+        edr_db = 10 * np.log10(edr / (edr[0] + 1e-10) + 1e-10)
+        mask = (edr_db > -20) & (edr_db < -5)
+        if np.sum(mask) > 10:
+            indices = np.where(mask)[0]
+            x = indices.astype(float) / sr
+            y_fit = edr_db[indices]
+            coeffs = np.polyfit(x, y_fit, 1)
+            edr_slope = float(coeffs[0])
+        else:
+            edr_slope = -10.0
+
+        # --- Feature 3: Spectral flux std ---
+        S = self.stft_mag(DETAIL_HOP)
+        flux = np.sqrt(np.sum(np.diff(S, axis=1) ** 2, axis=0))
+        flux_std = float(np.std(flux))
+
+        return {
+            "echo_v2_ceps": ceps_prom_max,
+            "echo_v2_edr": edr_slope,
+            "echo_v2_flux_std": flux_std,
+        }
+
+    def breakout(self):
+        """Gate 17 breakout features (see breakout-scanner extract_breakout_features)."""
+        sr = self.sr
+        duration = len(self.y) / sr
+        if duration < 0.5:
+            return None
+
+        y = self.breakout_signal()
+        feats = {"duration": float(duration)}
+        hop = DETAIL_HOP
+
+        # ---- A. Pitch continuity ----
+        f0, voiced_flag, voiced_prob = librosa.pyin(
+            y, fmin=50, fmax=600, sr=sr, hop_length=hop
+        )
+        voiced_mask = ~np.isnan(f0)
+        f0_voiced = f0[voiced_mask]
+
+        if len(f0_voiced) > 2:
+            ratios = f0_voiced[1:] / f0_voiced[:-1]
+            semitone_jumps = np.abs(12.0 * np.log2(ratios + 1e-10))
+
+            feats["f0_max_semitone_jump"] = float(np.max(semitone_jumps))
+            feats["f0_range_semitones"] = float(
+                12.0 * np.log2((np.max(f0_voiced) / np.min(f0_voiced)) + 1e-10)
+            )
+            feats["f0_std_normalized"] = float(np.std(f0_voiced) / (np.mean(f0_voiced) + 1e-10))
+            feats["f0_jumps_above_6st"] = int(np.sum(semitone_jumps > 6))
+
+            # Voicing dropout: voiced→unvoiced→voiced transitions lasting <5 frames
+            dropout_count = 0
+            in_dropout = False
+            dropout_len = 0
+            for i in range(len(voiced_mask)):
+                if voiced_mask[i]:
+                    if in_dropout and dropout_len < 5:
+                        dropout_count += 1
+                    in_dropout = False
+                    dropout_len = 0
+                else:
+                    if i > 0 and voiced_mask[i - 1]:
+                        in_dropout = True
+                    if in_dropout:
+                        dropout_len += 1
+            feats["voicing_dropout_count"] = dropout_count
+
+            # Min voicing confidence in any 5-frame window
+            if voiced_prob is not None and len(voiced_prob) >= 5:
+                min_conf = 1.0
+                for i in range(len(voiced_prob) - 4):
+                    window_conf = np.mean(voiced_prob[i:i+5])
+                    if window_conf < min_conf:
+                        min_conf = window_conf
+                feats["voicing_confidence_min_5frame"] = float(min_conf)
+            else:
+                feats["voicing_confidence_min_5frame"] = 0.0
+        else:
+            feats["f0_max_semitone_jump"] = 0.0
+            feats["f0_range_semitones"] = 0.0
+            feats["f0_std_normalized"] = 0.0
+            feats["f0_jumps_above_6st"] = 0
+            feats["voicing_dropout_count"] = 0
+            feats["voicing_confidence_min_5frame"] = 0.0
+
+        # ---- B. Spectral centroid discontinuity ----
+        centroid = librosa.feature.spectral_centroid(
+            S=self.stft_mag(hop, trimmed=True), sr=sr, n_fft=N_FFT)[0]
+
+        if len(centroid) > 2:
+            centroid_jumps = np.abs(np.diff(centroid))
+            mean_centroid = np.mean(centroid) + 1e-10
+
+            feats["centroid_max_jump_hz"] = float(np.max(centroid_jumps))
+            feats["centroid_max_jump_ratio"] = float(np.max(centroid_jumps) / mean_centroid)
+            feats["centroid_jump_p95"] = float(np.percentile(centroid_jumps, 95))
+            feats["centroid_std_normalized"] = float(np.std(centroid) / mean_centroid)
+        else:
+            feats["centroid_max_jump_hz"] = 0.0
+            feats["centroid_max_jump_ratio"] = 0.0
+            feats["centroid_jump_p95"] = 0.0
+            feats["centroid_std_normalized"] = 0.0
+
+        # ---- C. MFCC temporal coherence ----
+        mfcc = self.mfcc(hop, trimmed=True)
+        n_frames = mfcc.shape[1]
+
+        if n_frames > 2:
+            cosine_dists = []
+            for i in range(n_frames - 1):
+                a = mfcc[:, i]
+                b = mfcc[:, i + 1]
+                norm_a = np.linalg.norm(a)
+                norm_b = np.linalg.norm(b)
+                if norm_a > 1e-10 and norm_b > 1e-10:
+                    d = 1.0 - np.dot(a, b) / (norm_a * norm_b)
+                    cosine_dists.append(max(0.0, d))
+
+            if cosine_dists:
+                feats["mfcc_max_cosine_dist"] = float(np.max(cosine_dists))
+                feats["mfcc_cosine_dist_p95"] = float(np.percentile(cosine_dists, 95))
+            else:
+                feats["mfcc_max_cosine_dist"] = 0.0
+                feats["mfcc_cosine_dist_p95"] = 0.0
+
+            half = n_frames // 2
+            first_half_mean = np.mean(mfcc[:, :half], axis=1)
+            second_half_mean = np.mean(mfcc[:, half:], axis=1)
+            norm1 = np.linalg.norm(first_half_mean)
+            norm2 = np.linalg.norm(second_half_mean)
+            if norm1 > 1e-10 and norm2 > 1e-10:
+                feats["mfcc_half_split_dist"] = float(
+                    1.0 - np.dot(first_half_mean, second_half_mean) / (norm1 * norm2)
+                )
+            else:
+                feats["mfcc_half_split_dist"] = 0.0
+
+            feats["mfcc_temporal_std"] = float(np.mean(np.std(mfcc, axis=1)))
+        else:
+            feats["mfcc_max_cosine_dist"] = 0.0
+            feats["mfcc_cosine_dist_p95"] = 0.0
+            feats["mfcc_half_split_dist"] = 0.0
+            feats["mfcc_temporal_std"] = 0.0
+
+        # ---- D. Mel band energy redistribution ----
+        S_db = librosa.power_to_db(self.mel_power(hop, 80, trimmed=True), ref=np.max)
+        mel_frames = S_db.shape[1]
+
+        if mel_frames > 2:
+            mel_diff = np.diff(S_db, axis=1)
+            flux_per_frame = np.sqrt(np.mean(mel_diff ** 2, axis=0))
+
+            feats["mel_flux_max"] = float(np.max(flux_per_frame))
+            feats["mel_flux_p99"] = float(np.percentile(flux_per_frame, 99))
+
+            half = mel_frames // 2
+            first_half = np.mean(S_db[:, :half], axis=1)
+            second_half = np.mean(S_db[:, half:], axis=1)
+            band_diffs = np.abs(first_half - second_half)
+            feats["mel_half_shift_db"] = float(np.max(band_diffs))
+
+            low_energy = np.mean(S_db[:30, :], axis=0)
+            high_energy = np.mean(S_db[50:, :], axis=0)
+            ratio = low_energy - high_energy
+            feats["mel_low_high_ratio_range"] = float(np.max(ratio) - np.min(ratio))
+        else:
+            feats["mel_flux_max"] = 0.0
+            feats["mel_flux_p99"] = 0.0
+            feats["mel_half_shift_db"] = 0.0
+            feats["mel_low_high_ratio_range"] = 0.0
+
+        # ---- E. Temporal location ----
+        if mel_frames > 2:
+            breakout_frame = int(np.argmax(flux_per_frame))
+            feats["breakout_frame"] = breakout_frame
+            feats["breakout_time_sec"] = float(breakout_frame * hop / sr)
+            feats["breakout_time_frac"] = float(breakout_frame / (mel_frames - 1))
+        else:
+            feats["breakout_frame"] = 0
+            feats["breakout_time_sec"] = 0.0
+            feats["breakout_time_frac"] = 0.0
+
+        return feats
+
+    def extract_all(self):
+        """Every feature family from a single decode."""
+        return {
+            'quality': self.quality(),
+            'mfcc_profile': self.mfcc_profile(),
+            'gate16': self.gate16(),
+            'echo_v2': self.echo_v2(),
+            'breakout': self.breakout(),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Persistent feature store
+# ---------------------------------------------------------------------------
+
+def _encode(value):
+    """JSON-encode a feature value (dicts of numpy scalars, arrays, None)."""
+    def default(obj):
+        if isinstance(obj, np.ndarray):
+            return {'__ndarray__': obj.tolist(), 'dtype': str(obj.dtype)}
+        if isinstance(obj, np.integer):
+            return int(obj)
+        if isinstance(obj, np.floating):
+            return float(obj)
+        if isinstance(obj, np.bool_):
+            return bool(obj)
+        raise TypeError(f"Unserialisable feature value: {type(obj)}")
+    return json.dumps(value, default=default)
+
+
+def _decode(text):
+    def hook(obj):
+        if '__ndarray__' in obj:
+            return np.asarray(obj['__ndarray__'], dtype=obj['dtype'])
+        return obj
+    return json.loads(text, object_hook=hook)
+
+
+def wav_content_hash(wav_path):
+    """SHA-256 of the file bytes."""
+    h = hashlib.sha256()
+    with open(wav_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+class FeatureStore:
+    """SQLite feature store keyed by (WAV content hash, family, version).
+
+    A path index (path, size, mtime) → hash avoids re-hashing unchanged files.
+    Safe to share between threads; WAL mode lets several processes (auto-picker,
+    vault-builder, scanners) read and write the same file concurrently.
+    """
+
+    def __init__(self, db_path=FEATURE_STORE_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=60,
+                                     check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS features (
+                wav_hash    TEXT NOT NULL,
+                family      TEXT NOT NULL,
+                version     INTEGER NOT NULL,
+                data        TEXT,
+                computed_at TEXT,
+                PRIMARY KEY (wav_hash, family, version)
+            );
+            CREATE TABLE IF NOT EXISTS wav_index (
+                path     TEXT PRIMARY KEY,
+                size     INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                wav_hash TEXT NOT NULL
+            );
+        """)
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def wav_hash(self, wav_path):
+        """Content hash for a WAV, via the path index when size+mtime match."""
+        path = str(Path(wav_path).resolve())
+        st = os.stat(path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime_ns, wav_hash FROM wav_index WHERE path = ?",
+                (path,)).fetchone()
+        if row and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+            return row[2]
+        digest = wav_content_hash(path)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO wav_index (path, size, mtime_ns, wav_hash) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(path) DO UPDATE SET size = excluded.size, "
+                "mtime_ns = excluded.mtime_ns, wav_hash = excluded.wav_hash",
+                (path, st.st_size, st.st_mtime_ns, digest))
+            self._conn.commit()
+        return digest
+
+    def get(self, wav_hash, family, version):
+        """Return (found, value) for one family row."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM features WHERE wav_hash = ? AND family = ? AND version = ?",
+                (wav_hash, family, version)).fetchone()
+        if row is None:
+            return False, None
+        return True, _decode(row[0])
+
+    def put(self, wav_hash, family, version, value):
+        """Upsert one family row (value may be None, e.g. too-short audio)."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO features (wav_hash, family, version, data, computed_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(wav_hash, family, version) DO UPDATE SET "
+                "data = excluded.data, computed_at = excluded.computed_at",
+                (wav_hash, family, version, _encode(value),
+                 datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')))
+            self._conn.commit()
+
+    def cached(self, wav_path, family, version, compute):
+        """Return the stored value for (wav, family, version) or compute + upsert it.
+
+        For extractors outside AudioFeatures (e.g. echo-detector-v2).
+        """
+        digest = self.wav_hash(wav_path)
+        found, value = self.get(digest, family, version)
+        if not found:
+            value = compute(wav_path)
+            self.put(digest, family, version, value)
+        return value
+
+    def features(self, wav_path, families, stats=None, skip_errors=False):
+        """Return {family: value} for AudioFeatures families.
+
+        Missing families are computed from a single AudioFeatures decode and
+        upserted. If `stats` (a dict) is given, 'cached'/'computed' counters
+        are incremented per family. With skip_errors=True a family whose
+        extractor raises is left out of the result (and not stored).
+        """
+        digest = self.wav_hash(wav_path)
+        out = {}
+        missing = []
+        for family in families:
+            found, value = self.get(digest, family, FEATURE_VERSIONS[family])
+            if found:
+                out[family] = value
+            else:
+                missing.append(family)
+        if stats is not None:
+            stats['cached'] = stats.get('cached', 0) + len(out)
+            stats['computed'] = stats.get('computed', 0) + len(missing)
+        if missing:
+            af = AudioFeatures(wav_path)
+            for family in missing:
+                try:
+                    value = getattr(af, family)()
+                except Exception:
+                    if not skip_errors:
+                        raise
+                    continue
+                self.put(digest, family, FEATURE_VERSIONS[family], value)
+                out[family] = value
+        return out
+
+
+_default_store = None
+_default_store_pid = None
+
+
+def default_store():
+    """Process-wide FeatureStore at FEATURE_STORE_PATH (opened on first use,
+    reopened in forked worker processes — SQLite handles must not cross a fork).
+    """
+    global _default_store, _default_store_pid
+    if _default_store is None or _default_store_pid != os.getpid():
+        _default_store = FeatureStore()
+        _default_store_pid = os.getpid()
+    return _default_store
+
+
+def main():
+    if len(sys.argv) != 2:
+        print(__doc__)
+        sys.exit(1)
+    result = default_store().features(sys.argv[1], list(FEATURE_VERSIONS))
+    profile = result['mfcc_profile']
+    result['mfcc_profile'] = profile.tolist() if profile is not None else None
+    print(json.dumps(result, indent=2, default=float))
+
+
+if __name__ == '__main__':
+    main()
@@ -67,6 +67,10 @@ _build_spec.loader.exec_module(build)
 
 import numpy as np
 
+# profiling.py holds the process-wide span buffer (SALUS_PROFILE=1)
+sys.path.insert(0, str(Path(__file__).parent))
+import profiling
+
 # ---------------------------------------------------------------------------
 # Gate 16 (Echo) + Gate 17 (Breakout) — Bible v5.0
 # ---------------------------------------------------------------------------
@@ -155,52 +159,14 @@ def scan_chunk_triggers(text):
     return matches
 
 
-def extract_gate16_features(audio_path, sr=22050):
-    """Extract the 11 features used by Gate 16 echo detector."""
-    import librosa
-    from scipy.stats import kurtosis, skew
-
-    y, _sr = librosa.load(audio_path, sr=sr, mono=True)
-    if len(y) < sr * 0.3:
-        return None
-
-    S = librosa.feature.melspectrogram(y=y, sr=sr, n_mels=80, n_fft=2048, hop_length=256)
-    S_db = librosa.power_to_db(S, ref=np.max)
-
-    mel_00_std = float(np.std(S_db[0, :]))
-    mel_01_std = float(np.std(S_db[1, :]))
-    mel_49_skew = float(skew(S_db[49, :]))
-    mel_00_kurt = float(kurtosis(S_db[0, :]))
-
-    band_corrs = []
-    for b in range(0, 79, 2):
-        corr = np.corrcoef(S_db[b, :], S_db[b + 1, :])[0, 1]
-        band_corrs.append(corr if not np.isnan(corr) else 0.0)
-    band_corr_mean = float(np.mean(band_corrs))
-    band_corr_std = float(np.std(band_corrs))
-    band_corr_min = float(np.min(band_corrs))
-
-    contrast = librosa.feature.spectral_contrast(
-        y=y, sr=sr, n_fft=2048, hop_length=256, n_bands=6)
-    contrast_6_std = float(np.std(contrast[6]))
-
-    corr_range = band_corr_mean - band_corr_min
-    lm = np.mean([float(np.mean(S_db[b, :])) for b in range(10, 20)])
-    um = np.mean([float(np.mean(S_db[b, :])) for b in range(35, 50)])
-    ratio_lowmid_uppermid = lm - um
-    sub_std = np.mean([float(np.std(S_db[b, :])) for b in range(0, 5)])
-    overall_std = np.mean([float(np.std(S_db[b, :])) for b in range(0, 80)])
-    ratio_subbass_std_norm = sub_std / (overall_std + 1e-10)
+def extract_gate16_features(audio_path, sr=22050, features=None):
+    """Extract the 11 features used by Gate 16 echo detector.
 
-    return {
-        "mel_00_std": mel_00_std, "mel_01_std": mel_01_std,
-        "corr_range": corr_range, "band_corr_min": band_corr_min,
-        "band_corr_std": band_corr_std, "mel_49_skew": mel_49_skew,
-        "ratio_lowmid_uppermid": ratio_lowmid_uppermid,
-        "mel_00_kurt": mel_00_kurt, "band_corr_mean": band_corr_mean,
-        "contrast_6_std": contrast_6_std,
-        "ratio_subbass_std_norm": ratio_subbass_std_norm,
-    }
+    Pass `features` (build.load_audio_features) to reuse an existing decode.
+    """
+    if features is None:
+        features = build.load_audio_features(audio_path)
+    return features.gate16()
 
 
 def score_gate16(features):
@@ -226,68 +192,19 @@ def score_gate16(features):
 # No population stats. No training data. AUC 0.766-0.853 on ECHO vs PASS.
 # ---------------------------------------------------------------------------
 
-def extract_echo_v2_features(audio_path, sr=22050):
+def extract_echo_v2_features(audio_path, sr=22050, features=None):
     """Extract echo v2 features: cepstral prominence, EDR slope, spectral flux std.
 
     Returns dict with:
         echo_v2_ceps: max cepstral prominence in echo region (AUC 0.766, higher=echo)
         echo_v2_edr: energy decay slope (AUC 0.711, higher/less negative=echo)
         echo_v2_flux_std: spectral flux std (AUC 0.692, lower=echo)
-    """
-    import librosa
-
-    y, _sr = librosa.load(audio_path, sr=sr, mono=True)
-    if len(y) < sr * 0.3:
-        return None
-
-    min_q = int(15 * sr / 1000)   # 15ms — skip pitch region
-    max_q = int(200 * sr / 1000)  # 200ms — max echo delay
-
-    # --- Feature 1: Cepstral peak prominence (best single feature) ---
-    frame_size = 4096
-    hop_size = 1024
-    frame_prominences = []
-
-    for start in range(0, len(y) - frame_size, hop_size):
-        frame = y[start:start + frame_size]
-        window = np.hanning(frame_size)
-        Y = np.fft.rfft(frame * window)
-        power = np.abs(Y) ** 2
-        log_power = np.log(power + 1e-10)
-        cepstrum = np.fft.irfft(log_power)
-        echo_region = np.abs(cepstrum[min_q:min(max_q, len(cepstrum))])
-        if len(echo_region) == 0:
-            continue
-        peak = float(np.max(echo_region))
-        baseline = float(np.median(echo_region))
-        frame_prominences.append(peak - baseline)
-
-    ceps_prom_max = float(np.max(frame_prominences)) if frame_prominences else 0.0
-
-    # --- Feature 2: Energy Decay Rate (EDR slope) ---
-    y_sq = y ** 2
-    edr = np.cumsum(y_sq[::-1])[::-1]
-    edr_db = 10 * np.log10(edr / (edr[0] + 1e-10) + 1e-10)
-    mask = (edr_db > -20) & (edr_db < -5)
-    if np.sum(mask) > 10:
-        indices = np.where(mask)[0]
-        x = indices.astype(float) / sr
-        y_fit = edr_db[indices]
-        coeffs = np.polyfit(x, y_fit, 1)
-        edr_slope = float(coeffs[0])  # dB/sec, more negative = faster decay = cleaner
-    else:
-        edr_slope = -10.0  # Default: steep decay = clean
-
-    # --- Feature 3: Spectral flux std ---
-    S = np.abs(librosa.stft(y, n_fft=2048, hop_length=256))
-    flux = np.sqrt(np.sum(np.diff(S, axis=1) ** 2, axis=0))
-    flux_std = float(np.std(flux))
 
-    return {
-        "echo_v2_ceps": ceps_prom_max,
-        "echo_v2_edr": edr_slope,
-        "echo_v2_flux_std": flux_std,
-    }
+    Pass `features` (build.load_audio_features) to reuse an existing decode.
+    """
+    if features is None:
+        features = build.load_audio_features(audio_path)
+    return features.echo_v2()
 
 
 def score_gate17(features):
@@ -307,70 +224,64 @@ def score_gate17(features):
     return score, f0_jump
 
 
-def precompute_gate_scores(session_id, chunks_data):
-    """Pre-compute Gate 16+17 + echo v2 scores for all candidates. Caches to JSON."""
-    cache_path = VAULT_DIR / session_id / "gate-scores-cache.json"
-    cache = {}
-    if cache_path.exists():
-        try:
-            cache = json.loads(cache_path.read_text())
-        except Exception:
-            cache = {}
+def precompute_gate_scores(session_id, chunks_data, verbose=True):
+    """Pre-compute Gate 16+17 + echo v2 scores for all candidates.
+
+    Raw features come from the shared feature store (audio-features.py), keyed
+    by WAV content hash + extractor version — a regenerated candidate that
+    reuses a version number can no longer pick up stale scores, and only audio
+    the store has never seen is decoded. Scores are re-derived from the stored
+    features every run, so classifier config changes apply immediately.
+    """
+    store = build.audio_features_module().default_store()
+    families = ['gate16', 'echo_v2']
+    if _extract_breakout:
+        families.append('breakout')
 
     total = sum(len(c['candidates']) for c in chunks_data.values())
     computed = 0
     cached_hits = 0
+    stats = {}
 
     for ci, chunk in sorted(chunks_data.items()):
         for c in chunk['candidates']:
-            key = f"c{ci:02d}_v{c['version']:02d}"
-            if key in cache and 'echo_v2_ceps' in cache[key]:
-                # Cache hit — load all fields
-                c['echo_z'] = cache[key].get('echo_z')
-                c['breakout_z'] = cache[key].get('breakout_z')
-                c['f0_jump'] = cache[key].get('f0_jump')
-                c['echo_v2_ceps'] = cache[key].get('echo_v2_ceps')
-                c['echo_v2_edr'] = cache[key].get('echo_v2_edr')
-                c['echo_v2_flux_std'] = cache[key].get('echo_v2_flux_std')
-                cached_hits += 1
-                continue
-
             wav_path = c.get('wav_path', '')
             if not wav_path or not os.path.exists(wav_path):
                 continue
 
+            n_computed = stats.get('computed', 0)
+            try:
+                feats = store.features(wav_path, families, stats=stats, skip_errors=True)
+            except Exception:
+                feats = {}
+            if stats.get('computed', 0) > n_computed:
+                computed += 1
+                if verbose and computed % 50 == 0:
+                    print(f"    Gate features: {computed + cached_hits}/{total} "
+                          f"({cached_hits} cached, {computed} computed)")
+            else:
+                cached_hits += 1
+
             # Gate 16 (legacy — stored but NOT used in ranking)
             echo_z = None
             try:
-                g16_feats = extract_gate16_features(wav_path)
-                if g16_feats:
-                    echo_z = score_gate16(g16_feats)
+                echo_z = score_gate16(feats.get('gate16'))
             except Exception:
                 pass
 
             # Echo v2 — physics-based replacement (L-57)
-            echo_v2_ceps = None
-            echo_v2_edr = None
-            echo_v2_flux_std = None
-            try:
-                v2_feats = extract_echo_v2_features(wav_path)
-                if v2_feats:
-                    echo_v2_ceps = v2_feats['echo_v2_ceps']
-                    echo_v2_edr = v2_feats['echo_v2_edr']
-                    echo_v2_flux_std = v2_feats['echo_v2_flux_std']
-            except Exception:
-                pass
+            v2_feats = feats.get('echo_v2') or {}
+            echo_v2_ceps = v2_feats.get('echo_v2_ceps')
+            echo_v2_edr = v2_feats.get('echo_v2_edr')
+            echo_v2_flux_std = v2_feats.get('echo_v2_flux_std')
 
             # Gate 17 — breakout
             breakout_z = None
             f0_jump = None
-            if _extract_breakout:
-                try:
-                    g17_feats = _extract_breakout(wav_path)
-                    if g17_feats:
-                        breakout_z, f0_jump = score_gate17(g17_feats)
-                except Exception:
-                    pass
+            try:
+                breakout_z, f0_jump = score_gate17(feats.get('breakout'))
+            except Exception:
+                pass
 
             c['echo_z'] = echo_z
             c['breakout_z'] = breakout_z
@@ -378,22 +289,10 @@ def precompute_gate_scores(session_id, chunks_data):
             c['echo_v2_ceps'] = echo_v2_ceps
             c['echo_v2_edr'] = echo_v2_edr
             c['echo_v2_flux_std'] = echo_v2_flux_std
-            cache[key] = {
-                'echo_z': echo_z, 'breakout_z': breakout_z, 'f0_jump': f0_jump,
-                'echo_v2_ceps': echo_v2_ceps, 'echo_v2_edr': echo_v2_edr,
-                'echo_v2_flux_std': echo_v2_flux_std,
-            }
-            computed += 1
 
-            if computed % 50 == 0:
-                print(f"    Gate features: {computed + cached_hits}/{total} "
-                      f"({cached_hits} cached, {computed} computed)")
-                # Incremental cache save
-                cache_path.write_text(json.dumps(cache, indent=2))
-
-    cache_path.write_text(json.dumps(cache, indent=2))
-    print(f"  Gate features: {computed} computed, {cached_hits} cached, "
-          f"{total - computed - cached_hits} skipped")
+    if verbose:
+        print(f"  Gate features: {computed} computed, {cached_hits} cached, "
+              f"{total - computed - cached_hits} skipped")
 
 
 # ---------------------------------------------------------------------------
@@ -489,6 +388,26 @@ def measure_tail_silence(wav_path, threshold_db=TAIL_SILENCE_DB):
 # Data Loading
 # ---------------------------------------------------------------------------
 
+def candidate_from_meta(c, chunk_dir):
+    """Convert a vault-builder c{NN}_meta.json candidate entry to picker form."""
+    return {
+        'version': c['version'],
+        'filename': c.get('filename', ''),
+        'wav_path': str(Path(chunk_dir) / c.get('filename', '')),
+        'composite_score': c.get('composite_score'),
+        'quality_score': c.get('quality_score'),
+        'echo_risk': c.get('echo_risk'),
+        'hiss_risk': c.get('hiss_risk'),
+        'sp_contrast': c.get('sp_contrast'),
+        'sp_flatness': c.get('sp_flatness'),
+        'tonal_distance': c.get('tonal_distance_to_prev'),
+        'duration': c.get('duration_seconds'),
+        'tail_silence_ms': c.get('tail_silence_ms'),  # from metadata if available
+        'filtered': c.get('filtered', False),
+        'filter_reason': c.get('filter_reason', ''),
+    }
+
+
 def load_vault_candidates(session_id):
     """Load all candidate scores and metadata from a vault session directory.
 
@@ -509,26 +428,8 @@ def load_vault_candidates(session_id):
             continue
 
         meta = json.loads(meta_file.read_text())
-        candidates = []
-        for c in meta.get('candidates', []):
-            if c.get('error'):
-                continue
-            candidates.append({
-                'version': c['version'],
-                'filename': c.get('filename', ''),
-                'wav_path': str(chunk_dir / c.get('filename', '')),
-                'composite_score': c.get('composite_score'),
-                'quality_score': c.get('quality_score'),
-                'echo_risk': c.get('echo_risk'),
-                'hiss_risk': c.get('hiss_risk'),
-                'sp_contrast': c.get('sp_contrast'),
-                'sp_flatness': c.get('sp_flatness'),
-                'tonal_distance': c.get('tonal_distance_to_prev'),
-                'duration': c.get('duration_seconds'),
-                'tail_silence_ms': c.get('tail_silence_ms'),  # from metadata if available
-                'filtered': c.get('filtered', False),
-                'filter_reason': c.get('filter_reason', ''),
-            })
+        candidates = [candidate_from_meta(c, chunk_dir)
+                      for c in meta.get('candidates', []) if not c.get('error')]
 
         chunks[ci] = {
             'text': meta.get('text', ''),
@@ -1141,6 +1042,19 @@ def select_candidate(chunk_idx, chunk_data, prev_best_mfcc=None, session_log=Non
     return selected_c['version'], log
 
 
+def elimination_survivors(chunk_idx, chunk_data):
+    """Versions that clear select_candidate's elimination stage (no verdict history).
+
+    Used by vault-builder's adaptive waves to decide when a chunk's pool
+    already holds enough pickable candidates. Run precompute_gate_scores on
+    chunk_data first so the Gate 17 / echo v2 filters see real scores.
+    """
+    _, log = select_candidate(chunk_idx, chunk_data)
+    if log.get('unresolvable'):
+        return []
+    return [r['version'] for r in log.get('remaining', [])]
+
+
 def _load_existing_picks(session_id):
     """Load existing picks. Prefers picks-auto.json (auto-picker output) over picks/picks.json
     (assembly copy) so that rechunk correctly blocks the most recent pick, not a stale one."""
@@ -1158,6 +1072,7 @@ def _load_existing_picks(session_id):
         return {}
 
 
+@profiling.span('auto_pick_session')
 def auto_pick_session(session_id, chunks_data=None, rechunk_indices=None, force=False):
     """Run the automated picker on a session.
 
@@ -1171,14 +1086,18 @@ def auto_pick_session(session_id, chunks_data=None, rechunk_indices=None, force=
 
     Returns (picks_dict, selection_logs).
     """
+    profiling.annotate(session=session_id)
+    profiling.phase('load candidates')
     if chunks_data is None:
         chunks_data = load_vault_candidates(session_id)
 
     # Pre-compute Gate 16+17 scores for all candidates (Bible v5.0)
+    profiling.phase('gate scores')
     print(f"  Computing Gate 16 (echo) + Gate 17 (breakout) features...")
     precompute_gate_scores(session_id, chunks_data)
 
     # Load verdict history for severity-aware picking
+    profiling.phase('verdict history')
     verdict_history = load_verdict_history(session_id)
     if verdict_history:
         total_hard = sum(len(h.get('hard_versions', set())) for h in verdict_history.values())
@@ -1291,6 +1210,7 @@ def auto_pick_session(session_id, chunks_data=None, rechunk_indices=None, force=
     if rechunk_indices is None:
         contamination = {}
 
+    profiling.phase('select')
     picks = {
         'session': session_id,
         'reviewed': _now_iso(),
@@ -1675,4 +1595,5 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    with profiling.run(f"auto-picker {' '.join(sys.argv[1:])}"):
+        main()
@@ -18,6 +18,7 @@ import json
 import sys
 import os
 import argparse
+import importlib.util
 import random
 import warnings
 from pathlib import Path
@@ -29,6 +30,13 @@ from scipy.spatial.distance import cosine as cosine_dist
 
 warnings.filterwarnings('ignore')
 
+# Shared single-decode feature engine (hyphenated filename → importlib)
+_af_spec = importlib.util.spec_from_file_location(
+    "audio_features", Path(__file__).parent / "audio-features.py")
+_af_mod = importlib.util.module_from_spec(_af_spec)
+_af_spec.loader.exec_module(_af_mod)
+AudioFeatures = _af_mod.AudioFeatures
+
 PROJECT_ROOT = Path(__file__).parent
 VAULT_DIR = PROJECT_ROOT / "content" / "audio-free" / "vault"
 REGISTRY_PATH = PROJECT_ROOT / "content" / "session-registry.json"
@@ -180,183 +188,16 @@ def resolve_wavs_for_session(session_id):
 # STEP 2: FEATURE EXTRACTION
 # ============================================================
 
-def extract_breakout_features(wav_path, sr=22050):
-    """Extract ~25 breakout-specific features from a WAV file."""
-    y, sr = librosa.load(wav_path, sr=sr, mono=True)
-    duration = len(y) / sr
-
-    if duration < 0.5:
-        return None
-
-    # Edge trimming: skip first/last 100ms
-    trim_samples = int(sr * 0.1)
-    if len(y) > trim_samples * 3:
-        y = y[trim_samples:-trim_samples]
-
-    feats = {"duration": float(duration)}
-    hop = 256
-    n_fft = 2048
-
-    # ---- A. Pitch continuity (6 features) — primary signal ----
-    f0, voiced_flag, voiced_prob = librosa.pyin(
-        y, fmin=50, fmax=600, sr=sr, hop_length=hop
-    )
-
-    # Get voiced frames
-    voiced_mask = ~np.isnan(f0)
-    f0_voiced = f0[voiced_mask]
-
-    if len(f0_voiced) > 2:
-        # Semitone jumps between adjacent voiced frames
-        ratios = f0_voiced[1:] / f0_voiced[:-1]
-        semitone_jumps = np.abs(12.0 * np.log2(ratios + 1e-10))
-
-        feats["f0_max_semitone_jump"] = float(np.max(semitone_jumps))
-        feats["f0_range_semitones"] = float(
-            12.0 * np.log2((np.max(f0_voiced) / np.min(f0_voiced)) + 1e-10)
-        )
-        feats["f0_std_normalized"] = float(np.std(f0_voiced) / (np.mean(f0_voiced) + 1e-10))
-        feats["f0_jumps_above_6st"] = int(np.sum(semitone_jumps > 6))
-
-        # Voicing dropout: voiced→unvoiced→voiced transitions lasting <5 frames
-        dropout_count = 0
-        in_dropout = False
-        dropout_len = 0
-        for i in range(len(voiced_mask)):
-            if voiced_mask[i]:
-                if in_dropout and dropout_len < 5:
-                    dropout_count += 1
-                in_dropout = False
-                dropout_len = 0
-            else:
-                if i > 0 and voiced_mask[i - 1]:
-                    in_dropout = True
-                if in_dropout:
-                    dropout_len += 1
-        feats["voicing_dropout_count"] = dropout_count
-
-        # Min voicing confidence in any 5-frame window
-        if voiced_prob is not None and len(voiced_prob) >= 5:
-            min_conf = 1.0
-            for i in range(len(voiced_prob) - 4):
-                window_conf = np.mean(voiced_prob[i:i+5])
-                if window_conf < min_conf:
-                    min_conf = window_conf
-            feats["voicing_confidence_min_5frame"] = float(min_conf)
-        else:
-            feats["voicing_confidence_min_5frame"] = 0.0
-    else:
-        feats["f0_max_semitone_jump"] = 0.0
-        feats["f0_range_semitones"] = 0.0
-        feats["f0_std_normalized"] = 0.0
-        feats["f0_jumps_above_6st"] = 0
-        feats["voicing_dropout_count"] = 0
-        feats["voicing_confidence_min_5frame"] = 0.0
-
-    # ---- B. Spectral centroid discontinuity (4 features) ----
-    centroid = librosa.feature.spectral_centroid(y=y, sr=sr, n_fft=n_fft, hop_length=hop)[0]
-
-    if len(centroid) > 2:
-        centroid_jumps = np.abs(np.diff(centroid))
-        mean_centroid = np.mean(centroid) + 1e-10
-
-        feats["centroid_max_jump_hz"] = float(np.max(centroid_jumps))
-        feats["centroid_max_jump_ratio"] = float(np.max(centroid_jumps) / mean_centroid)
-        feats["centroid_jump_p95"] = float(np.percentile(centroid_jumps, 95))
-        feats["centroid_std_normalized"] = float(np.std(centroid) / mean_centroid)
-    else:
-        feats["centroid_max_jump_hz"] = 0.0
-        feats["centroid_max_jump_ratio"] = 0.0
-        feats["centroid_jump_p95"] = 0.0
-        feats["centroid_std_normalized"] = 0.0
-
-    # ---- C. MFCC temporal coherence (4 features) ----
-    mfcc = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13, n_fft=n_fft, hop_length=hop)
-    n_frames = mfcc.shape[1]
-
-    if n_frames > 2:
-        # Cosine distance between adjacent MFCC frames
-        cosine_dists = []
-        for i in range(n_frames - 1):
-            a = mfcc[:, i]
-            b = mfcc[:, i + 1]
-            norm_a = np.linalg.norm(a)
-            norm_b = np.linalg.norm(b)
-            if norm_a > 1e-10 and norm_b > 1e-10:
-                d = 1.0 - np.dot(a, b) / (norm_a * norm_b)
-                cosine_dists.append(max(0.0, d))
-
-        if cosine_dists:
-            feats["mfcc_max_cosine_dist"] = float(np.max(cosine_dists))
-            feats["mfcc_cosine_dist_p95"] = float(np.percentile(cosine_dists, 95))
-        else:
-            feats["mfcc_max_cosine_dist"] = 0.0
-            feats["mfcc_cosine_dist_p95"] = 0.0
-
-        # Half-split distance
-        half = n_frames // 2
-        first_half_mean = np.mean(mfcc[:, :half], axis=1)
-        second_half_mean = np.mean(mfcc[:, half:], axis=1)
-        norm1 = np.linalg.norm(first_half_mean)
-        norm2 = np.linalg.norm(second_half_mean)
-        if norm1 > 1e-10 and norm2 > 1e-10:
-            feats["mfcc_half_split_dist"] = float(
-                1.0 - np.dot(first_half_mean, second_half_mean) / (norm1 * norm2)
-            )
-        else:
-            feats["mfcc_half_split_dist"] = 0.0
-
-        # Mean of per-coefficient std
-        feats["mfcc_temporal_std"] = float(np.mean(np.std(mfcc, axis=1)))
-    else:
-        feats["mfcc_max_cosine_dist"] = 0.0
-        feats["mfcc_cosine_dist_p95"] = 0.0
-        feats["mfcc_half_split_dist"] = 0.0
-        feats["mfcc_temporal_std"] = 0.0
-
-    # ---- D. Mel band energy redistribution (4 features) ----
-    S = librosa.feature.melspectrogram(y=y, sr=sr, n_mels=80, n_fft=n_fft, hop_length=hop)
-    S_db = librosa.power_to_db(S, ref=np.max)
-    mel_frames = S_db.shape[1]
-
-    if mel_frames > 2:
-        # Total spectral flux per frame
-        mel_diff = np.diff(S_db, axis=1)
-        flux_per_frame = np.sqrt(np.mean(mel_diff ** 2, axis=0))
-
-        feats["mel_flux_max"] = float(np.max(flux_per_frame))
-        feats["mel_flux_p99"] = float(np.percentile(flux_per_frame, 99))
-
-        # Max dB diff in any mel band between first-half and second-half mean
-        half = mel_frames // 2
-        first_half = np.mean(S_db[:, :half], axis=1)
-        second_half = np.mean(S_db[:, half:], axis=1)
-        band_diffs = np.abs(first_half - second_half)
-        feats["mel_half_shift_db"] = float(np.max(band_diffs))
-
-        # Low/high energy ratio range across frames
-        low_energy = np.mean(S_db[:30, :], axis=0)
-        high_energy = np.mean(S_db[50:, :], axis=0)
-        ratio = low_energy - high_energy  # dB difference
-        feats["mel_low_high_ratio_range"] = float(np.max(ratio) - np.min(ratio))
-    else:
-        feats["mel_flux_max"] = 0.0
-        feats["mel_flux_p99"] = 0.0
-        feats["mel_half_shift_db"] = 0.0
-        feats["mel_low_high_ratio_range"] = 0.0
-
-    # ---- E. Temporal location (3 features) ----
-    if mel_frames > 2:
-        breakout_frame = int(np.argmax(flux_per_frame))
-        feats["breakout_frame"] = breakout_frame
-        feats["breakout_time_sec"] = float(breakout_frame * hop / sr)
-        feats["breakout_time_frac"] = float(breakout_frame / (mel_frames - 1))
-    else:
-        feats["breakout_frame"] = 0
-        feats["breakout_time_sec"] = 0.0
-        feats["breakout_time_frac"] = 0.0
+def extract_breakout_features(wav_path, sr=22050, features=None):
+    """Extract ~25 breakout-specific features from a WAV file.
 
-    return feats
+    Feature maths lives in audio-features.py (AudioFeatures.breakout) so the
+    auto-picker can share one decode across Gate 16/17 and echo v2. Pass
+    `features` to reuse an existing AudioFeatures instance.
+    """
+    if features is None:
+        features = AudioFeatures(wav_path, sr=sr)
+    return features.breakout()
 
 
 # ============================================================
@@ -704,7 +545,8 @@ def run_scan(sessions):
                          f"c{entry['chunk']:02d}/v{entry['version']:02d}{tag}    ")
         sys.stdout.flush()
 
-        feats = extract_breakout_features(entry["wav_path"])
+        feats = _af_mod.default_store().features(
+            entry["wav_path"], ["breakout"])["breakout"]
         entry["features"] = feats
 
     print()
@@ -824,7 +666,8 @@ def run_scan_all(sessions=None):
         sys.stdout.write(f"\r    [{i+1}/{len(all_wavs)}] {entry['session']} "
                          f"c{entry['chunk']:02d}/v{entry['version']:02d}{tag}    ")
         sys.stdout.flush()
-        feats = extract_breakout_features(entry["wav_path"])
+        feats = _af_mod.default_store().features(
+            entry["wav_path"], ["breakout"])["breakout"]
         entry["features"] = feats
 
     print()
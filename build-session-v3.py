@@ -16,6 +16,7 @@ Usage:
 import os
 import sys
 import re
+import hashlib
 import json
 import subprocess
 import tempfile
@@ -26,6 +27,12 @@ import random
 from pathlib import Path
 import urllib.request
 
+# qa_runner.py must be importable by name in QA process-pool workers
+sys.path.insert(0, str(Path(__file__).parent))
+import asr_client
+import profiling
+import qa_runner
+
 # Load .env manually
 env_path = Path(".env")
 if env_path.exists():
@@ -54,6 +61,7 @@ R2_PATH_PREFIX = "content/audio-free"
 QA_MAX_PASSES = 5         # Max scan-fix-rescan cycles before failing
 QA_CLICK_THRESHOLD = 120  # Min amplitude jump to count as click (raised: ambient transients like bird chirps at 100-115)
 QA_FADE_MS = 40           # Crossfade width at stitch boundaries (20ms wasn't enough for Fish 40-chunk builds)
+QA_WORKERS = max(1, min(4, (os.cpu_count() or 4) - 1))  # Parallel QA gate processes (1 = inline)
 
 # Master quality benchmarks (from ss02-the-moonlit-garden Marco T2 build)
 # Measured via astats RMS on silence regions — calibrated to measure_noise_floor()
@@ -362,7 +370,48 @@ def humanize_pauses(blocks, seed=42):
 # PER-CHUNK QA — Score individual chunks before assembly
 # ============================================================================
 
-def score_chunk_quality(audio_path):
+_audio_features_mod = None
+
+
+def audio_features_module():
+    """Load audio-features.py via importlib (hyphenated filename).
+
+    Provides AudioFeatures (single-decode feature engine) and FeatureStore
+    (content-addressed SQLite cache of computed features).
+    """
+    global _audio_features_mod
+    if _audio_features_mod is None:
+        import importlib.util
+        spec = importlib.util.spec_from_file_location(
+            "audio_features", Path(__file__).parent / "audio-features.py")
+        _audio_features_mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(_audio_features_mod)
+    return _audio_features_mod
+
+
+_loudness_mod = None
+
+
+def loudness_module():
+    """Load loudness-r128.py via importlib (native BS.1770 measurement + gain)."""
+    global _loudness_mod
+    if _loudness_mod is None:
+        import importlib.util
+        spec = importlib.util.spec_from_file_location(
+            "loudness_r128", Path(__file__).parent / "loudness-r128.py")
+        _loudness_mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(_loudness_mod)
+    return _loudness_mod
+
+
+def load_audio_features(audio_path):
+    """Return an AudioFeatures (audio-features.py) for a WAV — decoded once,
+    shared by every per-chunk feature family (quality, MFCC, Gate 16/17, echo v2).
+    """
+    return audio_features_module().AudioFeatures(audio_path)
+
+
+def score_chunk_quality(audio_path, features=None):
     """Score a single TTS chunk for quality (echo, hiss, voice consistency).
 
     Returns a dict with:
@@ -374,65 +423,19 @@ def score_chunk_quality(audio_path):
 
     Used by generate_chunk_with_qa() to pick the best of N generations.
     Calibrated against 27 human-labeled chunks from build 10 (8 Feb 2026).
+    Pass `features` (from load_audio_features) to reuse an existing decode.
+    Metric implementation lives in audio-features.py (AudioFeatures.quality).
     """
-    import librosa
-    import numpy as np
+    if features is None:
+        features = load_audio_features(audio_path)
+    return features.quality()
 
-    y, sr = librosa.load(audio_path, sr=22050)
-
-    if len(y) < 2048:
-        return {'score': 0.0, 'echo_risk': 1.0, 'hiss_risk': 0.0,
-                'sp_contrast': 0.0, 'sp_flatness': 1.0, 'too_short': True}
-
-    # 1. Spectral flux variance — echo/reverb smooths transitions → higher variance
-    #    Best separator from calibration (Cohen's d = 1.046)
-    S = np.abs(librosa.stft(y, n_fft=2048))
-    S_norm = S / (S.sum(axis=0, keepdims=True) + 1e-10)
-    flux = np.sqrt(np.sum(np.diff(S_norm, axis=1)**2, axis=0))
-    echo_risk = float(np.var(flux))
-
-    # 2. HF energy ratio — hiss detection (energy above 6kHz / total)
-    freqs = librosa.fft_frequencies(sr=sr, n_fft=2048)
-    hf_mask = freqs >= 6000
-    hf_energy = float(np.mean(S[hf_mask, :] ** 2))
-    total_energy = float(np.mean(S ** 2))
-    hiss_risk = 10 * np.log10(hf_energy / (total_energy + 1e-10) + 1e-10)
-
-    # 3. Spectral contrast — clean speech has higher contrast (d = 0.642)
-    contrast = librosa.feature.spectral_contrast(y=y, sr=sr)
-    sp_contrast = float(np.mean(contrast))
-
-    # 4. Spectral flatness — noise-like = higher, tonal = lower (d = 0.585)
-    sp_flatness = float(np.mean(librosa.feature.spectral_flatness(y=y)))
-
-    # Composite score: weighted combination, higher = better
-    # Weights from Cohen's d separation values (OK vs Echo calibration)
-    # All metrics normalized to ~0-1 range based on observed calibration data
-    score = (
-        -echo_risk * 500.0       # flux variance ~0.001-0.002, penalty for higher
-        + sp_contrast * 0.05     # contrast ~19-21, reward for higher
-        - sp_flatness * 10.0     # flatness ~0.01-0.07, penalty for higher
-        - hiss_risk * 0.05       # hf ratio ~-17 to -10 dB, penalty for higher (less negative)
-    )
 
-    return {
-        'score': round(float(score), 4),
-        'echo_risk': round(echo_risk, 6),
-        'hiss_risk': round(hiss_risk, 2),
-        'sp_contrast': round(sp_contrast, 3),
-        'sp_flatness': round(sp_flatness, 5),
-    }
-
-
-def compute_mfcc_profile(audio_path):
+def compute_mfcc_profile(audio_path, features=None):
     """Extract mean MFCC profile from an audio file for tonal comparison."""
-    import librosa
-    import numpy as np
-    y, sr = librosa.load(audio_path, sr=22050)
-    if len(y) < 2048:
-        return None
-    mfcc = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)
-    return mfcc.mean(axis=1)
+    if features is None:
+        features = load_audio_features(audio_path)
+    return features.mfcc_profile()
 
 
 def tonal_distance(mfcc_a, mfcc_b):
@@ -490,12 +493,13 @@ def generate_chunk_with_qa(text, output_path, chunk_num, emotion='calm',
                 pass
             continue
 
-        # Score quality
-        details = score_chunk_quality(temp_path)
+        # Score quality (one decode shared with the MFCC profile below)
+        features = load_audio_features(temp_path)
+        details = score_chunk_quality(temp_path, features=features)
         quality_score = details['score']
 
         # Score tonal consistency with previous chunk
-        chunk_mfcc = compute_mfcc_profile(temp_path)
+        chunk_mfcc = compute_mfcc_profile(temp_path, features=features)
         tone_dist = tonal_distance(prev_chunk_mfcc, chunk_mfcc)
         # Tonal penalty: distance typically 0.001-0.01, scale to impact score
         # Weight 50x so a 0.01 distance costs 0.5 points (significant)
@@ -1020,14 +1024,11 @@ def normalize_chunk(input_path, output_path, target_lufs=-24):
     from creating surges/drops in the final concatenated audio. The overall
     loudnorm pass after concatenation only adjusts the global average —
     it cannot fix per-chunk variations of 6-8 dB.
+
+    Native two-pass linear gain (loudness-r128.py, TP=-2); measurements are
+    cached by content, so re-normalising an unchanged chunk skips the analysis.
     """
-    cmd = [
-        'ffmpeg', '-y', '-i', input_path,
-        '-af', f'loudnorm=I={target_lufs}:TP=-2:LRA=11',
-        '-c:a', 'pcm_s16le', '-ar', str(SAMPLE_RATE),
-        output_path
-    ]
-    subprocess.run(cmd, capture_output=True, check=True)
+    loudness_module().loudnorm_file(input_path, output_path, target_i=target_lufs)
     return output_path
 
 
@@ -1168,7 +1169,481 @@ def mix_ambient(voice_path, ambient_name, output_path, volume_db=None, fade_in=N
 # ============================================================================
 
 
-def measure_noise_floor(audio_path, manifest_data):
+QA_ANALYSIS_SR = 22050  # librosa.load rate used by the MFCC/F0/silence gates
+QA_WHISPER_MODEL = "base"  # Whisper model behind Gates 8 and 10
+TRANSCRIPT_CACHE_DIR = "transcripts"  # Beside the audio: <sha256>-<model>[-<spans>].json
+ASR_SPEECH_PAD_SEC = 0.3  # Kept either side of each manifest text span
+ASR_SPAN_GAP_SEC = 1.0    # Silence between spans in the speech-only ASR input
+
+
+class QAAudio:
+    """One audio file as seen by the QA gates — decoded once, derivatives memoised.
+
+    pcm is the int16 decode (WAV read directly; anything else via ffmpeg at
+    SAMPLE_RATE, keeping the source's channel count as librosa.load and the
+    old per-gate transcodes did). Every other
+    signal the gates used to rebuild for themselves (mono float, 22.05k
+    resample, 1 s RMS envelope, high-pass bands, STFT, MFCC) is computed on
+    first use and kept on the instance.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._pcm = None
+        self._sr = None
+        self._memo = {}
+        self.via_ffmpeg = False
+
+    def _memoised(self, key, fn):
+        if key not in self._memo:
+            self._memo[key] = fn()
+        return self._memo[key]
+
+    def _decode(self):
+        import wave as _wave
+        import numpy as np
+        try:
+            w = _wave.open(self.path, 'r')
+        except (_wave.Error, EOFError):
+            w = None
+        if w is None or w.getsampwidth() != 2:
+            if w is not None:
+                w.close()
+            self._decode_via_ffmpeg()
+            return
+        nch = w.getnchannels()
+        self._sr = w.getframerate()
+        raw = w.readframes(w.getnframes())
+        w.close()
+        self._pcm = np.frombuffer(raw, dtype=np.int16).reshape(-1, nch)
+
+    def _decode_via_ffmpeg(self, channels=None):
+        """Decode at SAMPLE_RATE with `channels` (None: the source's count)."""
+        import numpy as np
+        if channels is None:
+            probe = subprocess.run(
+                ['ffprobe', '-v', 'quiet', '-select_streams', 'a:0',
+                 '-show_entries', 'stream=channels', '-of', 'csv=p=0', self.path],
+                capture_output=True, text=True)
+            channels = int(probe.stdout.strip()) if probe.stdout.strip() else 1
+        raw = subprocess.run([
+            'ffmpeg', '-v', 'quiet', '-i', self.path,
+            '-f', 's16le', '-acodec', 'pcm_s16le', '-ar', str(SAMPLE_RATE),
+            '-ac', str(channels), '-'
+        ], capture_output=True, check=True).stdout
+        self._sr = SAMPLE_RATE
+        self._pcm = np.frombuffer(raw, dtype=np.int16).reshape(-1, channels)
+        self.via_ffmpeg = True
+        self._memo.clear()
+
+    @property
+    def pcm(self):
+        """int16 samples, shape (frames, channels)."""
+        if self._pcm is None:
+            self._decode()
+        return self._pcm
+
+    @property
+    def sr(self):
+        if self._sr is None:
+            self._decode()
+        return self._sr
+
+    @property
+    def duration(self):
+        return len(self.pcm) / self.sr
+
+    @property
+    def samples(self):
+        """Mono float64 in int16 units (channel mean) — the gates' wave-based signal."""
+        def _mono():
+            import numpy as np
+            x = self.pcm.astype(np.float64)
+            return x[:, 0] if x.shape[1] == 1 else x.mean(axis=1)
+        return self._memoised('samples', _mono)
+
+    @property
+    def y22(self):
+        """Mono float32 at QA_ANALYSIS_SR — what librosa.load(path, sr=22050) returns."""
+        def _resample():
+            import librosa
+            import numpy as np
+            y = (self.pcm.astype(np.float32) / 32768.0).mean(axis=1)
+            if self.sr == QA_ANALYSIS_SR:
+                return y
+            return librosa.resample(y, orig_sr=self.sr, target_sr=QA_ANALYSIS_SR)
+        return self._memoised('y22', _resample)
+
+    def highpass(self, freq, order=4):
+        """Butterworth high-pass of samples (stored float32 to halve the footprint)."""
+        def _filter():
+            import numpy as np
+            from scipy.signal import butter, sosfilt
+            sos = butter(order, freq, btype='high', fs=self.sr, output='sos')
+            return sosfilt(sos, self.samples).astype(np.float32)
+        return self._memoised(('highpass', freq, order), _filter)
+
+    def astats_rms_db(self, start_sec, dur_sec, sos=None):
+        """Overall RMS level in dBFS, as `ffmpeg -i <file> -ss <start> -t <dur>
+        -af [<filter>,]astats=reset=0` reports it.
+
+        After -i, -ss/-t are output options: the trim runs after the filter
+        graph, so astats sees the file from the top through start+dur, not
+        just the window (ffmpeg overruns by a few demuxer packets, ~0.1 s).
+        The MASTER_* thresholds were calibrated on this measure. `sos` is an
+        IIR filter (ffmpeg_*_sos) run over each channel first. Digital
+        silence reads -100, as the astats parser treated '-inf'. Checked
+        against ffmpeg 7.0.2: within 0.1 dB, the residue being the overrun.
+        """
+        import numpy as np
+        from scipy.signal import sosfilt
+        pcm = self.pcm[:max(0, int((start_sec + dur_sec) * self.sr))]
+        if pcm.size == 0:
+            return 0.0
+        # In blocks (filter state carried across) so an hour-long prefix
+        # never becomes one float64 copy
+        zi = np.zeros((len(sos), 2, pcm.shape[1])) if sos is not None else None
+        sumsq = 0.0
+        block = self.sr * 60
+        for i in range(0, len(pcm), block):
+            x = pcm[i:i + block].astype(np.float64)
+            if zi is not None:
+                x, zi = sosfilt(sos, x, axis=0, zi=zi)
+                # ffmpeg's biquads write s16 output truncated toward zero
+                x = np.clip(np.trunc(x), -32768, 32767)
+            sumsq += float(np.einsum('ij,ij->', x, x))
+        rms = float(np.sqrt(sumsq / pcm.size))
+        return float(20 * np.log10(rms / 32768)) if rms > 0 else -100.0
+
+    @staticmethod
+    def ffmpeg_highpass_sos(freq, sr):
+        """ffmpeg `highpass=f=freq` (2-pole Butterworth)."""
+        from scipy.signal import butter
+        return butter(2, freq, btype='high', fs=sr, output='sos')
+
+    @staticmethod
+    def ffmpeg_bandpass_sos(center, width, sr):
+        """ffmpeg `bandpass=f=center:w=width` (RBJ biquad, 0 dB peak gain).
+
+        bandpass's default width_type is a Q factor, so the gates' `w=<Hz>`
+        strings have always meant very narrow bands — reproduced as-is.
+        """
+        import numpy as np
+        w0 = 2 * np.pi * center / sr
+        alpha = np.sin(w0) / (2 * width)
+        a0 = 1 + alpha
+        return np.array([[alpha / a0, 0.0, -alpha / a0,
+                          1.0, -2 * np.cos(w0) / a0, (1 - alpha) / a0]])
+
+    def window_power(self, win_samples, hop_samples, highpass=None):
+        """(window start times, mean square) over sliding windows of samples.
+
+        Windows start at range(0, len - win, hop), as the gates' loops did;
+        highpass=<Hz> measures the highpass() band instead. Memoised, so
+        gates using the same window share one pass.
+        """
+        def _power():
+            import numpy as np
+            x = self.samples if highpass is None else self.highpass(highpass)
+            ms = windowed_mean_square(x, win_samples, hop_samples)
+            return np.arange(len(ms)) * hop_samples / self.sr, ms
+        return self._memoised(('window_power', win_samples, hop_samples, highpass), _power)
+
+    def rms_envelope(self):
+        """Per-second RMS in dBFS (non-overlapping 1 s windows, -100 for silence)."""
+        return self._memoised(
+            'rms_envelope', lambda: power_to_rms_db(self.window_power(self.sr, self.sr)[1]))
+
+    def power_spectrogram(self):
+        """|STFT|² of y22 (librosa defaults: n_fft=2048, hop 512)."""
+        def _power():
+            import librosa
+            import numpy as np
+            return np.abs(librosa.stft(self.y22)) ** 2
+        return self._memoised('power', _power)
+
+    def mel_spectrogram(self, n_mels=128, fmax=None):
+        def _mel():
+            import librosa
+            return librosa.feature.melspectrogram(
+                S=self.power_spectrogram(), sr=QA_ANALYSIS_SR, n_mels=n_mels, fmax=fmax)
+        return self._memoised(('mel', n_mels, fmax), _mel)
+
+    def mfcc(self, n_mfcc=13):
+        """Whole-file MFCC matrix — librosa.feature.mfcc(y=y22, sr=22050)."""
+        def _mfcc():
+            import librosa
+            return librosa.feature.mfcc(
+                S=librosa.power_to_db(self.mel_spectrogram()), sr=QA_ANALYSIS_SR, n_mfcc=n_mfcc)
+        return self._memoised(('mfcc', n_mfcc), _mfcc)
+
+
+class QAContext:
+    """Shared decodes for one QA run: raw, pre-cleanup, final and master audio.
+
+    ctx.audio(path) returns the same QAAudio for every gate that reads that
+    file, re-decoding if the file's mtime/size changed since. invalidate(path)
+    drops a decode explicitly (Gate 2's patch loop rewrites files in place).
+    """
+
+    def __init__(self):
+        self._audio = {}
+
+    def audio(self, path):
+        key = os.path.abspath(str(path))
+        st = os.stat(key)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._audio.get(key)
+        if cached is None or cached[0] != stamp:
+            cached = self._audio[key] = (stamp, QAAudio(path))
+        return cached[1]
+
+    def invalidate(self, *paths):
+        for path in paths:
+            if path:
+                self._audio.pop(os.path.abspath(str(path)), None)
+
+
+def windowed_mean_square(x, win, hop):
+    """Mean of x² over [s, s+win) for every s in range(0, len(x) - win, hop).
+
+    One np.add.reduceat per block of windows replaces the gates' per-window
+    np.mean(chunk**2); blocks keep the squared copy to a few MB however long
+    the session is.
+    """
+    import numpy as np
+    starts = np.arange(0, max(len(x) - win, 0), hop)
+    out = np.empty(len(starts))
+    per = max(1, (1 << 20) // max(hop, 1))
+    for i in range(0, len(starts), per):
+        s = starts[i:i + per]
+        seg = np.square(x[s[0]:s[-1] + win], dtype=np.float64)
+        # [start0, end0, start1, end1, ...]; the last end is the slice end
+        idx = np.empty(2 * len(s) - 1, dtype=np.intp)
+        idx[0::2] = s - s[0]
+        idx[1::2] = s[:-1] - s[0] + win
+        out[i:i + len(s)] = np.add.reduceat(seg, idx)[0::2] / win
+    return out
+
+
+def power_to_rms_db(ms):
+    """Mean square (int16 units) → RMS dBFS, -100 for digital silence."""
+    import numpy as np
+    rms = np.sqrt(ms)
+    with np.errstate(divide='ignore'):
+        db = 20 * np.log10(rms / 32768)
+    return np.where(rms > 0, db, -100.0)
+
+
+class SegmentIntervals:
+    """Time ranges of one manifest segment type, indexed for array queries.
+
+    Ranges are kept sorted by start with a running maximum of their ends,
+    so membership and overlap for every analysis window come from
+    searchsorted rather than a scan of the whole manifest per window.
+    margin(duration) widens each range by that many seconds on both sides.
+    """
+
+    def __init__(self, manifest_data, seg_type, margin=None):
+        import numpy as np
+        ranges = []
+        for seg in manifest_data.get('segments', []):
+            if seg['type'] != seg_type:
+                continue
+            start, end = seg['start_time'], seg['start_time'] + seg['duration']
+            if margin is not None:
+                m = margin(seg['duration'])
+                start, end = start - m, end + m
+            ranges.append((start, end))
+        ranges.sort(key=lambda r: r[0])
+        self.starts = np.array([r[0] for r in ranges], dtype=np.float64)
+        self.ends = np.array([r[1] for r in ranges], dtype=np.float64)
+        self._reach = np.maximum.accumulate(self.ends) if ranges else self.ends
+
+    def contains(self, times, closed=True):
+        """Bool mask: start <= t <= end (t < end if not closed) for some range."""
+        import numpy as np
+        times = np.asarray(times, dtype=np.float64)
+        idx = np.searchsorted(self.starts, times, side='right') - 1
+        inside = idx >= 0
+        reach = self._reach[idx[inside]]
+        t = times[inside]
+        inside[inside] = (t <= reach) if closed else (t < reach)
+        return inside
+
+    def overlap(self, win_starts, win_ends):
+        """Seconds of each window [a, b] covered by the ranges (summed per range)."""
+        import numpy as np
+        a = np.asarray(win_starts, dtype=np.float64)
+        b = np.asarray(win_ends, dtype=np.float64)
+        total = np.zeros(len(a))
+        # Ranges before lo all end by a; ranges from hi on start at or after b
+        lo = np.searchsorted(self._reach, a, side='right')
+        hi = np.searchsorted(self.starts, b, side='left')
+        span = int((hi - lo).max()) if len(a) else 0
+        for k in range(span):
+            j = lo + k
+            m = j < hi
+            jj = j[m]
+            ov = np.minimum(b[m], self.ends[jj]) - np.maximum(a[m], self.starts[jj])
+            total[m] += np.where(ov > 0, ov, 0.0)
+        return total
+
+
+def _qa_audio(path, ctx=None):
+    """QAAudio for a gate — shared through ctx when the caller has one."""
+    return ctx.audio(path) if ctx is not None else QAAudio(path)
+
+
+
+def _file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def speech_spans(manifest_data, pad=ASR_SPEECH_PAD_SEC):
+    """Manifest text segments as padded, merged [start, end] spans."""
+    spans = []
+    for start, end in sorted((seg['start_time'] - pad, seg['start_time'] + seg['duration'] + pad)
+                             for seg in manifest_data.get('segments', []) if seg['type'] == 'text'):
+        start = max(0.0, start)
+        if spans and start <= spans[-1][1]:
+            spans[-1][1] = max(spans[-1][1], end)
+        else:
+            spans.append([start, end])
+    return spans
+
+
+def write_speech_only_wav(audio, spans, dest, gap=ASR_SPAN_GAP_SEC):
+    """Concatenate the spans of a QAAudio (mono) with `gap` s of silence between.
+
+    Returns [(session_start, session_end, compact_start), ...] for remapping
+    timestamps from the compact file back onto the session timeline. Spans
+    past the end of the audio are cut short or dropped.
+    """
+    import wave as _wave
+    import numpy as np
+    sr = audio.sr
+    x = audio.samples
+    silence = np.zeros(int(gap * sr), dtype=np.int16)
+    table = []
+    pos = 0
+    with _wave.open(str(dest), 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sr)
+        for start, end in spans:
+            a, b = int(start * sr), min(int(end * sr), len(x))
+            if b <= a:
+                continue
+            if table:
+                w.writeframes(silence.tobytes())
+                pos += len(silence)
+            w.writeframes(np.clip(np.round(x[a:b]), -32768, 32767).astype(np.int16).tobytes())
+            table.append((a / sr, b / sr, pos / sr))
+            pos += b - a
+    return table
+
+
+def remap_time(t, table):
+    """Compact-file time → session time (times in an inserted gap clamp to the span end)."""
+    import bisect
+    i = max(0, bisect.bisect_right([row[2] for row in table], t) - 1)
+    start, end, compact_start = table[i]
+    return min(start + max(t - compact_start, 0.0), end)
+
+
+class Transcriber:
+    """Whisper transcripts for the QA gates: one transcription per audio content.
+
+    transcribe() runs with English and word timestamps (the superset of what
+    Gates 8 and 10 each used to ask for) through asr_client — the warm
+    asr-server.py if it is running, else a model loaded once per process —
+    and stores the result as JSON in TRANSCRIPT_CACHE_DIR beside the audio,
+    named by content hash, so the second gate — or a re-run of QA on an
+    unchanged build — reads it back without touching Whisper at all.
+
+    Given the build manifest, only its text spans are transcribed: they are
+    cut out (padded by ASR_SPEECH_PAD_SEC), joined with short gaps into one
+    speech-only file, and the timestamps mapped back onto the session. A
+    meditation master is 40–60% silence, so ASR time follows spoken content.
+    """
+
+    def __init__(self, model_name=QA_WHISPER_MODEL):
+        self.model_name = model_name
+        self._memo = {}
+
+    def transcribe(self, audio_path, manifest_data=None, ctx=None):
+        """{'text', 'language', 'segments': [{start, end, text, words: [...]}]}"""
+        digest = _file_sha256(audio_path)
+        spans = speech_spans(manifest_data) if manifest_data else []
+        name = f"{digest[:24]}-{self.model_name}"
+        if spans:
+            name += '-' + hashlib.sha256(json.dumps(spans).encode()).hexdigest()[:12]
+        if name in self._memo:
+            return self._memo[name]
+        cache_dir = Path(audio_path).parent / TRANSCRIPT_CACHE_DIR
+        cached = cache_dir / f"{name}.json"
+        if cached.exists():
+            transcript = json.loads(cached.read_text())
+            print(f"  QA-WHISPER: Using cached transcript ({cached.name})")
+        else:
+            transcript = self._run(audio_path, _qa_audio(audio_path, ctx), spans)
+            transcript['audio_sha256'] = digest
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = cached.with_name(f"{cached.name}.{os.getpid()}.part")
+            tmp.write_text(json.dumps(transcript))
+            os.replace(tmp, cached)
+        self._memo[name] = transcript
+        return transcript
+
+    def _run(self, audio_path, audio, spans):
+        table = None
+        with tempfile.TemporaryDirectory(prefix='qa-asr-') as tmp:
+            asr_input = audio_path
+            if spans:
+                asr_input = Path(tmp) / 'speech-only.wav'
+                table = write_speech_only_wav(audio, spans, asr_input)
+                speech_sec = sum(end - start for start, end, _ in table)
+                print(f"  QA-WHISPER: Transcribing {speech_sec:.0f}s of speech "
+                      f"({len(table)} spans) of {audio.duration:.0f}s")
+            result = asr_client.transcribe([asr_input], self.model_name,
+                                           language="en", word_timestamps=True)[0]
+
+        def remap(t):
+            return remap_time(t, table) if table else t
+
+        return {
+            'model': self.model_name,
+            'language': result.get('language'),
+            'text': result.get('text', ''),
+            'spans': spans,
+            'segments': [{
+                'start': remap(seg['start']),
+                'end': remap(seg['end']),
+                'text': seg['text'],
+                'words': [{'word': w['word'], 'start': remap(w['start']), 'end': remap(w['end']),
+                           'probability': w.get('probability')}
+                          for w in seg.get('words', [])],
+            } for seg in result.get('segments', [])],
+        }
+
+
+_default_transcriber = None
+
+
+def default_transcriber():
+    """Process-wide Transcriber (Whisper is only reached on a cache miss)."""
+    global _default_transcriber
+    if _default_transcriber is None:
+        _default_transcriber = Transcriber()
+    return _default_transcriber
+
+
+def measure_noise_floor(audio_path, manifest_data, ctx=None):
     """Measure noise floor and HF hiss in silence regions of raw narration.
 
     Returns (noise_floor_db, hf_hiss_db) — RMS levels measured during
@@ -1192,47 +1667,26 @@ def measure_noise_floor(audio_path, manifest_data):
     if measure_dur < 0.3:
         measure_dur = best_dur - 0.4
 
-    # Overall noise floor
-    result = subprocess.run([
-        'ffmpeg', '-i', audio_path,
-        '-ss', str(measure_start), '-t', str(measure_dur),
-        '-af', 'astats=reset=0',
-        '-f', 'null', '-'
-    ], capture_output=True, text=True)
-    noise_db = _parse_rms_from_astats(result.stderr)
-
-    # HF hiss (>6kHz)
-    result_hf = subprocess.run([
-        'ffmpeg', '-i', audio_path,
-        '-ss', str(measure_start), '-t', str(measure_dur),
-        '-af', 'highpass=f=6000,astats=reset=0',
-        '-f', 'null', '-'
-    ], capture_output=True, text=True)
-    hf_db = _parse_rms_from_astats(result_hf.stderr)
+    audio = _qa_audio(audio_path, ctx)
 
-    return noise_db, hf_db
+    # Overall noise floor (the astats measure — see QAAudio.astats_rms_db)
+    noise_db = audio.astats_rms_db(measure_start, measure_dur)
 
+    # HF hiss (>6kHz) — same 2-pole high-pass the ffmpeg astats pass used
+    hf_db = audio.astats_rms_db(measure_start, measure_dur,
+                                QAAudio.ffmpeg_highpass_sos(6000, audio.sr))
 
-def _parse_rms_from_astats(stderr_text):
-    """Extract RMS level dB from ffmpeg astats output."""
-    import re
-    matches = re.findall(r'RMS level dB:\s*([-\d.]+)', stderr_text)
-    if matches:
-        try:
-            return float(matches[-1])
-        except ValueError:
-            return -100.0  # Treat unparseable (e.g. '-inf', '-') as silent
-    return 0.0
+    return noise_db, hf_db
 
 
-def qa_quality_check(raw_narration_path, manifest_data):
+def qa_quality_check(raw_narration_path, manifest_data, ctx=None):
     """PRIMARY QA GATE 1: Quality benchmark check against master.
 
     Measures noise floor and HF hiss, compares against master thresholds.
     Returns (passed, details_dict).
     """
     print(f"\n  QA-QUALITY: Measuring audio quality...")
-    noise_db, hf_db = measure_noise_floor(raw_narration_path, manifest_data)
+    noise_db, hf_db = measure_noise_floor(raw_narration_path, manifest_data, ctx=ctx)
 
     print(f"  QA-QUALITY: Noise floor = {noise_db:.1f} dB (threshold: {MASTER_NOISE_FLOOR_DB})")
     print(f"  QA-QUALITY: HF hiss     = {hf_db:.1f} dB (threshold: {MASTER_HF_HISS_DB})")
@@ -1258,7 +1712,7 @@ def qa_quality_check(raw_narration_path, manifest_data):
     return passed, details
 
 
-def qa_independent_check(raw_narration_path, manifest_data):
+def qa_independent_check(raw_narration_path, manifest_data, ctx=None):
     """SECONDARY QA GATE 2: Independent spectral quality verification.
 
     Completely independent from primary QA. Compares frequency profile of
@@ -1271,7 +1725,7 @@ def qa_independent_check(raw_narration_path, manifest_data):
         print(f"  QA-INDEPENDENT: WARNING — master reference WAV not found at {MASTER_REF_WAV}")
         print(f"  QA-INDEPENDENT: Falling back to absolute thresholds only")
         # Fall back to stricter absolute thresholds
-        noise_db, hf_db = measure_noise_floor(raw_narration_path, manifest_data)
+        noise_db, hf_db = measure_noise_floor(raw_narration_path, manifest_data, ctx=ctx)
         passed = noise_db <= MASTER_NOISE_FLOOR_DB and hf_db <= MASTER_HF_HISS_DB
         if passed:
             print(f"  QA-INDEPENDENT: PASSED (absolute thresholds)")
@@ -1281,10 +1735,12 @@ def qa_independent_check(raw_narration_path, manifest_data):
 
     # Measure master reference
     master_manifest = {'segments': [{'type': 'silence', 'start_time': 3.0, 'duration': 3.0}]}
-    master_noise, master_hf = measure_noise_floor(str(MASTER_REF_WAV), master_manifest)
+    master_noise, master_hf = measure_noise_floor(str(MASTER_REF_WAV), master_manifest, ctx=ctx)
 
     # Measure build
-    build_noise, build_hf = measure_noise_floor(raw_narration_path, manifest_data)
+    build_noise, build_hf = measure_noise_floor(raw_narration_path, manifest_data, ctx=ctx)
+    build_audio = _qa_audio(raw_narration_path, ctx)
+    master_audio = _qa_audio(MASTER_REF_WAV, ctx)
 
     # Spectral energy comparison: measure energy in 3 bands
     bands = [
@@ -1307,23 +1763,17 @@ def qa_independent_check(raw_narration_path, manifest_data):
         speech_dur = min(speech_seg.get('duration', 5) - 2, 5.0)
 
         for band_name, low, high in bands:
+            center = int((int(low) + int(high)) // 2)
+            width = int(high) - int(low)
             # Build
-            r = subprocess.run([
-                'ffmpeg', '-i', raw_narration_path,
-                '-ss', str(speech_start), '-t', str(speech_dur),
-                '-af', f'bandpass=f={int((int(low)+int(high))//2)}:w={int(high)-int(low)},astats=reset=0',
-                '-f', 'null', '-'
-            ], capture_output=True, text=True)
-            build_bands[band_name] = _parse_rms_from_astats(r.stderr)
+            build_bands[band_name] = build_audio.astats_rms_db(
+                speech_start, speech_dur,
+                QAAudio.ffmpeg_bandpass_sos(center, width, build_audio.sr))
 
             # Master (use first 5s of speech — starts around 0s)
-            r2 = subprocess.run([
-                'ffmpeg', '-i', str(MASTER_REF_WAV),
-                '-ss', '1.0', '-t', str(speech_dur),
-                '-af', f'bandpass=f={int((int(low)+int(high))//2)}:w={int(high)-int(low)},astats=reset=0',
-                '-f', 'null', '-'
-            ], capture_output=True, text=True)
-            master_bands[band_name] = _parse_rms_from_astats(r2.stderr)
+            master_bands[band_name] = master_audio.astats_rms_db(
+                1.0, speech_dur,
+                QAAudio.ffmpeg_bandpass_sos(center, width, master_audio.sr))
 
         print(f"  QA-INDEPENDENT: Spectral comparison (build vs master):")
         for band_name in ['low', 'mid', 'high']:
@@ -1350,21 +1800,9 @@ def qa_independent_check(raw_narration_path, manifest_data):
     import numpy as np
     sliding_window_flags = []
     try:
-        import wave as _wave
-        w = _wave.open(raw_narration_path, 'r')
-        n_frames = w.getnframes()
-        sr_wav = w.getframerate()
-        nch = w.getnchannels()
-        raw_data = w.readframes(n_frames)
-        w.close()
-
-        audio_samples = np.frombuffer(raw_data, dtype=np.int16).astype(np.float64)
-        if nch > 1:
-            audio_samples = audio_samples.reshape(-1, nch).mean(axis=1)
-
-        from scipy.signal import butter, sosfilt
-        sos_hf3 = butter(4, 6000, btype='high', fs=sr_wav, output='sos')
-        hf3 = sosfilt(sos_hf3, audio_samples)
+        audio_samples = build_audio.samples
+        sr_wav = build_audio.sr
+        hf3 = build_audio.highpass(6000)
 
         sw_sec = 2.0
         sw_samples = int(sw_sec * sr_wav)
@@ -1428,7 +1866,7 @@ def qa_independent_check(raw_narration_path, manifest_data):
     return passed, details
 
 
-def qa_master_voice_check(raw_narration_path):
+def qa_master_voice_check(raw_narration_path, ctx=None):
     """QA GATE 4: Master voice comparison — MFCC cosine + F0 deviation.
 
     Compares the raw narration against the Marco master reference WAV.
@@ -1464,9 +1902,9 @@ def qa_master_voice_check(raw_narration_path):
 
     # Extract MFCC from build
     print(f"  QA-VOICE: Extracting MFCC from build...")
-    y_build, sr_build = librosa.load(raw_narration_path, sr=22050)
-    mfcc_build = librosa.feature.mfcc(y=y_build, sr=sr_build, n_mfcc=13)
-    build_mfcc = mfcc_build.mean(axis=1)
+    build_audio = _qa_audio(raw_narration_path, ctx)
+    y_build, sr_build = build_audio.y22, QA_ANALYSIS_SR
+    build_mfcc = build_audio.mfcc(13).mean(axis=1)
 
     # MFCC cosine distance
     dot = np.dot(master_mfcc, build_mfcc)
@@ -1513,54 +1951,22 @@ def qa_master_voice_check(raw_narration_path):
     return passed, details
 
 
-def qa_loudness_consistency_check(audio_path, manifest_data, max_deviation_db=10.0):
+def qa_loudness_consistency_check(audio_path, manifest_data, max_deviation_db=10.0, ctx=None):
     """QA GATE 5: Per-second loudness consistency check.
 
-    Loads the entire WAV into memory and computes RMS per second.
+    Reads the shared per-second RMS envelope of the decoded audio.
     Flags any speech second where RMS deviates more than max_deviation_db
     from the median speech RMS. Fast (< 2s for 14 min file).
 
     Catches per-chunk loudness surges that a single loudnorm pass can't fix.
     Returns (passed, details_dict).
     """
-    import wave as _wave
     import numpy as np
 
     print(f"\n  QA-LOUDNESS: Scanning for per-segment loudness spikes...")
 
-    # Load WAV into memory
-    try:
-        w = _wave.open(audio_path, 'r')
-    except Exception:
-        # Try converting to WAV first (handles MP3 input)
-        tmp_wav = audio_path + ".loudness_check.wav"
-        subprocess.run([
-            'ffmpeg', '-y', '-i', audio_path,
-            '-c:a', 'pcm_s16le', '-ar', str(SAMPLE_RATE),
-            tmp_wav
-        ], capture_output=True, check=True)
-        w = _wave.open(tmp_wav, 'r')
-
-    n = w.getnframes()
-    sr = w.getframerate()
-    nch = w.getnchannels()
-    raw = w.readframes(n)
-    w.close()
-
-    samples = np.frombuffer(raw, dtype=np.int16).astype(np.float64)
-    if nch > 1:
-        samples = samples.reshape(-1, nch).mean(axis=1)
-
-    # Compute RMS per second
-    window = sr
-    rms_db = []
-    for i in range(0, len(samples) - window, window):
-        chunk = samples[i:i+window]
-        rms = np.sqrt(np.mean(chunk**2))
-        db = 20 * np.log10(rms / 32768) if rms > 0 else -100
-        rms_db.append(db)
-
-    rms_db = np.array(rms_db)
+    # RMS per second (MP3 input is decoded by QAAudio)
+    rms_db = _qa_audio(audio_path, ctx).rms_envelope()
 
     # Speech regions: > -40 dB RMS (silence is typically < -50 dB)
     speech_mask = rms_db > -40
@@ -1574,16 +1980,14 @@ def qa_loudness_consistency_check(audio_path, manifest_data, max_deviation_db=10
 
     # Find spikes
     spikes = []
-    for i, db in enumerate(rms_db):
-        if speech_mask[i] and (db - median_rms) > max_deviation_db:
-            mins = i // 60
-            secs = i % 60
-            spikes.append({
-                'time': i,
-                'time_fmt': f'{mins}:{secs:02d}',
-                'rms_db': round(float(db), 1),
-                'deviation_db': round(float(db - median_rms), 1),
-            })
+    for i in np.flatnonzero(speech_mask & ((rms_db - median_rms) > max_deviation_db)).tolist():
+        db = rms_db[i]
+        spikes.append({
+            'time': i,
+            'time_fmt': f'{i // 60}:{i % 60:02d}',
+            'rms_db': round(float(db), 1),
+            'deviation_db': round(float(db - median_rms), 1),
+        })
 
     details = {
         'median_rms_db': round(median_rms, 1),
@@ -1609,16 +2013,11 @@ def qa_loudness_consistency_check(audio_path, manifest_data, max_deviation_db=10
     else:
         print(f"  QA-LOUDNESS: PASSED — all speech within +{max_deviation_db} dB of median")
 
-    # Cleanup temp file if created
-    tmp_wav = audio_path + ".loudness_check.wav"
-    if os.path.exists(tmp_wav):
-        os.remove(tmp_wav)
-
     return passed, details
 
 
 def qa_hf_hiss_check(audio_path, manifest_data, hp_freq=4000, window_sec=1.0,
-                     overlap_sec=0.5, ratio_threshold_db=6.0, min_duration_sec=3.0):
+                     overlap_sec=0.5, ratio_threshold_db=6.0, min_duration_sec=3.0, ctx=None):
     """QA GATE 6: High-frequency hiss detector (speech-aware, non-speech regions only).
 
     Evaluates HF energy ratio ONLY in non-speech regions (silence, pauses, transitions).
@@ -1630,77 +2029,25 @@ def qa_hf_hiss_check(audio_path, manifest_data, hp_freq=4000, window_sec=1.0,
 
     Returns (passed, details_dict).
     """
-    import wave as _wave
     import numpy as np
-    from scipy.signal import butter, sosfilt
 
     print(f"\n  QA-HF-HISS: Scanning for localised high-frequency hiss (non-speech regions)...")
 
-    # Build speech region lookup from manifest
-    speech_ranges = []
-    for seg in manifest_data.get('segments', []):
-        if seg['type'] == 'text':
-            seg_start = seg['start_time']
-            seg_end = seg_start + seg['duration']
-            speech_ranges.append((seg_start, seg_end))
-
-    def is_speech(win_start, win_end):
-        """Check if >50% of window overlaps with any speech region."""
-        win_dur = win_end - win_start
-        overlap = 0.0
-        for s_start, s_end in speech_ranges:
-            ov_start = max(win_start, s_start)
-            ov_end = min(win_end, s_end)
-            if ov_end > ov_start:
-                overlap += ov_end - ov_start
-        return overlap > (win_dur * 0.5)
-
-    # Load WAV
-    w = _wave.open(audio_path, 'r')
-    n = w.getnframes()
-    sr = w.getframerate()
-    nch = w.getnchannels()
-    raw = w.readframes(n)
-    w.close()
+    audio = _qa_audio(audio_path, ctx)
+    sr = audio.sr
 
-    samples = np.frombuffer(raw, dtype=np.int16).astype(np.float64)
-    if nch > 1:
-        samples = samples.reshape(-1, nch).mean(axis=1)
-
-    # Highpass filter at hp_freq Hz to isolate hiss band
-    sos = butter(4, hp_freq, btype='high', fs=sr, output='sos')
-    hf_signal = sosfilt(sos, samples)
-
-    # Sliding window: compute both total RMS and HF RMS
+    # Sliding window: total RMS and HF RMS (highpass at hp_freq isolates the hiss band)
     win_samples = int(window_sec * sr)
     hop_samples = int((window_sec - overlap_sec) * sr)
-    total_rms_db = []
-    hf_ratio_db = []
-    window_times = []
-    nonspeech_mask = []
-
-    for start in range(0, len(samples) - win_samples, hop_samples):
-        total_chunk = samples[start:start + win_samples]
-        hf_chunk = hf_signal[start:start + win_samples]
-
-        total_rms = np.sqrt(np.mean(total_chunk**2))
-        hf_rms = np.sqrt(np.mean(hf_chunk**2))
-
-        t_db = 20 * np.log10(total_rms / 32768) if total_rms > 0 else -100
-        h_db = 20 * np.log10(hf_rms / 32768) if hf_rms > 0 else -100
+    window_times, total_ms = audio.window_power(win_samples, hop_samples)
+    _, hf_ms = audio.window_power(win_samples, hop_samples, highpass=hp_freq)
+    total_rms_db = power_to_rms_db(total_ms)
+    hf_ratio_db = power_to_rms_db(hf_ms) - total_rms_db
 
-        win_start_time = start / sr
-        win_end_time = win_start_time + window_sec
-
-        total_rms_db.append(t_db)
-        hf_ratio_db.append(h_db - t_db)
-        window_times.append(win_start_time)
-        nonspeech_mask.append(not is_speech(win_start_time, win_end_time))
-
-    total_rms_db = np.array(total_rms_db)
-    hf_ratio_db = np.array(hf_ratio_db)
-    window_times = np.array(window_times)
-    nonspeech_mask = np.array(nonspeech_mask)
+    # Non-speech = at most 50% of the window overlaps manifest speech
+    win_ends = window_times + window_sec
+    speech_overlap = SegmentIntervals(manifest_data, 'text').overlap(window_times, win_ends)
+    nonspeech_mask = ~(speech_overlap > (win_ends - window_times) * 0.5)
 
     # Only evaluate non-speech windows with some energy (not pure digital silence)
     eval_mask = nonspeech_mask & (total_rms_db > -60)
@@ -1715,51 +2062,25 @@ def qa_hf_hiss_check(audio_path, manifest_data, hp_freq=4000, window_sec=1.0,
 
     median_ratio = float(np.median(hf_ratio_db[eval_mask]))
 
-    # Flag non-speech windows where HF ratio exceeds median by threshold
-    spike_mask = np.zeros(len(hf_ratio_db), dtype=bool)
-    for i in range(len(hf_ratio_db)):
-        if eval_mask[i] and (hf_ratio_db[i] - median_ratio) > ratio_threshold_db:
-            spike_mask[i] = True
-
-    # Group consecutive flagged windows into regions
+    # Flag non-speech windows where HF ratio exceeds median by threshold,
+    # then group consecutive flagged windows into regions
+    spike_mask = eval_mask & ((hf_ratio_db - median_ratio) > ratio_threshold_db)
+    edges = np.diff(np.concatenate(([0], spike_mask.astype(np.int8), [0])))
     flagged_regions = []
-    in_region = False
-    region_start = 0
-
-    for i, is_spike in enumerate(spike_mask):
-        if is_spike and not in_region:
-            in_region = True
-            region_start = i
-        elif not is_spike and in_region:
-            in_region = False
-            region_end = i
-            region_start_time = window_times[region_start]
-            region_end_time = window_times[min(region_end, len(window_times) - 1)] + window_sec
-            duration = region_end_time - region_start_time
-            if duration >= min_duration_sec:
-                max_ratio = float(np.max(hf_ratio_db[region_start:region_end]))
-                flagged_regions.append({
-                    'start': round(region_start_time, 1),
-                    'end': round(region_end_time, 1),
-                    'duration': round(duration, 1),
-                    'max_hf_ratio_db': round(max_ratio, 1),
-                    'deviation_db': round(max_ratio - median_ratio, 1),
-                    'start_fmt': f'{int(region_start_time//60)}:{region_start_time%60:04.1f}',
-                    'end_fmt': f'{int(region_end_time//60)}:{region_end_time%60:04.1f}',
-                })
-
-    if in_region:
-        region_end_time = window_times[-1] + window_sec
-        duration = region_end_time - window_times[region_start]
+    for region_start, region_end in zip(np.flatnonzero(edges == 1).tolist(),
+                                        np.flatnonzero(edges == -1).tolist()):
+        region_start_time = window_times[region_start]
+        region_end_time = window_times[min(region_end, len(window_times) - 1)] + window_sec
+        duration = region_end_time - region_start_time
         if duration >= min_duration_sec:
-            max_ratio = float(np.max(hf_ratio_db[region_start:]))
+            max_ratio = float(np.max(hf_ratio_db[region_start:region_end]))
             flagged_regions.append({
-                'start': round(window_times[region_start], 1),
+                'start': round(region_start_time, 1),
                 'end': round(region_end_time, 1),
                 'duration': round(duration, 1),
                 'max_hf_ratio_db': round(max_ratio, 1),
                 'deviation_db': round(max_ratio - median_ratio, 1),
-                'start_fmt': f'{int(window_times[region_start]//60)}:{window_times[region_start]%60:04.1f}',
+                'start_fmt': f'{int(region_start_time//60)}:{region_start_time%60:04.1f}',
                 'end_fmt': f'{int(region_end_time//60)}:{region_end_time%60:04.1f}',
             })
 
@@ -1786,7 +2107,8 @@ def qa_hf_hiss_check(audio_path, manifest_data, hp_freq=4000, window_sec=1.0,
 
 
 def qa_volume_surge_check(audio_path, manifest_data, window_sec=1.0, overlap_sec=0.5,
-                          surge_threshold_db=9.0, drop_threshold_db=14.0, neighbour_radius=3):
+                          surge_threshold_db=9.0, drop_threshold_db=14.0, neighbour_radius=3,
+                          ctx=None):
     """QA GATE 7: Volume surge/drop detector (local-mean comparison).
 
     Compares each window's RMS to the mean of its immediate neighbours.
@@ -1795,87 +2117,52 @@ def qa_volume_surge_check(audio_path, manifest_data, window_sec=1.0, overlap_sec
 
     Returns (passed, details_dict).
     """
-    import wave as _wave
     import numpy as np
 
     print(f"\n  QA-SURGE: Scanning for volume surges and drops...")
 
-    # Load WAV
-    w = _wave.open(audio_path, 'r')
-    n = w.getnframes()
-    sr = w.getframerate()
-    nch = w.getnchannels()
-    raw = w.readframes(n)
-    w.close()
-
-    samples = np.frombuffer(raw, dtype=np.int16).astype(np.float64)
-    if nch > 1:
-        samples = samples.reshape(-1, nch).mean(axis=1)
+    audio = _qa_audio(audio_path, ctx)
+    sr = audio.sr
 
     # Sliding window RMS
     win_samples = int(window_sec * sr)
     hop_samples = int((window_sec - overlap_sec) * sr)
-    rms_db = []
-    window_times = []
-
-    for start in range(0, len(samples) - win_samples, hop_samples):
-        chunk = samples[start:start + win_samples]
-        rms = np.sqrt(np.mean(chunk**2))
-        db = 20 * np.log10(rms / 32768) if rms > 0 else -100
-        rms_db.append(db)
-        window_times.append(start / sr)
-
-    rms_db = np.array(rms_db)
-    window_times = np.array(window_times)
+    window_times, ms = audio.window_power(win_samples, hop_samples)
+    rms_db = power_to_rms_db(ms)
+
+    # Windows overlapping a silence region are skipped (silence-to-speech
+    # transitions are intentional). The margin scales with silence duration:
+    # short pauses (8s) get 4s, long silences (50s) proportionally more
+    # because the voice ramp-up after extended silence is longer.
+    silence = SegmentIntervals(manifest_data, 'silence', margin=lambda dur: max(4.0, dur * 0.15))
+    near_silence = silence.overlap(window_times, window_times + window_sec) > 0
+
+    # Local mean of neighbours (excluding self), counting only neighbours
+    # that have signal and do not overlap silence regions
+    n = len(rms_db)
+    centre = np.arange(neighbour_radius, n - neighbour_radius)
+    active = (rms_db > -50) & ~near_silence
+    total = np.zeros(len(centre))
+    count = np.zeros(len(centre), dtype=np.int64)
+    for off in [*range(-neighbour_radius, 0), *range(1, neighbour_radius + 1)]:
+        j = centre + off
+        total += np.where(active[j], rms_db[j], 0.0)
+        count += active[j]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        local_means = total / count
+
+    # Skip windows near silence, near-silence windows, and windows whose
+    # local mean is below speech level — neighbours are ambient/transition,
+    # not real speech, so the comparison is meaningless (e.g. session opening)
+    keep = ~near_silence[centre] & ~(rms_db[centre] < -50) & (count >= 2)
+    keep[keep] = ~(local_means[keep] < -28)
 
-    # Build silence region lookup from manifest (with duration for margin scaling)
-    silence_ranges = []
-    for seg in manifest_data['segments']:
-        if seg['type'] == 'silence':
-            silence_ranges.append((seg['start_time'], seg['start_time'] + seg['duration'], seg['duration']))
-
-    def overlaps_silence(t, win=window_sec):
-        """Check if a window overlaps any silence region (margin scales with silence duration).
-
-        Short pauses (8s) get 4s margin. Long silences (50s) get proportionally larger
-        margins because the voice ramp-up after extended silence is longer.
-        """
-        for s_start, s_end, s_dur in silence_ranges:
-            margin = max(4.0, s_dur * 0.15)
-            if t < s_end + margin and t + win > s_start - margin:
-                return True
-        return False
-
-    # Compare each window to local mean of neighbours
     surges = []
     drops = []
-    for i in range(neighbour_radius, len(rms_db) - neighbour_radius):
+    for k in np.flatnonzero(keep).tolist():
+        i = int(centre[k])
         t = window_times[i]
-
-        # Skip windows near silence (transitions are intentional)
-        if overlaps_silence(t):
-            continue
-
-        # Skip near-silence windows
-        if rms_db[i] < -50:
-            continue
-
-        # Local mean of neighbours (excluding self and silence-adjacent)
-        neighbour_indices = list(range(max(0, i - neighbour_radius), i)) + \
-                           list(range(i + 1, min(len(rms_db), i + neighbour_radius + 1)))
-        # Filter: must have signal AND not overlap silence regions
-        active_vals = [rms_db[j] for j in neighbour_indices
-                       if rms_db[j] > -50 and not overlaps_silence(window_times[j])]
-        if len(active_vals) < 2:
-            continue
-
-        local_mean = float(np.mean(active_vals))
-
-        # Skip if local mean is below speech level — neighbours are ambient/transition,
-        # not real speech, so the comparison is meaningless (e.g. session opening)
-        if local_mean < -28:
-            continue
-
+        local_mean = float(local_means[k])
         deviation = rms_db[i] - local_mean
 
         if deviation > surge_threshold_db:
@@ -1943,15 +2230,125 @@ REPETITION_IGNORE_PHRASES = [
 ]
 
 
+REPEAT_INDEX_PATH = Path("content/audio-free/vault/repeat-index.sqlite")
+
+
+class CosineLSH:
+    """Random-hyperplane LSH over unit vectors (approximate cosine neighbours).
+
+    Each of n_tables hashes a vector to the sign pattern of n_bits random
+    projections; query() scores only vectors sharing a bucket in some table.
+    At the Gate 8 threshold (cosine 0.998, ~3.6°) a true neighbour shares a
+    12-bit bucket with p≈0.78 per table, so 8 tables miss it with p<1e-5.
+    """
+
+    def __init__(self, vectors, n_tables=8, n_bits=12, seed=0):
+        import numpy as np
+        self.vectors = _unit_rows(np.asarray(vectors, dtype=np.float64))
+        rng = np.random.default_rng(seed)
+        self.planes = rng.standard_normal((n_tables, self.vectors.shape[1], n_bits))
+        self._weights = 1 << np.arange(n_bits)
+        self.buckets = []
+        for codes in self._codes(self.vectors):
+            table = {}
+            for i, code in enumerate(codes.tolist()):
+                table.setdefault(code, []).append(i)
+            self.buckets.append(table)
+
+    def _codes(self, unit):
+        return [((unit @ planes) > 0) @ self._weights for planes in self.planes]
+
+    def query(self, vectors, threshold):
+        """[(query_row, index_row, cosine)] for every bucket-mate at or above threshold."""
+        import numpy as np
+        unit = _unit_rows(np.asarray(vectors, dtype=np.float64))
+        codes = self._codes(unit)
+        out = []
+        for q in range(len(unit)):
+            cand = set()
+            for table, table_codes in zip(self.buckets, codes):
+                cand.update(table.get(int(table_codes[q]), ()))
+            if not cand:
+                continue
+            cand = np.fromiter(sorted(cand), dtype=np.intp)
+            sims = self.vectors[cand] @ unit[q]
+            out.extend((q, int(i), float(sim)) for i, sim in zip(cand, sims) if sim >= threshold)
+        return out
+
+
+def _unit_rows(m):
+    """Rows scaled to unit length (all-zero rows stay zero → cosine 0)."""
+    import numpy as np
+    norms = np.linalg.norm(m, axis=1, keepdims=True)
+    return np.divide(m, norms, out=np.zeros_like(m), where=norms > 0)
+
+
+class RepeatIndex:
+    """Catalogue-wide store of Gate 8 segment fingerprints (MFCC means).
+
+    Gate 8 with catalogue=True replaces its session's rows and queries every
+    other session through CosineLSH, so near-identical segments anywhere in
+    the catalogue surface without an all-pairs comparison.
+    """
+
+    def __init__(self, db_path=REPEAT_INDEX_PATH):
+        import sqlite3
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), timeout=60)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                session     TEXT NOT NULL,
+                seg_index   INTEGER NOT NULL,
+                start_time  REAL NOT NULL,
+                text        TEXT,
+                vec         BLOB NOT NULL,
+                PRIMARY KEY (session, seg_index)
+            )""")
+        self._conn.commit()
+
+    def replace_session(self, session, rows):
+        """rows: [(seg_index, start_time, text, vector)]"""
+        import numpy as np
+        with self._conn:
+            self._conn.execute("DELETE FROM fingerprints WHERE session = ?", (session,))
+            self._conn.executemany(
+                "INSERT INTO fingerprints VALUES (?, ?, ?, ?, ?)",
+                [(session, int(i), float(t), text, np.asarray(v, dtype=np.float64).tobytes())
+                 for i, t, text, v in rows])
+
+    def matches(self, session, vectors, threshold):
+        """Other sessions' segments within `threshold` cosine of each of `vectors`."""
+        import numpy as np
+        rows = self._conn.execute(
+            "SELECT session, seg_index, start_time, text, vec FROM fingerprints "
+            "WHERE session != ?", (session,)).fetchall()
+        if not rows or len(vectors) == 0:
+            return []
+        lsh = CosineLSH(np.stack([np.frombuffer(r[4], dtype=np.float64) for r in rows]))
+        return [(q, {'session': rows[i][0], 'seg_index': rows[i][1],
+                     'start_time': rows[i][2], 'text': rows[i][3]}, sim)
+                for q, i, sim in lsh.query(vectors, threshold)]
+
+    def close(self):
+        self._conn.close()
+
+
 def qa_repeated_content_check(audio_path, manifest_data, expected_repetitions=None,
-                               mfcc_sim_threshold=0.998, min_gap_sec=5.0, min_word_match=8):
+                               mfcc_sim_threshold=0.998, min_gap_sec=5.0, min_word_match=8,
+                               session_name=None, catalogue=False, ctx=None):
     """QA GATE 8: Repeated content detector (MFCC fingerprint + Whisper STT).
 
-    Approach A: Compare MFCC fingerprints of voiced segments.
+    Approach A: Compare MFCC fingerprints of voiced segments — per-segment
+    means sliced from the whole-file MFCC, all pairs as one matrix product.
     Approach B: Whisper transcript for repeated word sequences.
     Global ignore list + per-script expected_repetitions prevent false positives
     on intentional repetition.
 
+    catalogue=True also files this session's fingerprints in RepeatIndex under
+    session_name and lists near-identical segments in other sessions
+    (details['catalogue_matches'], informational — shared intros are normal).
+
     Returns (passed, details_dict).
     """
     import numpy as np
@@ -1966,53 +2363,46 @@ def qa_repeated_content_check(audio_path, manifest_data, expected_repetitions=No
         print(f"  QA-REPEAT: WARNING — librosa not installed, skipping MFCC check")
         return True, {'skipped': True, 'reason': 'missing_librosa'}
 
-    # Load audio
-    y, sr = librosa.load(audio_path, sr=22050)
+    audio = _qa_audio(audio_path, ctx)
+    n_samples, sr = len(audio.y22), QA_ANALYSIS_SR
 
     # Extract voiced segments from manifest
     text_segments = [s for s in manifest_data['segments'] if s['type'] == 'text' and s.get('duration', 0) > 2]
 
-    # Compute MFCC mean per segment
-    segment_mfccs = []
-    for seg in text_segments:
+    # MFCC mean per segment from the whole-file MFCC: a segment of L samples
+    # spans 1 + L // hop frames from its start frame, as a per-segment MFCC would
+    hop = 512
+    mfcc = audio.mfcc(13)
+    frame_sums = np.concatenate([np.zeros((mfcc.shape[0], 1)), np.cumsum(mfcc, axis=1)], axis=1)
+    seg_index, seg_means = [], []
+    for k, seg in enumerate(text_segments):
         start_sample = int(seg['start_time'] * sr)
-        end_sample = int(seg['end_time'] * sr)
-        if end_sample > len(y):
-            end_sample = len(y)
+        end_sample = min(int(seg['end_time'] * sr), n_samples)
         if end_sample - start_sample < sr:  # Skip < 1s
-            segment_mfccs.append(None)
             continue
-        segment_audio = y[start_sample:end_sample]
-        mfcc = librosa.feature.mfcc(y=segment_audio, sr=sr, n_mfcc=13)
-        segment_mfccs.append(mfcc.mean(axis=1))
+        a = min(int(round(start_sample / hop)), mfcc.shape[1] - 1)
+        b = min(a + 1 + (end_sample - start_sample) // hop, mfcc.shape[1])
+        seg_index.append(k)
+        seg_means.append((frame_sums[:, b] - frame_sums[:, a]) / (b - a))
+    seg_means = np.array(seg_means).reshape(len(seg_index), mfcc.shape[0])
+
+    # Cosine similarity of every pair at once; keep pairs > min_gap_sec apart
+    unit = _unit_rows(seg_means)
+    sims = unit @ unit.T
+    starts = np.array([text_segments[k]['start_time'] for k in seg_index])
+    ends = np.array([text_segments[k]['end_time'] for k in seg_index])
+    gaps = np.abs(starts[None, :] - ends[:, None])
+    pairs = np.triu(np.ones_like(sims, dtype=bool), k=1) & ~(gaps < min_gap_sec) & (sims >= mfcc_sim_threshold)
 
-    # Compare all pairs
     mfcc_duplicates = []
-    for i in range(len(segment_mfccs)):
-        if segment_mfccs[i] is None:
-            continue
-        for j in range(i + 1, len(segment_mfccs)):
-            if segment_mfccs[j] is None:
-                continue
-            # Must be > min_gap_sec apart
-            gap = abs(text_segments[j]['start_time'] - text_segments[i]['end_time'])
-            if gap < min_gap_sec:
-                continue
-
-            # Cosine similarity
-            dot = np.dot(segment_mfccs[i], segment_mfccs[j])
-            norm_i = np.linalg.norm(segment_mfccs[i])
-            norm_j = np.linalg.norm(segment_mfccs[j])
-            sim = dot / (norm_i * norm_j) if (norm_i * norm_j) > 0 else 0
-
-            if sim >= mfcc_sim_threshold:
-                mfcc_duplicates.append({
-                    'seg_a': i,
-                    'seg_b': j,
-                    'time_a': text_segments[i]['start_time'],
-                    'time_b': text_segments[j]['start_time'],
-                    'similarity': round(float(sim), 4),
-                })
+    for i, j in zip(*np.nonzero(pairs)):
+        mfcc_duplicates.append({
+            'seg_a': seg_index[i],
+            'seg_b': seg_index[j],
+            'time_a': text_segments[seg_index[i]]['start_time'],
+            'time_b': text_segments[seg_index[j]]['start_time'],
+            'similarity': round(float(sims[i, j]), 4),
+        })
 
     if mfcc_duplicates:
         print(f"  QA-REPEAT: [A] Found {len(mfcc_duplicates)} MFCC-similar segment pairs")
@@ -2020,13 +2410,11 @@ def qa_repeated_content_check(audio_path, manifest_data, expected_repetitions=No
         print(f"  QA-REPEAT: [A] No MFCC duplicates found")
 
     # ── Approach B: Whisper STT ──
-    print(f"  QA-REPEAT: [B] Running Whisper transcription...")
+    print(f"  QA-REPEAT: [B] Whisper transcription...")
     whisper_duplicates = []
     try:
-        import whisper
-        model = whisper.load_model("base")
-        result = model.transcribe(audio_path, language="en")
-        transcript_segments = result.get('segments', [])
+        transcript_segments = default_transcriber().transcribe(
+            audio_path, manifest_data, ctx)['segments']
 
         # Extract words with timestamps
         words = []
@@ -2115,6 +2503,25 @@ def qa_repeated_content_check(audio_path, manifest_data, expected_repetitions=No
         'confirmed_repeats': confirmed_repeats,
     }
 
+    # ── Catalogue-wide near-duplicates (approximate nearest neighbours) ──
+    if catalogue and session_name:
+        index = RepeatIndex()
+        try:
+            index.replace_session(session_name, [
+                (k, text_segments[k]['start_time'], text_segments[k].get('text', ''), v)
+                for k, v in zip(seg_index, seg_means)])
+            details['catalogue_matches'] = [{
+                'seg': seg_index[q],
+                'time': text_segments[seg_index[q]]['start_time'],
+                'other_session': other['session'],
+                'other_time': other['start_time'],
+                'similarity': round(sim, 4),
+            } for q, other, sim in index.matches(session_name, seg_means, mfcc_sim_threshold)]
+        finally:
+            index.close()
+        print(f"  QA-REPEAT: Catalogue — {len(details['catalogue_matches'])} near-identical "
+              f"segments in other sessions (informational)")
+
     passed = len(confirmed_repeats) == 0
     if not passed:
         print(f"  QA-REPEAT: FAIL — {len(confirmed_repeats)} confirmed repetitions:")
@@ -2128,7 +2535,8 @@ def qa_repeated_content_check(audio_path, manifest_data, expected_repetitions=No
     return passed, details
 
 
-def qa_speech_rate_check(audio_path, manifest_data, window_sec=2.0, rush_threshold=1.3):
+def qa_speech_rate_check(audio_path, manifest_data, window_sec=2.0, rush_threshold=1.3,
+                         ctx=None):
     """QA GATE 10: Speech rate anomaly detection.
 
     Uses Whisper word-level timestamps to measure words-per-second in sliding
@@ -2143,14 +2551,11 @@ def qa_speech_rate_check(audio_path, manifest_data, window_sec=2.0, rush_thresho
     print(f"\n  QA-RATE: Scanning for speech rate anomalies...")
 
     try:
-        import whisper
-
-        model = whisper.load_model("base")
-        result = model.transcribe(audio_path, word_timestamps=True)
+        result = default_transcriber().transcribe(audio_path, manifest_data, ctx)
 
         # Extract word-level timestamps
         words = []
-        for seg in result.get('segments', []):
+        for seg in result['segments']:
             for w in seg.get('words', []):
                 words.append({
                     'word': w['word'].strip(),
@@ -2258,7 +2663,8 @@ def qa_speech_rate_check(audio_path, manifest_data, window_sec=2.0, rush_thresho
         return True, {'skipped': True, 'error': str(e)}
 
 
-def qa_silence_integrity_check(raw_narration_wav, manifest_data, max_silence_energy_db=-50.0):
+def qa_silence_integrity_check(raw_narration_wav, manifest_data, max_silence_energy_db=-50.0,
+                               ctx=None):
     """QA GATE 11: Silence Region Integrity.
 
     Verifies that every silence region in the manifest actually contains silence
@@ -2277,7 +2683,7 @@ def qa_silence_integrity_check(raw_narration_wav, manifest_data, max_silence_ene
         print(f"  QA-SILENCE: WARNING — librosa not installed, skipping")
         return True, {'skipped': True, 'reason': 'missing_librosa'}
 
-    y, sr = librosa.load(raw_narration_wav, sr=22050)
+    y, sr = _qa_audio(raw_narration_wav, ctx).y22, QA_ANALYSIS_SR
 
     silence_regions = [s for s in manifest_data.get('segments', []) if s['type'] == 'silence']
 
@@ -2384,7 +2790,7 @@ def qa_duration_accuracy_check(final_audio_path, metadata, tolerance=0.15):
 
 
 def qa_ambient_continuity_check(final_audio_path, manifest_data, min_energy_db=-85.0,
-                                 max_ambient_variation_db=19.0):
+                                 max_ambient_variation_db=19.0, ctx=None):
     """QA GATE 13: Ambient Continuity.
 
     Verifies that no pause/silence region in the final mixed output drops below
@@ -2402,7 +2808,7 @@ def qa_ambient_continuity_check(final_audio_path, manifest_data, min_energy_db=-
         print(f"  QA-AMBIENT: WARNING — librosa not installed, skipping")
         return True, {'skipped': True, 'reason': 'missing_librosa'}
 
-    y, sr = librosa.load(final_audio_path, sr=22050)
+    y, sr = _qa_audio(final_audio_path, ctx).y22, QA_ANALYSIS_SR
     total_dur = len(y) / sr
 
     silence_regions = [s for s in manifest_data.get('segments', []) if s['type'] == 'silence']
@@ -2492,7 +2898,7 @@ def qa_ambient_continuity_check(final_audio_path, manifest_data, min_energy_db=-
     return passed, details
 
 
-def qa_opening_quality_check(audio_path, manifest_data, opening_sec=60.0):
+def qa_opening_quality_check(audio_path, manifest_data, opening_sec=60.0, ctx=None):
     """QA GATE 14: Opening Quality — tighter thresholds on first 60 seconds.
 
     The opening is what the listener hears first. Glitches here are catastrophic.
@@ -2510,7 +2916,7 @@ def qa_opening_quality_check(audio_path, manifest_data, opening_sec=60.0):
         print(f"  QA-OPENING: WARNING — librosa not installed, skipping")
         return True, {'skipped': True, 'reason': 'missing_librosa'}
 
-    y, sr = librosa.load(audio_path, sr=22050)
+    y, sr = _qa_audio(audio_path, ctx).y22, QA_ANALYSIS_SR
     total_dur = len(y) / sr
 
     if total_dur < opening_sec:
@@ -2594,7 +3000,8 @@ def qa_opening_quality_check(audio_path, manifest_data, opening_sec=60.0):
     return passed, details
 
 
-def qa_visual_report(audio_path, manifest_data, session_name, gate_results, output_dir=None):
+def qa_visual_report(audio_path, manifest_data, session_name, gate_results, output_dir=None,
+                     ctx=None):
     """QA GATE 9: Energy Spike Detection + Visual Report.
 
     Generates a 4-panel PNG: waveform, mel spectrogram, energy plot, summary.
@@ -2613,93 +3020,52 @@ def qa_visual_report(audio_path, manifest_data, session_name, gate_results, outp
     print(f"\n  QA-REPORT: Generating visual report...")
 
     # Load audio
-    import wave as _wave
-    w = _wave.open(audio_path, 'r')
-    n = w.getnframes()
-    sr = w.getframerate()
-    nch = w.getnchannels()
-    raw = w.readframes(n)
-    w.close()
-
-    samples = np.frombuffer(raw, dtype=np.int16).astype(np.float64)
-    if nch > 1:
-        samples = samples.reshape(-1, nch).mean(axis=1)
+    audio = _qa_audio(audio_path, ctx)
+    samples = audio.samples
+    sr = audio.sr
 
     duration_sec = len(samples) / sr
-    time_axis = np.arange(len(samples)) / sr
-
-    # Compute per-second RMS for energy plot
-    rms_per_sec = []
-    for i in range(0, len(samples) - sr, sr):
-        chunk = samples[i:i + sr]
-        rms = np.sqrt(np.mean(chunk**2))
-        db = 20 * np.log10(rms / 32768) if rms > 0 else -100
-        rms_per_sec.append(db)
-    rms_per_sec = np.array(rms_per_sec)
+
+    # Per-second RMS for energy plot
+    rms_per_sec = audio.rms_envelope()
     speech_rms = rms_per_sec[rms_per_sec > -40]
     median_rms = float(np.median(speech_rms)) if len(speech_rms) > 0 else -30
 
     # ── Energy spike detection (Gate 9 pass/fail) ──
-    from scipy.signal import butter, sosfilt
     spike_window_sec = 2.0
     spike_win_samples = int(spike_window_sec * sr)
     spike_hop = int(1.0 * sr)  # 1s hop for 2s windows
 
-    sos_hf = butter(4, 4000, btype='high', fs=sr, output='sos')
-    hf_signal = sosfilt(sos_hf, samples)
-
-    total_energies = []
-    hf_energies = []
-    spike_times = []
-
-    for start in range(0, len(samples) - spike_win_samples, spike_hop):
-        total_chunk = samples[start:start + spike_win_samples]
-        hf_chunk = hf_signal[start:start + spike_win_samples]
-        total_energies.append(float(np.mean(total_chunk**2)))
-        hf_energies.append(float(np.mean(hf_chunk**2)))
-        spike_times.append(start / sr)
-
-    total_energies = np.array(total_energies)
-    hf_energies = np.array(hf_energies)
-    spike_times = np.array(spike_times)
+    spike_times, total_energies = audio.window_power(spike_win_samples, spike_hop)
+    _, hf_energies = audio.window_power(spike_win_samples, spike_hop, highpass=4000)
 
     # Compute medians from SPEECH windows only (silence drags median down,
     # causing normal speech to flag as spikes)
-    speech_ranges = []
-    for seg in manifest_data.get('segments', []):
-        if seg['type'] == 'text':
-            speech_ranges.append((seg['start_time'], seg['start_time'] + seg['duration']))
-
-    speech_mask = np.zeros(len(spike_times), dtype=bool)
-    for i, t in enumerate(spike_times):
-        for s_start, s_end in speech_ranges:
-            if s_start <= t < s_end:
-                speech_mask[i] = True
-                break
+    speech_mask = SegmentIntervals(manifest_data, 'text').contains(spike_times, closed=False)
 
     speech_total = total_energies[speech_mask & (total_energies > 0)]
     speech_hf = hf_energies[speech_mask & (hf_energies > 0)]
     median_total = float(np.median(speech_total)) if len(speech_total) > 0 else float(np.median(total_energies[total_energies > 0])) if np.any(total_energies > 0) else 1
     median_hf = float(np.median(speech_hf)) if len(speech_hf) > 0 else float(np.median(hf_energies[hf_energies > 0])) if np.any(hf_energies > 0) else 1
 
+    total_ratios = total_energies / median_total if median_total > 0 else np.zeros(len(spike_times))
+    hf_ratios = hf_energies / median_hf if median_hf > 0 else np.zeros(len(spike_times))
     energy_spikes = []
-    for i in range(len(spike_times)):
-        total_ratio = total_energies[i] / median_total if median_total > 0 else 0
-        hf_ratio = hf_energies[i] / median_hf if median_hf > 0 else 0
+    for i in np.flatnonzero((total_ratios > 12.0) | (hf_ratios > 28.0)).tolist():
+        total_ratio, hf_ratio = total_ratios[i], hf_ratios[i]
         reasons = []
         if total_ratio > 12.0:
             reasons.append(f'total {total_ratio:.1f}x median')
         if hf_ratio > 28.0:
             reasons.append(f'HF {hf_ratio:.1f}x median')
-        if reasons:
-            t = spike_times[i]
-            energy_spikes.append({
-                'time': round(float(t), 1),
-                'time_fmt': f'{int(t//60)}:{t%60:04.1f}',
-                'total_ratio': round(float(total_ratio), 1),
-                'hf_ratio': round(float(hf_ratio), 1),
-                'reasons': ', '.join(reasons),
-            })
+        t = spike_times[i]
+        energy_spikes.append({
+            'time': round(float(t), 1),
+            'time_fmt': f'{int(t//60)}:{t%60:04.1f}',
+            'total_ratio': round(float(total_ratio), 1),
+            'hf_ratio': round(float(hf_ratio), 1),
+            'reasons': ', '.join(reasons),
+        })
 
     gate9_passed = len(energy_spikes) == 0
     gate9_details = {
@@ -2748,7 +3114,7 @@ def qa_visual_report(audio_path, manifest_data, session_name, gate_results, outp
     # Downsample for plotting (max 10000 points)
     downsample = max(1, len(samples) // 10000)
     plot_samples = samples[::downsample] / 32768
-    plot_time = time_axis[::downsample]
+    plot_time = np.arange(0, len(samples), downsample) / sr
 
     ax.plot(plot_time, plot_samples, color='#4488cc', linewidth=0.3, alpha=0.8)
 
@@ -2780,10 +3146,10 @@ def qa_visual_report(audio_path, manifest_data, session_name, gate_results, outp
     try:
         import librosa
         import librosa.display
-        y_librosa = samples / 32768
-        S = librosa.feature.melspectrogram(y=y_librosa, sr=sr, n_mels=128, fmax=10000)
+        # Shared 22.05k STFT — 0-10kHz is below its Nyquist
+        S = audio.mel_spectrogram(n_mels=128, fmax=10000)
         S_db = librosa.power_to_db(S, ref=np.max)
-        img = librosa.display.specshow(S_db, x_axis='time', y_axis='mel', sr=sr,
+        img = librosa.display.specshow(S_db, x_axis='time', y_axis='mel', sr=QA_ANALYSIS_SR,
                                         fmax=10000, ax=ax, cmap='viridis')
         ax.axhline(y=4000, color='#ffffff', linestyle='--', alpha=0.5, linewidth=0.8)
         ax.text(duration_sec * 0.98, 4200, '4kHz', color='#ffffff', alpha=0.5,
@@ -2884,52 +3250,45 @@ def qa_visual_report(audio_path, manifest_data, session_name, gate_results, outp
     return gate9_passed, gate9_details, str(report_path)
 
 
-def scan_for_clicks(audio_path, manifest_data, threshold=QA_CLICK_THRESHOLD):
+def scan_for_clicks(audio_path, manifest_data, threshold=QA_CLICK_THRESHOLD, ctx=None):
     """Scan mixed audio for click artifacts in silence regions.
 
     Returns list of (timestamp, jump_amplitude, peak_amplitude) for each click found.
     Only flags clicks where the sample jump exceeds the local peak (ratio > 1.0).
     """
-    import wave as _wave
-    import struct as _struct
-
-    wav_path = audio_path + ".scan.wav"
-    subprocess.run([
-        'ffmpeg', '-y', '-i', audio_path,
-        '-c:a', 'pcm_s16le', '-ar', str(SAMPLE_RATE), '-ac', '2',
-        wav_path
-    ], capture_output=True, check=True)
-
-    w = _wave.open(wav_path, 'r')
-    n = w.getnframes()
-    frames = w.readframes(n)
-    samples = _struct.unpack(f'<{n * 2}h', frames)
-    w.close()
-    os.remove(wav_path)
-
-    # Build silence region lookup
-    silence_ranges = []
-    for seg in manifest_data['segments']:
-        if seg['type'] == 'silence':
-            silence_ranges.append((seg['start_time'], seg['start_time'] + seg['duration']))
-
-    def in_silence(ts):
-        return any(start <= ts <= end for start, end in silence_ranges)
-
-    # Scan in 10ms windows
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    audio = _qa_audio(audio_path, ctx)
+    pcm = audio.pcm
+    if audio.sr != SAMPLE_RATE or (audio.via_ffmpeg and pcm.shape[1] == 1):
+        # Off-rate WAV or mono non-WAV: `ffmpeg -ac 2` like the scan always did
+        audio = QAAudio(audio_path)
+        audio._decode_via_ffmpeg(channels=2)
+        pcm = audio.pcm
+    # Left channel as after `ffmpeg -ac 2`: a mono WAV is upmixed at 1/√2 per
+    # channel, in swresample's Q15 fixed point (bit-exact with ffmpeg 7)
+    left = pcm[:, 0].astype(np.int32)
+    if pcm.shape[1] == 1:
+        left = (left * 23170 + 16384) >> 15
+    n = len(left)
+
+    # 10ms windows at a 5ms hop; only silence-region windows can flag
     window = int(SAMPLE_RATE * 0.01)
-    clicks = []
-    for start in range(0, n - window, window // 2):
-        chunk = [samples[i * 2] for i in range(start, min(start + window, n))]
-        if not chunk:
-            continue
-        peak = max(abs(s) for s in chunk)
-        if peak < 50:  # Skip true silence
-            continue
-        max_jump = max(abs(chunk[i + 1] - chunk[i]) for i in range(len(chunk) - 1)) if len(chunk) > 1 else 0
-        ts = start / SAMPLE_RATE
-        if in_silence(ts) and max_jump > peak and max_jump > threshold:
-            clicks.append((ts, max_jump, peak))
+    hop = window // 2
+    starts = np.arange(0, max(n - window, 0), hop)
+    if len(starts) == 0:
+        return []
+    times = starts / SAMPLE_RATE
+    keep = SegmentIntervals(manifest_data, 'silence').contains(times)
+    starts, times = starts[keep], times[keep]
+    if len(starts) == 0:
+        return []
+
+    peaks = sliding_window_view(np.abs(left), window)[starts].max(axis=1)
+    jumps = sliding_window_view(np.abs(np.diff(left)), window - 1)[starts].max(axis=1)
+    hit = (peaks >= 50) & (jumps > peaks) & (jumps > threshold)  # peak < 50 = true silence
+    clicks = zip(times[hit].tolist(), jumps[hit].tolist(), peaks[hit].tolist())
 
     # Deduplicate close timestamps
     filtered = []
@@ -3066,83 +3425,47 @@ def patch_stitch_clicks(raw_mp3, manifest_data, output_mp3, ambient_name=None, f
     else:
         shutil.copy(normed_wav, mixed_wav)
 
-    # Final encode: WAV → MP3 128kbps (single lossy step)
+    # Final encode: WAV → MP3 128kbps (single lossy step). Both rewrites go
+    # through a temp file + os.replace so no reader sees a half-written file.
+    output_tmp = output_mp3 + ".tmp.mp3"
     subprocess.run([
         'ffmpeg', '-y', '-i', mixed_wav,
         '-c:a', 'libmp3lame', '-b:a', '128k',
-        output_mp3
+        output_tmp
     ], capture_output=True, check=True)
+    os.replace(output_tmp, output_mp3)
 
     # Update the raw file with patched version (keep as WAV if it was WAV)
+    raw_tmp = raw_mp3 + ".tmp" + os.path.splitext(raw_mp3)[1]
     if raw_mp3.endswith('.wav'):
-        shutil.copy(normed_wav, raw_mp3)
+        shutil.copy(normed_wav, raw_tmp)
     else:
         # Legacy: convert back to MP3 for old raw files
         subprocess.run([
             'ffmpeg', '-y', '-i', normed_wav,
             '-c:a', 'libmp3lame', '-b:a', '128k',
-            raw_mp3
+            raw_tmp
         ], capture_output=True, check=True)
+    os.replace(raw_tmp, raw_mp3)
 
     # Cleanup temp files
-    for f in [wav_path, patched_wav, normed_wav, mixed_wav]:
+    for f in [wav_path, patched_wav, normed_wav, mixed_wav, output_tmp, raw_tmp]:
         if os.path.exists(f):
             os.remove(f)
 
     return len(stitch_times)
 
 
-def qa_loop(final_mp3, raw_mp3, manifest_data, ambient_name=None, raw_narration_wav=None,
-            pre_cleanup_wav=None, session_name=None, metadata=None):
-    """Full 14-gate QA pipeline.
-
-    GATE 1 (Primary): Quality benchmarks — noise floor and HF hiss vs master
-    GATE 2 (Click scan): Scan → fix → rescan loop for click artifacts
-    GATE 3 (Independent): Spectral comparison against master reference WAV
-    GATE 4 (Voice): MFCC cosine + F0 deviation vs Marco master (pre-cleanup)
-    GATE 5 (Loudness): Per-second RMS consistency — catches per-chunk level surges
-    GATE 6 (HF Hiss): Sliding-window high-frequency hiss detector (non-speech, post-cleanup)
-    GATE 7 (Surge): Volume surge/drop detector with silence exclusion (pre-cleanup)
-    GATE 8 (Repeat): Repeated content detector — MFCC + Whisper (pre-cleanup)
-    GATE 9 (Energy): Energy spike detection + visual report
-    GATE 10 (Rate): Speech rate anomaly detection (pre-cleanup)
-    GATE 11 (Silence): Silence region integrity — verify pauses contain silence
-    GATE 12 (Duration): Duration accuracy — final within 15% of target
-    GATE 13 (Ambient): Ambient continuity — no dead silence in pauses
-    GATE 14 (Opening): Opening quality — tighter thresholds on first 60s
+def qa_click_gate(click_scan_file, manifest_data, raw_mp3, final_mp3, ambient_name=None,
+                  ambient_db=None, ctx=None):
+    """QA GATE 2: Click artifacts — scan → patch → rescan, up to QA_MAX_PASSES.
 
-    ALL gates must pass. Any failure = no deploy.
-    Human review remains MANDATORY.
-    Returns True only if all gates pass.
+    Patching rewrites raw_mp3 and final_mp3 (see patch_stitch_clicks).
+    Returns (passed, details_dict).
     """
-    if metadata is None:
-        metadata = {}
-
-    print(f"\n{'='*60}")
-    print("  QA: 14-GATE QUALITY ASSURANCE")
-    print(f"{'='*60}")
-
-    gate_results = {}
-    any_failed = False
-
-    # Choose audio for pre-cleanup gates (6-8 and 4)
-    pre_wav = pre_cleanup_wav if (pre_cleanup_wav and os.path.exists(pre_cleanup_wav)) else raw_narration_wav
-
-    # ── GATE 1: Quality benchmarks ──
-    if raw_narration_wav and os.path.exists(raw_narration_wav):
-        quality_passed, quality_details = qa_quality_check(raw_narration_wav, manifest_data)
-        gate_results['Gate 1: Quality'] = {'passed': quality_passed, 'details': quality_details}
-        if not quality_passed:
-            any_failed = True
-    else:
-        print(f"  QA-QUALITY: SKIPPED (no raw narration WAV available)")
-
-    # ── GATE 2: Click artifacts ──
-    # Scan raw narration (no ambient) to avoid false positives from ambient transients (bird chirps etc.)
-    click_scan_file = raw_mp3 if raw_mp3 and os.path.exists(raw_mp3) else final_mp3
     clicks_passed = True
     for qa_pass in range(1, QA_MAX_PASSES + 1):
-        clicks = scan_for_clicks(click_scan_file, manifest_data)
+        clicks = scan_for_clicks(click_scan_file, manifest_data, ctx=ctx)
 
         if not clicks:
             print(f"  QA PASS {qa_pass}: CLEAN — 0 click artifacts")
@@ -3158,115 +3481,79 @@ def qa_loop(final_mp3, raw_mp3, manifest_data, ambient_name=None, raw_narration_
 
         click_timestamps = [ts for ts, jump, peak in clicks]
         print(f"  QA PASS {qa_pass}: Patching artifacts near stitch points...")
-        patches = patch_stitch_clicks(raw_mp3, manifest_data, final_mp3, ambient_name, click_times=click_timestamps, ambient_db=metadata.get('ambient_db'))
+        patches = patch_stitch_clicks(raw_mp3, manifest_data, final_mp3, ambient_name, click_times=click_timestamps, ambient_db=ambient_db)
+        if ctx is not None:
+            ctx.invalidate(raw_mp3, final_mp3)
         print(f"  QA PASS {qa_pass}: Applied crossfades at {patches} stitch points")
     else:
-        clicks = scan_for_clicks(click_scan_file, manifest_data)
+        clicks = scan_for_clicks(click_scan_file, manifest_data, ctx=ctx)
         if clicks:
             clicks_passed = False
             print(f"  QA: {len(clicks)} clicks remain after {QA_MAX_PASSES} passes")
 
-    gate_results['Gate 2: Clicks'] = {'passed': clicks_passed, 'details': {'remaining_clicks': len(clicks) if not clicks_passed else 0}}
-    if not clicks_passed:
-        any_failed = True
-
-    # ── GATE 3: Independent spectral verification ──
-    if raw_narration_wav and os.path.exists(raw_narration_wav):
-        independent_passed, independent_details = qa_independent_check(raw_narration_wav, manifest_data)
-        gate_results['Gate 3: Spectral'] = {'passed': independent_passed, 'details': independent_details}
-        if not independent_passed:
-            any_failed = True
-
-    # ── GATE 4: Master voice comparison (MFCC + F0) ──
-    if pre_wav and os.path.exists(pre_wav):
-        voice_passed, voice_details = qa_master_voice_check(pre_wav)
-        gate_results['Gate 4: Voice'] = {'passed': voice_passed, 'details': voice_details}
-        if not voice_passed:
-            any_failed = True
-
-    # ── GATE 5: Loudness consistency (per-second RMS) ──
-    if raw_narration_wav and os.path.exists(raw_narration_wav):
-        loudness_passed, loudness_details = qa_loudness_consistency_check(
-            raw_narration_wav, manifest_data)
-        gate_results['Gate 5: Loudness'] = {'passed': loudness_passed, 'details': loudness_details}
-        if not loudness_passed:
-            any_failed = True
-
-    # ── GATE 6: HF hiss detector (POST-cleanup per Bible Section 13) ──
-    if raw_narration_wav and os.path.exists(raw_narration_wav):
-        hiss_passed, hiss_details = qa_hf_hiss_check(raw_narration_wav, manifest_data)
-        gate_results['Gate 6: HF Hiss'] = {'passed': hiss_passed, 'details': hiss_details}
-        if not hiss_passed:
-            any_failed = True
-
-    # ── GATE 7: Volume surge/drop detector (pre-cleanup) ──
-    if pre_wav and os.path.exists(pre_wav):
-        surge_passed, surge_details = qa_volume_surge_check(pre_wav, manifest_data)
-        gate_results['Gate 7: Surge'] = {'passed': surge_passed, 'details': surge_details}
-        if not surge_passed:
-            any_failed = True
-
-    # ── GATE 8: Repeated content detector (pre-cleanup) ──
-    if pre_wav and os.path.exists(pre_wav):
-        expected_reps = metadata.get('expected_repetitions', [])
-        repeat_passed, repeat_details = qa_repeated_content_check(pre_wav, manifest_data, expected_repetitions=expected_reps)
-        gate_results['Gate 8: Repeat'] = {'passed': repeat_passed, 'details': repeat_details}
-        if not repeat_passed:
-            any_failed = True
-
-    # ── GATE 10: Speech rate anomaly detection (pre-cleanup) ──
-    if pre_wav and os.path.exists(pre_wav):
-        rate_passed, rate_details = qa_speech_rate_check(pre_wav, manifest_data)
-        gate_results['Gate 10: Rate'] = {'passed': rate_passed, 'details': rate_details}
-        if not rate_passed:
-            any_failed = True
-
-    # ── GATE 11: Silence Region Integrity (raw narration) ──
-    if raw_narration_wav and os.path.exists(raw_narration_wav):
-        silence_passed, silence_details = qa_silence_integrity_check(raw_narration_wav, manifest_data)
-        gate_results['Gate 11: Silence'] = {'passed': silence_passed, 'details': silence_details}
-        if not silence_passed:
-            any_failed = True
-
-    # ── GATE 12: Duration Accuracy ──
-    if final_mp3 and os.path.exists(final_mp3):
-        dur_passed, dur_details = qa_duration_accuracy_check(final_mp3, metadata)
-        gate_results['Gate 12: Duration'] = {'passed': dur_passed, 'details': dur_details}
-        if not dur_passed:
-            any_failed = True
-
-    # ── GATE 13: Ambient Continuity (final mixed output) ──
-    if final_mp3 and os.path.exists(final_mp3) and ambient_name:
-        ambient_passed, ambient_details = qa_ambient_continuity_check(final_mp3, manifest_data)
-        gate_results['Gate 13: Ambient'] = {'passed': ambient_passed, 'details': ambient_details}
-        if not ambient_passed:
-            any_failed = True
-    elif not ambient_name:
-        print(f"\n  QA-AMBIENT: SKIPPED — no ambient specified for this session")
-        gate_results['Gate 13: Ambient'] = {'passed': True, 'details': {'skipped': True, 'reason': 'no_ambient'}}
+    return clicks_passed, {'remaining_clicks': len(clicks) if not clicks_passed else 0}
 
-    # ── GATE 14: Opening Quality (tighter thresholds, first 60s) ──
-    if pre_wav and os.path.exists(pre_wav):
-        opening_passed, opening_details = qa_opening_quality_check(pre_wav, manifest_data)
-        gate_results['Gate 14: Opening'] = {'passed': opening_passed, 'details': opening_details}
-        if not opening_passed:
-            any_failed = True
-
-    # ── GATE 9: Energy Spike Detection + Visual Report (ALWAYS runs last) ──
-    report_wav = pre_wav or raw_narration_wav
-    s_name = session_name or 'unknown'
-    if report_wav and os.path.exists(report_wav):
-        try:
-            g9_passed, g9_details, _ = qa_visual_report(report_wav, manifest_data, s_name, gate_results)
-            gate_results['Gate 9: Energy'] = {'passed': g9_passed, 'details': g9_details}
-            if not g9_passed:
-                any_failed = True
-        except Exception as e:
-            print(f"  QA-REPORT: ERROR generating report: {e}")
+
+def qa_click_scan_check(audio_path, manifest_data, ctx=None):
+    """QA GATE 2 (detection only, no patching — vault assembly).
+
+    Returns (passed, details_dict).
+    """
+    clicks = scan_for_clicks(audio_path, manifest_data, ctx=ctx)
+    passed = len(clicks) == 0
+    if not passed:
+        print(f"  FAIL: {len(clicks)} click(s) detected")
+    else:
+        print(f"  PASS: No clicks detected")
+    return passed, {'clicks_found': len(clicks), 'clicks': clicks}
+
+
+def qa_loop(final_mp3, raw_mp3, manifest_data, ambient_name=None, raw_narration_wav=None,
+            pre_cleanup_wav=None, session_name=None, metadata=None, fail_fast=False,
+            workers=QA_WORKERS, catalogue_repeats=False):
+    """Full 14-gate QA pipeline.
+
+    GATE 1 (Primary): Quality benchmarks — noise floor and HF hiss vs master
+    GATE 2 (Click scan): Scan → fix → rescan loop for click artifacts
+    GATE 3 (Independent): Spectral comparison against master reference WAV
+    GATE 4 (Voice): MFCC cosine + F0 deviation vs Marco master (pre-cleanup)
+    GATE 5 (Loudness): Per-second RMS consistency — catches per-chunk level surges
+    GATE 6 (HF Hiss): Sliding-window high-frequency hiss detector (non-speech, post-cleanup)
+    GATE 7 (Surge): Volume surge/drop detector with silence exclusion (pre-cleanup)
+    GATE 8 (Repeat): Repeated content detector — MFCC + Whisper (pre-cleanup)
+    GATE 9 (Energy): Energy spike detection + visual report
+    GATE 10 (Rate): Speech rate anomaly detection (pre-cleanup)
+    GATE 11 (Silence): Silence region integrity — verify pauses contain silence
+    GATE 12 (Duration): Duration accuracy — final within 15% of target
+    GATE 13 (Ambient): Ambient continuity — no dead silence in pauses
+    GATE 14 (Opening): Opening quality — tighter thresholds on first 60s
+
+    ALL gates must pass. Any failure = no deploy.
+    Human review remains MANDATORY.
+    Returns True only if all gates pass.
+
+    Gates come from qa_gate_specs() and run through qa_runner.run_gates
+    (run_qa_gates): independent gates in parallel
+    (`workers` processes), anything reading the raw/final mix after Gate 2's
+    patch loop, Gate 9 last. fail_fast stops at the first failed gate.
+    catalogue_repeats files Gate 8's fingerprints in the catalogue-wide
+    RepeatIndex and reports near-duplicates in other sessions.
+    Each audio file is decoded once per process into a shared QAContext;
+    Gates 8 and 10 share one Whisper transcript (Transcriber).
+    """
+    print(f"\n{'='*60}")
+    print("  QA: 14-GATE QUALITY ASSURANCE")
+    print(f"{'='*60}")
+
+    gate_results = run_qa_gates(final_mp3, raw_mp3, manifest_data, ambient_name,
+                                raw_narration_wav=raw_narration_wav,
+                                pre_cleanup_wav=pre_cleanup_wav, session_name=session_name,
+                                metadata=metadata, fail_fast=fail_fast, workers=workers,
+                                catalogue_repeats=catalogue_repeats)
 
     # ── VERDICT ──
-    if any_failed:
-        failed_gates = [name for name, r in gate_results.items() if not r.get('passed', True)]
+    failed_gates = [name for name, r in gate_results.items() if not r.get('passed', True)]
+    if failed_gates:
         print(f"\n  QA: REJECTED — {len(failed_gates)} gate(s) failed: {', '.join(failed_gates)}")
         print(f"  QA: Build will NOT be deployed")
         return False
@@ -3276,6 +3563,103 @@ def qa_loop(final_mp3, raw_mp3, manifest_data, ambient_name=None, raw_narration_
     return True
 
 
+def qa_gate_specs(final_mp3, raw_mp3, manifest_data, ambient_name=None, raw_narration_wav=None,
+                  pre_cleanup_wav=None, session_name=None, metadata=None,
+                  catalogue_repeats=False, patch_clicks=True, report_dir=None):
+    """qa_runner.GateSpec list for the 14-gate suite over the files that exist.
+
+    patch_clicks=False runs Gate 2 as detection only (qa_click_scan_check),
+    so nothing is rewritten — for re-verifying deployed masters.
+    report_dir overrides where Gate 9 writes its PNG (default OUTPUT_DIR).
+    """
+    if metadata is None:
+        metadata = {}
+
+    def available(path):
+        return bool(path) and os.path.exists(path)
+
+    # Choose audio for pre-cleanup gates (6-8 and 4)
+    pre_wav = pre_cleanup_wav if available(pre_cleanup_wav) else raw_narration_wav
+    raw_wav = raw_narration_wav if available(raw_narration_wav) else None
+    pre_wav = pre_wav if available(pre_wav) else None
+    final = final_mp3 if available(final_mp3) else None
+
+    # Scan raw narration (no ambient) to avoid false positives from ambient transients (bird chirps etc.)
+    click_scan_file = raw_mp3 if available(raw_mp3) else final_mp3
+
+    G = qa_runner.GateSpec
+    specs = []
+    if raw_wav:
+        specs.append(G('Gate 1: Quality', qa_quality_check, (raw_wav, manifest_data),
+                       reads=(raw_wav,)))
+    else:
+        print(f"  QA-QUALITY: SKIPPED (no raw narration WAV available)")
+    if patch_clicks:
+        specs.append(G('Gate 2: Clicks', qa_click_gate,
+                       (click_scan_file, manifest_data, raw_mp3, final_mp3, ambient_name),
+                       {'ambient_db': metadata.get('ambient_db')},
+                       reads=(click_scan_file,), writes=(raw_mp3, final_mp3)))
+    else:
+        specs.append(G('Gate 2: Clicks', qa_click_scan_check, (click_scan_file, manifest_data),
+                       reads=(click_scan_file,)))
+    if raw_wav:
+        specs.append(G('Gate 3: Spectral', qa_independent_check, (raw_wav, manifest_data),
+                       reads=(raw_wav,)))
+    if pre_wav:
+        specs.append(G('Gate 4: Voice', qa_master_voice_check, (pre_wav,), reads=(pre_wav,)))
+    if raw_wav:
+        specs.append(G('Gate 5: Loudness', qa_loudness_consistency_check,
+                       (raw_wav, manifest_data), reads=(raw_wav,)))
+        # POST-cleanup per Bible Section 13
+        specs.append(G('Gate 6: HF Hiss', qa_hf_hiss_check, (raw_wav, manifest_data),
+                       reads=(raw_wav,)))
+    if pre_wav:
+        specs.append(G('Gate 7: Surge', qa_volume_surge_check, (pre_wav, manifest_data),
+                       reads=(pre_wav,)))
+        specs.append(G('Gate 8: Repeat', qa_repeated_content_check, (pre_wav, manifest_data),
+                       {'expected_repetitions': metadata.get('expected_repetitions', []),
+                        'session_name': session_name, 'catalogue': catalogue_repeats},
+                       reads=(pre_wav,)))
+        # After Gate 8 so it reads the transcript Gate 8 cached, whichever worker ran it
+        specs.append(G('Gate 10: Rate', qa_speech_rate_check, (pre_wav, manifest_data),
+                       reads=(pre_wav,), after=('Gate 8: Repeat',)))
+    if raw_wav:
+        specs.append(G('Gate 11: Silence', qa_silence_integrity_check, (raw_wav, manifest_data),
+                       reads=(raw_wav,)))
+    if final:
+        specs.append(G('Gate 12: Duration', qa_duration_accuracy_check, (final, metadata),
+                       reads=(final,)))
+    if final and ambient_name:
+        specs.append(G('Gate 13: Ambient', qa_ambient_continuity_check, (final, manifest_data),
+                       reads=(final,)))
+    if pre_wav:
+        specs.append(G('Gate 14: Opening', qa_opening_quality_check, (pre_wav, manifest_data),
+                       reads=(pre_wav,)))
+
+    # Gate 9 plots every other gate's result, so it always runs last
+    report_wav = pre_wav or raw_wav
+    if report_wav:
+        specs.append(G('Gate 9: Energy', qa_visual_report,
+                       (report_wav, manifest_data, session_name or 'unknown'),
+                       {'output_dir': report_dir} if report_dir else {},
+                       reads=(report_wav,), after=tuple(s.name for s in specs),
+                       prepare=lambda results: {'gate_results': results}, optional=True))
+    return specs
+
+
+def run_qa_gates(final_mp3, raw_mp3, manifest_data, ambient_name=None, fail_fast=False,
+                 workers=QA_WORKERS, **spec_options):
+    """Run the qa_gate_specs() suite; returns {gate name: result} incl. the Gate 13 skip."""
+    specs = qa_gate_specs(final_mp3, raw_mp3, manifest_data, ambient_name, **spec_options)
+    gate_results = qa_runner.run_gates(specs, workers=workers, fail_fast=fail_fast,
+                                       ctx=QAContext())
+
+    if not ambient_name:
+        print(f"\n  QA-AMBIENT: SKIPPED — no ambient specified for this session")
+        gate_results['Gate 13: Ambient'] = {'passed': True, 'details': {'skipped': True, 'reason': 'no_ambient'}}
+    return gate_results
+
+
 def deploy_to_r2(local_path, r2_key):
     """Upload file to Cloudflare R2 via wrangler CLI."""
     print(f"  DEPLOY: Uploading to R2 → {r2_key}")
@@ -3342,8 +3726,10 @@ def send_build_email(session_name, duration_min, qa_passed, r2_url):
 # MAIN BUILD
 # ============================================================================
 
+@profiling.span('build_session')
 def build_session(session_name, dry_run=False, provider='fish', voice_id=None, model='v2',
-                   cleanup_mode='full', no_deploy=False, focus_chunks=None):
+                   cleanup_mode='full', no_deploy=False, focus_chunks=None, fail_fast=False,
+                   qa_workers=QA_WORKERS, catalogue_repeats=False):
     """Build a complete session: TTS → concat → mix → QA loop → deploy.
 
     The full pipeline runs autonomously:
@@ -3356,6 +3742,7 @@ def build_session(session_name, dry_run=False, provider='fish', voice_id=None, m
 
     No human listening required. Ship when clean.
     """
+    profiling.annotate(session=session_name, provider=provider)
     script_path = SCRIPT_DIR / f"{session_name}.txt"
     if not script_path.exists():
         script_path = SLEEP_STORY_DIR / f"{session_name}.txt"
@@ -3435,6 +3822,7 @@ def build_session(session_name, dry_run=False, provider='fish', voice_id=None, m
     # ================================================================
     # PHASE 1: GENERATE TTS
     # ================================================================
+    profiling.phase('tts')
     with tempfile.TemporaryDirectory() as temp_dir:
         print(f"  Processing {len(combined_blocks)} blocks")
 
@@ -3546,6 +3934,7 @@ def build_session(session_name, dry_run=False, provider='fish', voice_id=None, m
         # ================================================================
         # PHASE 2: CONCATENATE + MIX (lossless WAV pipeline)
         # ================================================================
+        profiling.phase('concatenate')
         print(f"\n  Concatenating {len(voice_files)} blocks with silences (lossless WAV)...")
         voice_path = os.path.join(temp_dir, "voice_complete.wav")
         pre_cleanup_wav_path = OUTPUT_RAW_DIR / f"{session_name}_precleanup.wav"
@@ -3580,6 +3969,7 @@ def build_session(session_name, dry_run=False, provider='fish', voice_id=None, m
         print(f"  Manifest saved: {manifest_path}")
 
         # Mix ambient (WAV output)
+        profiling.phase('mix')
         mixed_wav = os.path.join(temp_dir, "mixed_complete.wav")
         if ambient:
             print(f"\n  Mixing ambient '{ambient}'...")
@@ -3590,6 +3980,7 @@ def build_session(session_name, dry_run=False, provider='fish', voice_id=None, m
         # ================================================================
         # FINAL ENCODE: WAV → MP3 128kbps (the only lossy step)
         # ================================================================
+        profiling.phase('encode')
         print(f"\n  Encoding final MP3 at 128kbps (single lossy step)...")
         cmd = [
             'ffmpeg', '-y', '-i', mixed_wav,
@@ -3608,13 +3999,17 @@ def build_session(session_name, dry_run=False, provider='fish', voice_id=None, m
     # ================================================================
     # PHASE 3: QA — SCAN → FIX → RESCAN LOOP
     # ================================================================
+    profiling.phase('qa')
     raw_for_qa = str(raw_wav_path) if raw_wav_path.exists() else str(raw_path)
     pre_cleanup_for_qa = str(pre_cleanup_wav_path) if pre_cleanup_wav_path.exists() else None
     qa_passed = qa_loop(str(final_path), raw_for_qa, manifest_data, ambient,
                         raw_narration_wav=str(raw_wav_path) if raw_wav_path.exists() else None,
                         pre_cleanup_wav=pre_cleanup_for_qa,
                         session_name=session_name,
-                        metadata=metadata)
+                        metadata=metadata,
+                        fail_fast=fail_fast,
+                        workers=qa_workers,
+                        catalogue_repeats=catalogue_repeats)
 
     if qa_passed:
         # Update mixed copy after QA patching
@@ -3627,6 +4022,7 @@ def build_session(session_name, dry_run=False, provider='fish', voice_id=None, m
     # ================================================================
     # PHASE 4: DEPLOY TO R2 (only if QA passed)
     # ================================================================
+    profiling.phase('deploy')
     if qa_passed and not no_deploy:
         r2_key = f"{R2_PATH_PREFIX}/{session_name}.mp3"
         deployed = deploy_to_r2(str(final_path), r2_key)
@@ -3680,6 +4076,12 @@ def main():
                         help='Build and QA only — do not upload to R2')
     parser.add_argument('--focus-chunks', default=None,
                         help='Comma-separated chunk numbers to regenerate with extra attempts (e.g. 1,3,11,13,14)')
+    parser.add_argument('--fail-fast', action='store_true',
+                        help='Stop QA at the first failed gate (cancels outstanding gates)')
+    parser.add_argument('--qa-workers', type=int, default=QA_WORKERS,
+                        help=f'Parallel QA gate processes (default: {QA_WORKERS}, 1 = inline)')
+    parser.add_argument('--catalogue-repeats', action='store_true',
+                        help='Gate 8: also report near-identical segments in other sessions')
 
     args = parser.parse_args()
 
@@ -3701,16 +4103,20 @@ def main():
         cleanup_mode = 'full'
 
     try:
-        build_session(
-            args.session,
-            dry_run=args.dry_run,
-            provider=args.provider,
-            voice_id=args.voice_id,
-            model=args.model,
-            cleanup_mode=cleanup_mode,
-            no_deploy=args.no_deploy,
-            focus_chunks=focus_chunk_set,
-        )
+        with profiling.run(f"build-session {args.session}"):
+            build_session(
+                args.session,
+                dry_run=args.dry_run,
+                provider=args.provider,
+                voice_id=args.voice_id,
+                model=args.model,
+                cleanup_mode=cleanup_mode,
+                no_deploy=args.no_deploy,
+                focus_chunks=focus_chunk_set,
+                fail_fast=args.fail_fast,
+                qa_workers=args.qa_workers,
+                catalogue_repeats=args.catalogue_repeats,
+            )
     except Exception as e:
         print(f"\nERROR: {e}")
         import traceback
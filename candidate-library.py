@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Cross-session candidate library for identical chunk text.
+
+Many scripts share chunk text verbatim (21-day course intros and closings,
+repeated breathing cues), yet every vault session generated and scored its
+own pool for them. The library indexes every generated candidate by
+library_key() — normalised text + voice + TTS params, i.e. the Fish payload
+minus the text's whitespace and the conditioning reference — so
+generate_chunk_candidates (vault-builder.py) can pull existing audio into a
+new session's chunk dir first and generate only the shortfall.
+
+Imported candidates are hard-linked (copied across filesystems) and then
+scored in the new session like any other candidate: tonal distance is taken
+against *this* session's previous chunk, and quality/MFCC come from the
+feature store, so re-scoring costs a hash lookup.
+
+Usage (library):
+    lib = CandidateLibrary()
+    rows = lib.lookup(key, exclude_session="52-the-court-of-your-mind", limit=40)
+    CandidateLibrary.materialise(rows[0], chunk_dir / "c03_v00.wav")
+    lib.add(key, wav_path, session_id, chunk_index, version, quality_score, filtered)
+
+Usage (CLI):
+    python3 candidate-library.py stats
+    python3 candidate-library.py rebuild     # index every vault session on disk
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+import fish_client
+
+_af_spec = importlib.util.spec_from_file_location(
+    "audio_features", Path(__file__).parent / "audio-features.py")
+_af_mod = importlib.util.module_from_spec(_af_spec)
+_af_spec.loader.exec_module(_af_mod)
+
+VAULT_DIR = Path("content/audio-free/vault")
+LIBRARY_PATH = VAULT_DIR / "candidate-library.sqlite"
+
+# Vault dirs that are snapshots of another session, not generated pools
+_SKIP_SUFFIXES = ('-backup', '-pre-fix')
+
+
+def _now_iso():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def library_key(payload):
+    """Key for a Fish TTS payload: normalised text + every param except the
+    conditioning reference. Same key ⇒ same request, modulo conditioning."""
+    params = {k: v for k, v in payload.items() if k not in ('text', 'references')}
+    blob = json.dumps({'text': ' '.join(payload['text'].split()), 'params': params},
+                      sort_keys=True)
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+
+class CandidateLibrary:
+    """SQLite index of generated candidates: library_key → WAVs on disk."""
+
+    def __init__(self, db_path=LIBRARY_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=60,
+                                     check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS candidates (
+                path          TEXT PRIMARY KEY,
+                key           TEXT NOT NULL,
+                session_id    TEXT NOT NULL,
+                chunk_index   INTEGER NOT NULL,
+                version       INTEGER NOT NULL,
+                wav_hash      TEXT NOT NULL,
+                quality_score REAL,
+                filtered      INTEGER NOT NULL DEFAULT 0,
+                added_at      TEXT
+            );
+            CREATE INDEX IF NOT EXISTS candidates_key ON candidates (key);
+        """)
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def wav_hash(wav_path):
+        """Content hash via the feature store's path index (no re-read if unchanged)."""
+        return _af_mod.default_store().wav_hash(wav_path)
+
+    def add(self, key, wav_path, session_id, chunk_index, version,
+            quality_score=None, filtered=False):
+        path = str(Path(wav_path).resolve())
+        digest = self.wav_hash(path)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO candidates (path, key, session_id, chunk_index, version, "
+                "wav_hash, quality_score, filtered, added_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(path) DO UPDATE SET key = excluded.key, "
+                "wav_hash = excluded.wav_hash, quality_score = excluded.quality_score, "
+                "filtered = excluded.filtered",
+                (path, key, session_id, chunk_index, version, digest,
+                 quality_score, int(bool(filtered)), _now_iso()))
+            self._conn.commit()
+
+    def lookup(self, key, exclude_session=None, exclude_hashes=(), limit=None):
+        """Library rows for `key`, best first (unfiltered, then quality).
+
+        Each audio is returned once (hard links share a hash); rows whose file
+        has gone are pruned.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, session_id, chunk_index, version, wav_hash, "
+                "quality_score, filtered FROM candidates WHERE key = ? "
+                "ORDER BY filtered ASC, quality_score DESC", (key,)).fetchall()
+
+        seen = set(exclude_hashes)
+        out = []
+        gone = []
+        for path, session_id, chunk_index, version, digest, quality, filtered in rows:
+            if session_id == exclude_session or digest in seen:
+                continue
+            if not os.path.exists(path):
+                gone.append(path)
+                continue
+            seen.add(digest)
+            out.append({
+                'path': path, 'session_id': session_id, 'chunk_index': chunk_index,
+                'version': version, 'wav_hash': digest,
+                'quality_score': quality, 'filtered': bool(filtered),
+            })
+            if limit is not None and len(out) >= limit:
+                break
+
+        if gone:
+            with self._lock:
+                self._conn.executemany("DELETE FROM candidates WHERE path = ?",
+                                       [(p,) for p in gone])
+                self._conn.commit()
+        return out
+
+    @staticmethod
+    def materialise(row, dest):
+        """Hard-link a library WAV to `dest` (copy if linking fails)."""
+        dest = Path(dest)
+        try:
+            os.link(row['path'], dest)
+        except OSError:
+            shutil.copy2(row['path'], dest)
+        return dest
+
+    def stats(self):
+        with self._lock:
+            n, keys = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT key) FROM candidates").fetchone()
+            shared = self._conn.execute(
+                "SELECT COUNT(*) FROM (SELECT key FROM candidates GROUP BY key "
+                "HAVING COUNT(DISTINCT session_id) > 1)").fetchone()[0]
+        return {'candidates': n, 'keys': keys, 'keys_in_multiple_sessions': shared}
+
+    def rebuild(self, vault_dir=VAULT_DIR, voice_id=fish_client.FISH_VOICE_ID,
+                sample_rate=fish_client.SAMPLE_RATE):
+        """Index every candidate in every vault session (meta + manifest emotion)."""
+        added = 0
+        for session_dir in sorted(Path(vault_dir).iterdir()):
+            if not session_dir.is_dir() or session_dir.name.endswith(_SKIP_SUFFIXES):
+                continue
+            manifest_path = session_dir / 'session-manifest.json'
+            emotion = 'calm'
+            if manifest_path.exists():
+                emotion = json.loads(manifest_path.read_text()).get('emotion', 'calm')
+
+            for meta_path in sorted(session_dir.glob("c[0-9][0-9]/c[0-9][0-9]_meta.json")):
+                meta = json.loads(meta_path.read_text())
+                key = library_key(fish_client.build_payload(
+                    meta['text'], emotion=emotion, sample_rate=sample_rate,
+                    voice_id=voice_id))
+                for c in meta.get('candidates', []):
+                    if c.get('error') or c.get('library_source'):
+                        continue
+                    wav_path = meta_path.parent / c['filename']
+                    if not wav_path.exists():
+                        continue
+                    self.add(key, wav_path, session_dir.name, meta['chunk_index'],
+                             c['version'], c.get('quality_score'), c.get('filtered', False))
+                    added += 1
+        return added
+
+
+_default_library = None
+
+
+def default_library():
+    """Process-wide CandidateLibrary at LIBRARY_PATH (opened on first use)."""
+    global _default_library
+    if _default_library is None:
+        _default_library = CandidateLibrary()
+    return _default_library
+
+
+def main():
+    if len(sys.argv) != 2 or sys.argv[1] not in ('stats', 'rebuild'):
+        print(__doc__)
+        sys.exit(1)
+    lib = default_library()
+    if sys.argv[1] == 'rebuild':
+        print(f"Indexed {lib.rebuild()} candidates")
+    print(json.dumps(lib.stats(), indent=2))
+
+
+if __name__ == '__main__':
+    main()
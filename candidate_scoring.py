@@ -0,0 +1,61 @@
+"""
+Process-pool entry point for vault candidate scoring.
+
+vault-builder.py fans candidate scoring out across a ProcessPoolExecutor.
+Worker processes (spawn on macOS) unpickle the task function by module name,
+which is impossible for the hyphenated scripts loaded via importlib — so the
+task function lives here, in a plain importable module, and loads
+audio-features.py itself inside the worker.
+"""
+
+import importlib.util
+import wave
+from pathlib import Path
+
+import profiling
+
+# Feature families auto-picker's precompute_gate_scores reads
+PICKER_FAMILIES = ['gate16', 'echo_v2', 'breakout']
+
+_af_mod = None
+
+
+def _audio_features():
+    global _af_mod
+    if _af_mod is None:
+        spec = importlib.util.spec_from_file_location(
+            "audio_features", Path(__file__).parent / "audio-features.py")
+        _af_mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(_af_mod)
+    return _af_mod
+
+
+def wav_duration(wav_path):
+    """Duration in seconds from the WAV header (same value ffprobe reports for PCM)."""
+    with wave.open(str(wav_path), 'rb') as wf:
+        return wf.getnframes() / wf.getframerate()
+
+
+@profiling.span('candidate_features', 'score')
+def candidate_features(wav_path, picker_features=False):
+    """Quality details, MFCC profile and duration for one candidate WAV.
+
+    Features come from the shared feature store, so already-scored audio
+    costs a hash lookup instead of a decode. Safe to call from threads or
+    worker processes. picker_features=True also extracts auto-picker's gate
+    families (PICKER_FAMILIES) from the same decode, for adaptive waves.
+    """
+    store = _audio_features().default_store()
+    families = ['quality', 'mfcc_profile']
+    if picker_features:
+        feats = store.features(str(wav_path), families + PICKER_FAMILIES,
+                               skip_errors=True)
+        if not all(f in feats for f in families):
+            feats = store.features(str(wav_path), families)  # re-raise the error
+    else:
+        feats = store.features(str(wav_path), families)
+    return {
+        'quality': feats['quality'],
+        'mfcc_profile': feats['mfcc_profile'],
+        'duration': wav_duration(wav_path),
+    }
@@ -21,6 +21,7 @@ Usage:
 """
 
 import argparse
+import importlib.util
 import json
 import sys
 from collections import Counter
@@ -31,11 +32,18 @@ import librosa
 from scipy.signal import hilbert, lfilter
 from scipy.stats import mannwhitneyu
 
+# Shared feature store (hyphenated filename → importlib)
+_af_spec = importlib.util.spec_from_file_location(
+    "audio_features", Path(__file__).parent / "audio-features.py")
+_af_mod = importlib.util.module_from_spec(_af_spec)
+_af_spec.loader.exec_module(_af_mod)
+
 SR = 22050
 MIN_DELAY_MS = 15
 MAX_DELAY_MS = 200
 FRAME_SIZE = 4096
 HOP_SIZE = 1024
+EXTRACTOR_VERSION = 1  # Bump when any *_features() maths changes (feature store key)
 
 VAULT_DIR = Path("content/audio-free/vault")
 V5_TEST_DIR = Path("reference/v5-test")
@@ -428,6 +436,13 @@ def extract_all_features(wav_path, sr=SR):
     return features
 
 
+def cached_features(wav_path):
+    """extract_all_features() via the shared feature store (audio-features.py),
+    keyed by WAV content hash + EXTRACTOR_VERSION."""
+    return _af_mod.default_store().cached(
+        wav_path, "echo_detector_v2", EXTRACTOR_VERSION, extract_all_features)
+
+
 # ─── Validation ──────────────────────────────────────────────────────
 
 def load_validation_data():
@@ -525,7 +540,7 @@ def validate(verbose=False):
 
     print("Extracting features...")
     for i, sample in enumerate(samples):
-        features = extract_all_features(sample["wav_path"])
+        features = cached_features(sample["wav_path"])
         sample["features"] = features
         if (i + 1) % 10 == 0:
             print(f"  {i+1}/{len(samples)}")
@@ -709,7 +724,7 @@ def validate(verbose=False):
 
 def analyze_file(wav_path):
     """Analyze a single WAV file."""
-    features = extract_all_features(wav_path)
+    features = cached_features(wav_path)
     if features is None:
         print("ERROR: Could not extract features (file too short?)")
         return
@@ -0,0 +1,384 @@
+"""
+Fish Audio TTS client with a shared adaptive rate limiter.
+
+Every Fish request in this repo (vault-builder / vault-topup, the
+narrator-welcome batch, the repair tools) goes through FishClient, and every
+FishClient in a process shares one AdaptiveRateLimiter (shared_limiter()),
+so concurrent sessions draw from the same budget instead of each backing
+off on its own:
+
+  - token bucket (GCRA form): requests start at most `rate`/s, `burst` at once
+  - AIMD: each clean 200 adds INCREASE_STEP req/s; a 429 halves the rate
+  - Retry-After on a 429 pauses the whole bucket, not just the one request
+  - stats(): achieved req/s, p50/p95 latency, 429 count, current rate
+
+A plain importable module (not hyphenated + importlib) on purpose: the
+limiter is process-wide state, and each importlib load would make its own.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import numpy as np
+
+import profiling
+
+FISH_API_URL = "https://api.fish.audio/v1/tts"
+FISH_VOICE_ID = "0165567b33324f518b02336ad232e31a"
+SAMPLE_RATE = 44100
+
+# Limiter defaults — start near the Elevated-tier ceiling and let AIMD find it
+INITIAL_RATE = 8.0      # req/s
+MIN_RATE = 0.5
+MAX_RATE = 40.0
+BURST = 15              # matches vault-builder MAX_CONCURRENT
+INCREASE_STEP = 0.05    # req/s added per successful request
+DECREASE_FACTOR = 0.5   # multiplicative cut on 429
+MAX_ATTEMPTS = 4
+STREAM_CHUNK = 64 * 1024  # bytes per write when streaming a response to disk
+
+
+def _now_iso():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def parse_retry_after(value):
+    """Retry-After header → seconds (delta-seconds or HTTP-date), None if absent/bad."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimited(Exception):
+    """Fish returned 429 on every attempt."""
+
+
+class AdaptiveRateLimiter:
+    """Thread-safe AIMD token bucket shared by every Fish caller in a process.
+
+    acquire() (async) and acquire_blocking() (sync) reserve the next start
+    slot and sleep until it; the bookkeeping is plain arithmetic under a
+    threading.Lock, so one limiter serves any number of event loops/threads.
+    """
+
+    def __init__(self, rate=INITIAL_RATE, min_rate=MIN_RATE, max_rate=MAX_RATE,
+                 burst=BURST, increase_step=INCREASE_STEP,
+                 decrease_factor=DECREASE_FACTOR):
+        self.rate = float(rate)
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate)
+        self.burst = max(1, int(burst))
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+
+        self._lock = threading.Lock()
+        self._next_slot = 0.0       # monotonic time of the next free start slot
+        self._paused_until = 0.0    # Retry-After / backoff pause for everyone
+        self._last_decrease = 0.0
+
+        self._latencies = deque(maxlen=4096)
+        self._first_ts = None
+        self._last_ts = None
+        self._completed = 0
+        self._throttled = 0
+        self._errors = 0
+
+    # -- Scheduling --------------------------------------------------------
+
+    def _reserve(self):
+        """Claim the next start slot; returns seconds to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            interval = 1.0 / self.rate
+            slot = max(self._next_slot,
+                       now - (self.burst - 1) * interval,
+                       self._paused_until)
+            self._next_slot = slot + interval
+            return max(0.0, slot - now)
+
+    async def acquire(self):
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_blocking(self):
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    # -- Feedback ----------------------------------------------------------
+
+    def on_success(self, latency):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+            self._record(latency)
+
+    def on_throttle(self, started, retry_after=None, fallback_wait=1.0):
+        """A 429 for a request sent at `started` (time.monotonic()): halve the
+        rate and pause the bucket.
+
+        Only a request sent after the last decrease cuts the rate again —
+        429s from requests already in flight at the cut share it.
+        Returns the wait the caller should sleep before retrying.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._throttled += 1
+            if started > self._last_decrease:
+                self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+                self._last_decrease = now
+            wait = retry_after if retry_after is not None else fallback_wait
+            self._paused_until = max(self._paused_until, now + wait)
+            self._next_slot = max(self._next_slot, self._paused_until)
+            return wait
+
+    def on_error(self):
+        with self._lock:
+            self._errors += 1
+
+    def _record(self, latency):
+        now = time.monotonic()
+        if self._first_ts is None:
+            self._first_ts = now - latency
+        self._last_ts = now
+        self._completed += 1
+        self._latencies.append(latency)
+
+    # -- Reporting ---------------------------------------------------------
+
+    def stats(self):
+        """Achieved throughput, latency percentiles and limiter state."""
+        with self._lock:
+            lat = np.array(self._latencies) if self._latencies else None
+            span = ((self._last_ts - self._first_ts)
+                    if self._completed and self._last_ts > self._first_ts else 0.0)
+            return {
+                'completed': self._completed,
+                'throttled': self._throttled,
+                'errors': self._errors,
+                'achieved_rps': round(self._completed / span, 2) if span else 0.0,
+                'p50_latency_s': round(float(np.percentile(lat, 50)), 2) if lat is not None else None,
+                'p95_latency_s': round(float(np.percentile(lat, 95)), 2) if lat is not None else None,
+                'current_rate': round(self.rate, 2),
+            }
+
+    def format_stats(self):
+        s = self.stats()
+        p50 = f"{s['p50_latency_s']:.2f}s" if s['p50_latency_s'] is not None else "—"
+        p95 = f"{s['p95_latency_s']:.2f}s" if s['p95_latency_s'] is not None else "—"
+        return (f"Fish API: {s['completed']} ok, {s['throttled']} × 429, "
+                f"{s['errors']} errors | {s['achieved_rps']:.2f} req/s "
+                f"(limit {s['current_rate']:.2f}) | p50 {p50} p95 {p95}")
+
+
+_shared_limiter = None
+_shared_lock = threading.Lock()
+
+
+def shared_limiter():
+    """The process-wide limiter every FishClient uses by default."""
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = AdaptiveRateLimiter()
+        return _shared_limiter
+
+
+def build_payload(text, emotion='calm', references=None, sample_rate=SAMPLE_RATE,
+                  fmt='mp3', voice_id=FISH_VOICE_ID):
+    """Standard Salus TTS payload (v3-hd, temp 0.3, speed 0.95)."""
+    payload = {
+        "text": text,
+        "reference_id": voice_id,
+        "format": fmt,
+        "temperature": 0.3,
+        "version": "v3-hd",
+        "emotion": emotion,
+        "prosody": {"speed": 0.95, "volume": 0},
+        "sample_rate": sample_rate,
+    }
+    if references:
+        payload["references"] = references
+    return payload
+
+
+class FishClient:
+    """Fish TTS requests gated by an AdaptiveRateLimiter.
+
+    Retry policy matches the old per-script loops: up to MAX_ATTEMPTS,
+    429 → wait Retry-After (else 2**attempt+1 s), timeout / connection
+    error → 2**attempt s, any other non-200 → raise immediately.
+    """
+
+    def __init__(self, api_key, limiter=None, url=FISH_API_URL):
+        self.api_key = api_key
+        self.limiter = limiter or shared_limiter()
+        self.url = url
+
+    @property
+    def headers(self):
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+    def _log(self, api_log, call_id, status, attempt, **extra):
+        if api_log is not None:
+            api_log.append({'call_id': call_id, 'status': status,
+                            'attempt': attempt, 'ts': _now_iso(), **extra})
+
+    @profiling.span('fish.tts', 'api')
+    async def synthesize(self, http_session, payload, call_id=None, api_log=None,
+                         timeout=300, attempts=MAX_ATTEMPTS, dest=None):
+        """POST one TTS request via aiohttp.
+
+        Returns the audio bytes, or with `dest` streams the body to that path
+        in STREAM_CHUNK pieces (via `<dest>.part`) and returns the path, so
+        memory per in-flight request stays bounded. `dest` may also be a
+        seekable binary file object (e.g. a SpooledTemporaryFile): the body
+        is streamed into it, rewound and the object returned.
+        """
+        import aiohttp
+
+        profiling.annotate(call_id=call_id, chars=len(payload.get('text', '')))
+        started = time.time()
+        last_err = None
+        for attempt in range(attempts):
+            await self.limiter.acquire()
+            t0 = time.monotonic()
+            try:
+                async with http_session.post(
+                    self.url, json=payload, headers=self.headers,
+                    timeout=aiohttp.ClientTimeout(total=timeout)
+                ) as resp:
+                    if resp.status == 429:
+                        wait = self.limiter.on_throttle(
+                            t0, parse_retry_after(resp.headers.get('Retry-After')),
+                            fallback_wait=2 ** attempt + 1)
+                        print(f"      429 rate-limit → wait {wait:.0f}s")
+                        self._log(api_log, call_id, 429, attempt)
+                        last_err = "429 rate-limit"
+                        await asyncio.sleep(wait)
+                        continue
+                    if resp.status != 200:
+                        body = await resp.text()
+                        self.limiter.on_error()
+                        raise Exception(f"Fish API {resp.status}: {body[:200]}")
+                    if dest is None:
+                        data = await resp.read()
+                    elif hasattr(dest, 'write'):
+                        dest.seek(0)
+                        dest.truncate()  # a retry after a broken stream starts over
+                        async for block in resp.content.iter_chunked(STREAM_CHUNK):
+                            dest.write(block)
+                        dest.seek(0)
+                        data = dest
+                    else:
+                        part = str(dest) + ".part"
+                        try:
+                            with open(part, 'wb') as f:
+                                async for block in resp.content.iter_chunked(STREAM_CHUNK):
+                                    f.write(block)
+                        except BaseException:
+                            _remove(part)
+                            raise
+                        os.replace(part, dest)
+                        data = str(dest)
+            except asyncio.TimeoutError:
+                self.limiter.on_error()
+                last_err = "timeout"
+                if attempt < attempts - 1:
+                    await asyncio.sleep(2 ** attempt)
+                continue
+            except aiohttp.ClientError as e:
+                self.limiter.on_error()
+                last_err = str(e)
+                if attempt < attempts - 1:
+                    await asyncio.sleep(2 ** attempt)
+                continue
+
+            self.limiter.on_success(time.monotonic() - t0)
+            self._log(api_log, call_id, 200, attempt,
+                      elapsed_s=round(time.time() - started, 2),
+                      chars=len(payload.get('text', '')))
+            return data
+
+        if last_err == "429 rate-limit":
+            raise RateLimited(f"Failed after {attempts} attempts: {last_err}")
+        raise Exception(f"Failed after {attempts} attempts: {last_err}")
+
+    @profiling.span('fish.tts', 'api')
+    def synthesize_sync(self, payload, call_id=None, api_log=None, timeout=300,
+                        attempts=MAX_ATTEMPTS, dest=None):
+        """Blocking variant (requests) for the sequential scripts; `dest` a path as above."""
+        import requests
+
+        profiling.annotate(call_id=call_id, chars=len(payload.get('text', '')))
+        started = time.time()
+        last_err = None
+        for attempt in range(attempts):
+            self.limiter.acquire_blocking()
+            t0 = time.monotonic()
+            try:
+                resp = requests.post(self.url, json=payload, headers=self.headers,
+                                     timeout=timeout, stream=dest is not None)
+                if resp.status_code == 200 and dest is not None:
+                    part = str(dest) + ".part"
+                    try:
+                        with open(part, 'wb') as f:
+                            for block in resp.iter_content(STREAM_CHUNK):
+                                f.write(block)
+                    except BaseException:
+                        _remove(part)
+                        raise
+                    os.replace(part, dest)
+            except (requests.Timeout, requests.ConnectionError,
+                    requests.exceptions.ChunkedEncodingError) as e:
+                self.limiter.on_error()
+                last_err = str(e)
+                if attempt < attempts - 1:
+                    time.sleep(2 ** attempt)
+                continue
+
+            if resp.status_code == 429:
+                wait = self.limiter.on_throttle(
+                    t0, parse_retry_after(resp.headers.get('Retry-After')),
+                    fallback_wait=2 ** attempt + 1)
+                print(f"      429 rate-limit -> wait {wait:.0f}s")
+                self._log(api_log, call_id, 429, attempt)
+                last_err = "429 rate-limit"
+                time.sleep(wait)
+                continue
+            if resp.status_code != 200:
+                self.limiter.on_error()
+                raise Exception(f"Fish API {resp.status_code}: {resp.text[:200]}")
+
+            self.limiter.on_success(time.monotonic() - t0)
+            self._log(api_log, call_id, 200, attempt,
+                      elapsed_s=round(time.time() - started, 2),
+                      chars=len(payload.get('text', '')))
+            return resp.content if dest is None else str(dest)
+
+        if last_err == "429 rate-limit":
+            raise RateLimited(f"Failed after {attempts} attempts: {last_err}")
+        raise Exception(f"Failed after {attempts} attempts: {last_err}")
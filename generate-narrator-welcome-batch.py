@@ -4,7 +4,7 @@ Generate 20 new Fish Audio candidates for each of the 5 chunks (c00-c04)
 in the narrator-welcome vault session.
 
 - Sequential by chunk (tonal scoring requires previous chunk's best MFCC)
-- 2-second delay between API calls
+- Paced by the shared Fish rate limiter (fish_client.py)
 - Scores each candidate
 - Uploads each WAV to R2
 - Updates meta.json per chunk
@@ -21,6 +21,8 @@ from pathlib import Path
 
 os.chdir(Path(__file__).parent)
 
+import fish_client
+
 # ---------------------------------------------------------------------------
 # Load build-session-v3.py scoring functions
 # ---------------------------------------------------------------------------
@@ -42,7 +44,6 @@ FISH_API_KEY = "0f3ab7558feb4983bc7b4c623ad38eef"
 SAMPLE_RATE = 44100
 SCORE_FILTER_THRESHOLD = 0.30
 CANDIDATES_PER_CHUNK = 20
-DELAY_BETWEEN_CALLS = 2.0  # seconds
 
 ALL_CHUNKS = ["c00", "c01", "c02", "c03", "c04", "c05"]
 # Only generate for new/changed chunks (c01 & c02 are rescripted)
@@ -55,46 +56,13 @@ def now_iso():
 
 def fish_tts_call(text, wav_path):
     """Call Fish Audio TTS API, save as WAV."""
-    import requests
-
     mp3_tmp = str(wav_path) + ".tmp.mp3"
 
-    payload = {
-        "text": text,
-        "reference_id": FISH_VOICE_ID,
-        "format": "mp3",
-        "temperature": 0.3,
-        "version": "v3-hd",
-        "emotion": "calm",
-        "prosody": {"speed": 0.95, "volume": 0},
-        "sample_rate": SAMPLE_RATE,
-    }
-    headers = {
-        "Authorization": f"Bearer {FISH_API_KEY}",
-        "Content-Type": "application/json",
-    }
-
-    for attempt in range(4):
-        try:
-            resp = requests.post(FISH_API_URL, json=payload, headers=headers, timeout=300)
-            if resp.status_code == 429:
-                wait = 2 ** attempt + 1
-                print(f"      429 rate-limit -> wait {wait}s")
-                time.sleep(wait)
-                continue
-            if resp.status_code != 200:
-                raise Exception(f"Fish API {resp.status_code}: {resp.text[:200]}")
-            Path(mp3_tmp).write_bytes(resp.content)
-            break
-        except Exception as e:
-            if attempt < 3 and ("timeout" in str(e).lower() or "429" in str(e)):
-                time.sleep(2 ** attempt)
-                continue
-            if attempt == 3:
-                raise
-            raise
-    else:
-        raise Exception("Failed after 4 attempts")
+    payload = fish_client.build_payload(text, emotion="calm",
+                                        sample_rate=SAMPLE_RATE,
+                                        voice_id=FISH_VOICE_ID)
+    client = fish_client.FishClient(FISH_API_KEY, url=FISH_API_URL)
+    client.synthesize_sync(payload, dest=mp3_tmp)
 
     # Convert MP3 -> WAV
     subprocess.run([
@@ -113,8 +81,9 @@ def fish_tts_call(text, wav_path):
 
 def score_wav(wav_path, prev_mfcc=None):
     """Score a WAV candidate. Returns (details_dict, mfcc_array)."""
-    details = build.score_chunk_quality(str(wav_path))
-    mfcc = build.compute_mfcc_profile(str(wav_path))
+    features = build.load_audio_features(str(wav_path))
+    details = build.score_chunk_quality(str(wav_path), features=features)
+    mfcc = build.compute_mfcc_profile(str(wav_path), features=features)
 
     quality = details['score']
     tone_dist = build.tonal_distance(prev_mfcc, mfcc)
@@ -254,10 +223,6 @@ def process_chunk(chunk_id, chunk_idx, prev_best_mfcc):
                 'generated_at': now_iso(),
             })
 
-        # Rate limit between calls
-        if i < CANDIDATES_PER_CHUNK - 1:
-            time.sleep(DELAY_BETWEEN_CALLS)
-
     # Update meta with new candidates appended
     meta['candidates'].extend(new_candidates)
     with open(meta_path, 'w') as f:
@@ -312,7 +277,7 @@ def main():
     print(f"  NARRATOR-WELCOME: {CANDIDATES_PER_CHUNK} candidates x {len(CHUNKS)} chunks = {CANDIDATES_PER_CHUNK * len(CHUNKS)} API calls")
     print(f"  Chunks: {', '.join(CHUNKS)}")
     print(f"  Started: {now_iso()}")
-    print(f"  Rate limit: {DELAY_BETWEEN_CALLS}s between calls")
+    print(f"  Rate limit: adaptive (start {fish_client.INITIAL_RATE:g} req/s)")
     print("=" * 70)
 
     start_time = time.time()
@@ -338,6 +303,7 @@ def main():
     secs = int(elapsed % 60)
     print(f"\n{'='*70}")
     print(f"  ALL DONE: {mins}m {secs}s elapsed")
+    print(f"  {fish_client.shared_limiter().format_stats()}")
     print(f"  Finished: {now_iso()}")
     print(f"{'='*70}")
 
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Native EBU R128 / ITU-R BS.1770 loudness measurement and linear normalisation.
+
+vault-assemble.py and build-session-v3.py used ffmpeg's single-pass
+loudnorm=I=-26:TP=-2:LRA=11 — slow on 30-minute masters (it upsamples to
+192kHz) and re-measured from scratch on every auto-rebuild round even when
+the audio had not changed.
+
+This module measures on int16 numpy buffers in fixed-size blocks:
+
+  - K-weighting (BS.1770 pre-filter + RLB high-pass) with filter state
+    carried between blocks;
+  - K-weighted energy per 100ms hop — the unit everything else is built on:
+    400ms gating blocks (integrated loudness, -70 LUFS absolute / -10 LU
+    relative gate) and 3s short-term blocks every 1s (LRA, EBU Tech 3342);
+  - true peak via 4x polyphase oversampling.
+
+Normalisation is a linear two-pass gain: measure, then scale so integrated
+loudness hits the target unless that would push true peak above the ceiling,
+in which case the peak ceiling wins. No dynamic compression.
+
+Per-hop energies are cached in the feature store keyed by a hash of the
+segment's samples. An assembled session is measured as the concatenation of
+its segments' hop energies (silences are zero runs and cost nothing), so
+re-assembly after a single-chunk swap only measures the new chunk.
+
+Usage (library):
+    samples, sr = read_pcm16("final/session-vault-raw.wav")
+    normed, report = loudnorm(samples, sr)              # I=-26, TP=-2
+    m = combine([measure_segment(seg, sr) for seg in segments])
+    summarise(m)   # {'integrated': -26.0, 'true_peak': -3.1, 'lra': 6.2}
+
+Usage (CLI):
+    python3 loudness-r128.py path/to/audio.wav
+"""
+
+import hashlib
+import importlib.util
+import json
+import subprocess
+import sys
+import wave
+from pathlib import Path
+
+import numpy as np
+from scipy.signal import resample_poly, sosfilt
+
+TARGET_I = -26.0
+TARGET_TP = -2.0
+TARGET_LRA = 11.0
+
+HOP_SEC = 0.1
+MOMENTARY_HOPS = 4        # 400ms gating block, 75% overlap
+SHORT_TERM_HOPS = 30      # 3s short-term block
+SHORT_TERM_STRIDE = 10    # one LRA block per second
+ABS_GATE = -70.0
+REL_GATE_I = -10.0
+REL_GATE_LRA = -20.0
+TP_OVERSAMPLE = 4
+TP_PAD = 32               # input samples of context around each oversampled block
+BLOCK_HOPS = 100          # hops per K-weighting block (10s)
+BLOCK_SAMPLES = 441000    # samples per true-peak / gain block
+
+CACHE_FAMILY = 'r128_hops'
+CACHE_VERSION = 1
+
+_af_mod = None
+
+
+def _audio_features():
+    global _af_mod
+    if _af_mod is None:
+        spec = importlib.util.spec_from_file_location(
+            "audio_features", Path(__file__).parent / "audio-features.py")
+        _af_mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(_af_mod)
+    return _af_mod
+
+
+# ---------------------------------------------------------------------------
+# I/O
+# ---------------------------------------------------------------------------
+
+def read_pcm16(path, sample_rate=44100):
+    """Return (int16 samples shaped (n, channels), sample_rate).
+
+    16-bit WAVs are read directly; anything else is decoded by ffmpeg to
+    16-bit PCM at `sample_rate`, keeping its channel count.
+    """
+    try:
+        with wave.open(str(path), 'rb') as wf:
+            if wf.getsampwidth() == 2:
+                nc = wf.getnchannels()
+                data = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+                return data.reshape(-1, nc), wf.getframerate()
+    except (wave.Error, EOFError):
+        pass
+
+    probe = subprocess.run(
+        ['ffprobe', '-v', 'quiet', '-show_entries', 'stream=channels',
+         '-of', 'csv=p=0', str(path)], capture_output=True, text=True)
+    nc = int(probe.stdout.strip() or 1)
+    result = subprocess.run([
+        'ffmpeg', '-y', '-i', str(path), '-ar', str(sample_rate),
+        '-f', 's16le', '-acodec', 'pcm_s16le', 'pipe:1'
+    ], capture_output=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to decode {path}: {result.stderr[:500]}")
+    return np.frombuffer(result.stdout, dtype=np.int16).reshape(-1, nc), sample_rate
+
+
+def write_pcm16(samples, sample_rate, path):
+    samples = _as_2d(samples)
+    with wave.open(str(path), 'wb') as wf:
+        wf.setnchannels(samples.shape[1])
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(np.ascontiguousarray(samples, dtype=np.int16).tobytes())
+
+
+def _as_2d(samples):
+    return samples.reshape(-1, 1) if samples.ndim == 1 else samples
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def k_weighting_sos(sample_rate):
+    """BS.1770 K-weighting as second-order sections for any sample rate
+    (the standard's 48kHz coefficients re-derived via the bilinear transform)."""
+    # Stage 1: high-shelf pre-filter (head acoustics)
+    f0, gain_db, q = 1681.974450955533, 3.999843853973347, 0.7071752369554196
+    k = np.tan(np.pi * f0 / sample_rate)
+    vh = 10 ** (gain_db / 20)
+    vb = vh ** 0.4996667741545416
+    a0 = 1 + k / q + k * k
+    shelf = [(vh + vb * k / q + k * k) / a0, 2 * (k * k - vh) / a0,
+             (vh - vb * k / q + k * k) / a0,
+             1.0, 2 * (k * k - 1) / a0, (1 - k / q + k * k) / a0]
+    # Stage 2: RLB high-pass
+    f0, q = 38.13547087602444, 0.5003270373238773
+    k = np.tan(np.pi * f0 / sample_rate)
+    a0 = 1 + k / q + k * k
+    highpass = [1.0, -2.0, 1.0,
+                1.0, 2 * (k * k - 1) / a0, (1 - k / q + k * k) / a0]
+    return np.array([shelf, highpass])
+
+
+def hop_size(sample_rate):
+    return int(round(sample_rate * HOP_SEC))
+
+
+def hop_energies(samples, sample_rate):
+    """K-weighted energy (sum of squares, channels summed) and sample count
+    per 100ms hop. The last hop may be short."""
+    x = _as_2d(samples)
+    n, nc = x.shape
+    hop = hop_size(sample_rate)
+    n_hops = -(-n // hop)
+    energy = np.zeros(n_hops)
+    count = np.full(n_hops, hop, dtype=np.int64)
+    if n_hops:
+        count[-1] = n - hop * (n_hops - 1)
+
+    sos = k_weighting_sos(sample_rate)
+    zi = np.zeros((sos.shape[0], 2, nc))
+    step = hop * BLOCK_HOPS
+    for start in range(0, n, step):
+        block = x[start:start + step].astype(np.float64) / 32768.0
+        y, zi = sosfilt(sos, block, axis=0, zi=zi)
+        sq = np.einsum('ij,ij->i', y, y)
+        h0 = start // hop
+        full = len(sq) // hop
+        energy[h0:h0 + full] = sq[:full * hop].reshape(full, hop).sum(axis=1)
+        if len(sq) % hop:
+            energy[h0 + full] = sq[full * hop:].sum()
+    return energy, count
+
+
+def true_peak(samples):
+    """Linear true peak (full scale = 1.0) via 4x oversampling, block by block."""
+    x = _as_2d(samples)
+    n = len(x)
+    peak = max(-int(x.min()), int(x.max())) / 32768.0 if n else 0.0
+    step = BLOCK_SAMPLES
+    for start in range(0, n, step):
+        lo = max(0, start - TP_PAD)
+        hi = min(n, start + step + TP_PAD)
+        y = resample_poly(x[lo:hi].astype(np.float64) / 32768.0,
+                          TP_OVERSAMPLE, 1, axis=0)
+        keep = y[(start - lo) * TP_OVERSAMPLE:(min(n, start + step) - lo) * TP_OVERSAMPLE]
+        if len(keep):
+            peak = max(peak, float(np.abs(keep).max()))
+    return peak
+
+
+def segment_hash(samples, sample_rate):
+    x = np.ascontiguousarray(_as_2d(samples), dtype=np.int16)
+    h = hashlib.sha256(f"{sample_rate}:{x.shape[1]}:".encode())
+    h.update(x.tobytes())
+    return h.hexdigest()
+
+
+def measure_segment(samples, sample_rate, cache=True):
+    """{'energy', 'count', 'peak'} for one buffer, from the feature store
+    when this exact audio has been measured before."""
+    store = digest = None
+    if cache:
+        store = _audio_features().default_store()
+        digest = segment_hash(samples, sample_rate)
+        found, value = store.get(digest, CACHE_FAMILY, CACHE_VERSION)
+        if found:
+            return value
+    energy, count = hop_energies(samples, sample_rate)
+    value = {'energy': energy, 'count': count, 'peak': true_peak(samples)}
+    if cache:
+        store.put(digest, CACHE_FAMILY, CACHE_VERSION, value)
+    return value
+
+
+def silence_measurement(n_samples, sample_rate):
+    """Measurement of n_samples of digital silence (never cached)."""
+    hop = hop_size(sample_rate)
+    n_hops = -(-n_samples // hop)
+    count = np.full(n_hops, hop, dtype=np.int64)
+    if n_hops:
+        count[-1] = n_samples - hop * (n_hops - 1)
+    return {'energy': np.zeros(n_hops), 'count': count, 'peak': 0.0}
+
+
+def combine(measurements):
+    """Measurement of the concatenation of several segments.
+
+    Filter state restarts at each segment and a short trailing hop stays
+    short; with faded chunk edges and silence between them the difference
+    from measuring the spliced buffer is a few hundredths of an LU.
+    """
+    measurements = list(measurements)
+    if not measurements:
+        return silence_measurement(0, 44100)
+    return {
+        'energy': np.concatenate([np.asarray(m['energy'], dtype=np.float64)
+                                  for m in measurements]),
+        'count': np.concatenate([np.asarray(m['count'], dtype=np.int64)
+                                 for m in measurements]),
+        'peak': max(m['peak'] for m in measurements),
+    }
+
+
+def _window_powers(energy, count, hops, stride):
+    if len(energy) < hops:
+        return np.zeros(0)
+    ce = np.concatenate([[0.0], np.cumsum(energy)])
+    cc = np.concatenate([[0], np.cumsum(count)])
+    starts = np.arange(0, len(energy) - hops + 1, stride)
+    return (ce[starts + hops] - ce[starts]) / (cc[starts + hops] - cc[starts])
+
+
+def _lufs(power):
+    return -0.691 + 10 * np.log10(np.maximum(power, 1e-20))
+
+
+def _gated(powers, relative_gate):
+    powers = powers[_lufs(powers) > ABS_GATE]
+    if not len(powers):
+        return powers
+    threshold = _lufs(powers.mean()) + relative_gate
+    return powers[_lufs(powers) > threshold]
+
+
+def integrated_loudness(m):
+    powers = _gated(_window_powers(m['energy'], m['count'], MOMENTARY_HOPS, 1),
+                    REL_GATE_I)
+    return float(_lufs(powers.mean())) if len(powers) else float('-inf')
+
+
+def loudness_range(m):
+    powers = _gated(_window_powers(m['energy'], m['count'],
+                                   SHORT_TERM_HOPS, SHORT_TERM_STRIDE),
+                    REL_GATE_LRA)
+    if len(powers) < 2:
+        return 0.0
+    levels = _lufs(powers)
+    return float(np.percentile(levels, 95) - np.percentile(levels, 10))
+
+
+def summarise(m):
+    """Integrated loudness (LUFS), true peak (dBTP) and LRA (LU)."""
+    return {
+        'integrated': integrated_loudness(m),
+        'true_peak': float(20 * np.log10(max(m['peak'], 1e-10))),
+        'lra': loudness_range(m),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Normalisation
+# ---------------------------------------------------------------------------
+
+def normalisation_gain(summary, target_i=TARGET_I, target_tp=TARGET_TP):
+    """Linear gain in dB: reach target_i, capped so true peak stays <= target_tp."""
+    if not np.isfinite(summary['integrated']):
+        return 0.0
+    gain = target_i - summary['integrated']
+    return min(gain, target_tp - summary['true_peak'])
+
+
+def apply_gain(samples, gain_db):
+    """Scale int16 samples by gain_db (rounded, clipped), block by block."""
+    g = 10 ** (gain_db / 20)
+    out = np.empty_like(samples, dtype=np.int16)
+    step = BLOCK_SAMPLES
+    for start in range(0, len(samples), step):
+        block = samples[start:start + step].astype(np.float64) * g
+        out[start:start + step] = np.clip(np.rint(block), -32768, 32767)
+    return out
+
+
+def loudnorm(samples, sample_rate, target_i=TARGET_I, target_tp=TARGET_TP,
+             measurement=None, cache=True, gain_db=None):
+    """Two-pass linear loudness normalisation of an int16 buffer.
+
+    Pass `measurement` (e.g. combine() over cached segment measurements) to
+    skip the measuring pass, and `gain_db` to apply an already-chosen gain
+    instead of the computed one. Returns (normalised samples, report).
+    """
+    if measurement is None:
+        measurement = measure_segment(samples, sample_rate, cache=cache)
+    before = summarise(measurement)
+    gain = normalisation_gain(before, target_i, target_tp) if gain_db is None else gain_db
+    report = {
+        'input_i': round(before['integrated'], 2),
+        'input_tp': round(before['true_peak'], 2),
+        'input_lra': round(before['lra'], 2),
+        'gain_db': round(gain, 2),
+        'output_i': round(before['integrated'] + gain, 2),
+        'output_tp': round(before['true_peak'] + gain, 2),
+    }
+    if before['lra'] > TARGET_LRA:
+        report['lra_over_target'] = True
+    return apply_gain(samples, gain), report
+
+
+def loudnorm_file(input_path, output_path, target_i=TARGET_I, target_tp=TARGET_TP):
+    """File wrapper for loudnorm(): any audio in, 16-bit WAV out."""
+    samples, sr = read_pcm16(input_path)
+    normed, report = loudnorm(samples, sr, target_i, target_tp)
+    write_pcm16(normed, sr, output_path)
+    return report
+
+
+def main():
+    if len(sys.argv) != 2:
+        print(__doc__)
+        sys.exit(1)
+    samples, sr = read_pcm16(sys.argv[1])
+    summary = summarise(measure_segment(samples, sr))
+    summary['gain_to_target_db'] = normalisation_gain(summary)
+    print(json.dumps({k: round(v, 2) for k, v in summary.items()}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,395 @@
+"""
+Opt-in pipeline profiling: spans → Chrome trace + text summary.
+
+Off unless SALUS_PROFILE=1, and then every call here is a cheap no-op.
+When on, each span records wall time, CPU time (the calling thread's), the
+CPU of child processes it waited on, and the process's peak RSS at close.
+
+  run(name)              CLI entry points wrap main in this; at exit the run
+                         directory gets trace.json (Chrome trace-event
+                         format — chrome://tracing or ui.perfetto.dev) and
+                         summary.txt (spans ranked by total wall time)
+  span(name, cat)        context manager, or decorator for sync/async
+                         functions (one span per call)
+  phase(name)            one-line markers for the sequential stages of a
+                         long function: ends the current span's previous
+                         phase and starts the next; the span's exit ends
+                         the last one
+  annotate(**args)       attach arguments (session, chunk, ...) to the
+                         innermost span
+
+Installed automatically when enabled: spans around subprocess.run (named
+after the program — ffmpeg, ffprobe, curl, ...), requests HTTP calls and the
+heavy librosa entry points. Fish TTS, the ASR worker and the QA gates carry
+their own spans.
+
+Pool workers and child scripts inherit the run directory through the
+environment, append their spans to events-<pid>.jsonl there, and the root
+process merges them, so a trace shows every process of the run. Output goes
+under reference/profiles/ (SALUS_PROFILE_OUT overrides).
+
+A plain importable module for the same reason as fish_client.py: the span
+buffer is process-wide state.
+"""
+
+import asyncio
+import atexit
+import contextlib
+import contextvars
+import functools
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+ENABLED = os.getenv('SALUS_PROFILE', '').strip().lower() not in ('', '0', 'false', 'no')
+PROFILE_OUT = Path(os.getenv('SALUS_PROFILE_OUT', 'reference/profiles'))
+RUN_DIR_ENV = '_SALUS_PROFILE_RUN'  # set by the root process for its children
+
+# Spanned when the hooks are installed (module.attribute under librosa)
+LIBROSA_CALLS = (
+    'load', 'stft', 'resample', 'pyin', 'yin', 'piptrack', 'lpc',
+    'feature.mfcc', 'feature.melspectrogram', 'feature.rms', 'feature.delta',
+    'feature.spectral_centroid', 'feature.spectral_contrast', 'feature.spectral_flatness',
+    'feature.spectral_rolloff', 'feature.spectral_bandwidth',
+    'onset.onset_strength', 'onset.onset_detect',
+)
+
+_lock = threading.Lock()
+_events = []
+_stack = contextvars.ContextVar('salus_profile_stack', default=())
+_tids = {}
+_root = None  # {'name', 'dir', 'pid', 't0'} in the process that called run()
+_ran = False
+_T0 = time.perf_counter()
+
+
+def _peak_rss_mb():
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, KiB on Linux
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def _children_cpu():
+    import resource
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _tid():
+    """Trace row: one per thread, and one per asyncio task so concurrent
+    requests on the event loop don't stack on a single row."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    key = ('task', id(task)) if task is not None else ('thread', threading.get_ident())
+    with _lock:
+        if key not in _tids:
+            _tids[key] = (len(_tids) + 1,
+                          task.get_name() if task is not None else threading.current_thread().name)
+        return _tids[key][0]
+
+
+class _Timer:
+    """One open span (or phase) — the measurements taken at its start."""
+
+    __slots__ = ('name', 'cat', 'args', 'ts', 't0', 'c0', 'child0', 'rss0', 'tid', 'phase')
+
+    def __init__(self, name, cat, args):
+        self.name, self.cat, self.args = name, cat, dict(args)
+        self.ts = time.time_ns() // 1000
+        self.t0 = time.perf_counter()
+        self.c0 = time.thread_time()
+        self.child0 = _children_cpu()
+        self.rss0 = _peak_rss_mb()
+        self.tid = _tid()
+        self.phase = None
+
+    def close(self):
+        if self.phase is not None:
+            self.phase.close()
+            self.phase = None
+        wall = time.perf_counter() - self.t0
+        rss = _peak_rss_mb()
+        args = {**self.args,
+                'cpu_s': round(time.thread_time() - self.c0, 4),
+                'rss_peak_mb': round(rss, 1)}
+        child_cpu = _children_cpu() - self.child0
+        if child_cpu > 0:
+            args['child_cpu_s'] = round(child_cpu, 4)
+        if rss > self.rss0:
+            args['rss_growth_mb'] = round(rss - self.rss0, 1)
+        event = {'name': self.name, 'cat': self.cat, 'ph': 'X', 'ts': self.ts,
+                 'dur': round(wall * 1e6), 'pid': os.getpid(), 'tid': self.tid, 'args': args}
+        with _lock:
+            _events.append(event)
+
+
+class span:
+    """Timed span: `with span('mix', 'stage'):` or `@span('build_session')`."""
+
+    def __init__(self, name, cat='stage', **args):
+        self.name, self.cat, self.args = name, cat, args
+        self._timer = None
+        self._token = None
+
+    def __enter__(self):
+        if ENABLED:
+            self._timer = _Timer(self.name, self.cat, self.args)
+            self._token = _stack.set(_stack.get() + (self._timer,))
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._timer is not None:
+            if exc_type is not None:
+                self._timer.args['error'] = exc_type.__name__
+            self._timer.close()
+            _stack.reset(self._token)
+            if not _stack.get():
+                _flush_fragment()
+        return False
+
+    def __call__(self, fn):
+        name, cat, args = self.name, self.cat, self.args
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*a, **kw):
+                with span(name, cat, **args):
+                    return await fn(*a, **kw)
+        else:
+            @functools.wraps(fn)
+            def wrapper(*a, **kw):
+                with span(name, cat, **args):
+                    return fn(*a, **kw)
+        return wrapper
+
+
+def phase(name, **args):
+    """End the innermost span's current phase and start `name` (None: just end)."""
+    if not ENABLED:
+        return
+    stack = _stack.get()
+    if not stack:
+        return
+    parent = stack[-1]
+    if parent.phase is not None:
+        parent.phase.close()
+        parent.phase = None
+    if name is not None:
+        parent.phase = _Timer(f"{parent.name}/{name}", 'phase', args)
+
+
+def annotate(**args):
+    """Add arguments to the innermost open span."""
+    if not ENABLED:
+        return
+    stack = _stack.get()
+    if stack:
+        stack[-1].args.update(args)
+
+
+def _take_events():
+    with _lock:
+        events = list(_events)
+        _events.clear()
+        names = {tid: label for tid, label in _tids.values()}
+    return events, names
+
+
+def _metadata_events(pid, label, thread_names):
+    meta = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0, 'args': {'name': label}}]
+    meta += [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+             for tid, name in thread_names.items()]
+    return meta
+
+
+def _flush_fragment():
+    """Child processes: append finished spans to the run directory."""
+    if _root is not None and _root['pid'] == os.getpid():
+        return
+    run_dir = os.environ.get(RUN_DIR_ENV)
+    if not run_dir or not _events:
+        return
+    events, names = _take_events()
+    label = f"{Path(sys.argv[0]).name if sys.argv and sys.argv[0] else 'python'} [{os.getpid()}]"
+    path = Path(run_dir) / f"events-{os.getpid()}.jsonl"
+    new = not path.exists()
+    with open(path, 'a') as f:
+        for event in (_metadata_events(os.getpid(), label, names) if new else []) + events:
+            f.write(json.dumps(event) + "\n")
+
+
+def _fmt_cmd(cmd):
+    if isinstance(cmd, (list, tuple)):
+        parts = [str(c) for c in cmd]
+    else:
+        parts = str(cmd).split()
+    return (Path(parts[0]).name if parts else '?'), ' '.join(parts)[:200]
+
+
+def install():
+    """Span subprocess.run, requests and the LIBROSA_CALLS (idempotent)."""
+    if getattr(subprocess.run, '_salus_span', False):
+        return
+
+    run_orig = subprocess.run
+
+    @functools.wraps(run_orig)
+    def run(*popenargs, **kwargs):
+        prog, cmd = _fmt_cmd(popenargs[0] if popenargs else kwargs.get('args', ''))
+        with span(prog, 'subprocess', cmd=cmd):
+            return run_orig(*popenargs, **kwargs)
+
+    run._salus_span = True
+    subprocess.run = run
+
+    try:
+        import requests
+    except ImportError:
+        requests = None
+    if requests is not None:
+        request_orig = requests.Session.request
+
+        @functools.wraps(request_orig)
+        def request(self, method, url, *a, **kw):
+            host = re.sub(r'^\w+://', '', str(url)).split('/')[0]
+            with span(f"{method.upper()} {host}", 'api', url=str(url)[:200]):
+                return request_orig(self, method, url, *a, **kw)
+
+        requests.Session.request = request
+
+    try:
+        import librosa
+    except ImportError:
+        return
+    for dotted in LIBROSA_CALLS:
+        *path, attr = dotted.split('.')
+        mod = librosa
+        try:
+            for part in path:
+                mod = getattr(mod, part)
+            fn = getattr(mod, attr)
+        except AttributeError:
+            continue
+        setattr(mod, attr, span(f"librosa.{dotted}", 'librosa')(fn))
+
+
+def _summary(events, name, total_wall):
+    """Text table: spans grouped by (cat, name), ranked by total wall time."""
+    groups = {}
+    pids = set()
+    for ev in events:
+        if ev.get('ph') != 'X':
+            continue
+        pids.add(ev['pid'])
+        g = groups.setdefault((ev['cat'], ev['name']),
+                              {'n': 0, 'wall': 0.0, 'max': 0.0, 'cpu': 0.0, 'child': 0.0, 'rss': 0.0})
+        wall = ev['dur'] / 1e6
+        g['n'] += 1
+        g['wall'] += wall
+        g['max'] = max(g['max'], wall)
+        g['cpu'] += ev['args'].get('cpu_s', 0.0)
+        g['child'] += ev['args'].get('child_cpu_s', 0.0)
+        g['rss'] = max(g['rss'], ev['args'].get('rss_peak_mb', 0.0))
+
+    lines = [
+        f"SALUS PROFILE — {name}",
+        f"  {total_wall:.1f}s wall, {len(pids)} process(es), {sum(g['n'] for g in groups.values())} spans",
+        "  Wall is inclusive of nested spans and sums over concurrent ones;",
+        "  CPU is the calling thread's (CHILD: subprocesses waited on).",
+        "",
+        f"  {'CAT':<10} {'SPAN':<46} {'CALLS':>6} {'WALL s':>9} {'% RUN':>6} "
+        f"{'CPU s':>8} {'CHILD s':>8} {'MAX s':>8} {'PEAK RSS MB':>12}",
+        "  " + "-" * 122,
+    ]
+    for (cat, span_name), g in sorted(groups.items(), key=lambda kv: -kv[1]['wall']):
+        pct = 100 * g['wall'] / total_wall if total_wall else 0.0
+        lines.append(f"  {cat:<10} {span_name[:46]:<46} {g['n']:>6} {g['wall']:>9.2f} {pct:>5.1f}% "
+                     f"{g['cpu']:>8.2f} {g['child']:>8.2f} {g['max']:>8.2f} {g['rss']:>12.0f}")
+    return "\n".join(lines)
+
+
+def _write_run():
+    """Root process: merge child fragments, write trace.json + summary.txt."""
+    global _root
+    root, _root = _root, None
+    run_dir = root['dir']
+    events, names = _take_events()
+    events = _metadata_events(os.getpid(), root['name'], names) + events
+    for frag in sorted(run_dir.glob("events-*.jsonl")):
+        with open(frag) as f:
+            events.extend(json.loads(line) for line in f if line.strip())
+        frag.unlink()
+    os.environ.pop(RUN_DIR_ENV, None)
+
+    total_wall = time.perf_counter() - root['t0']
+    (run_dir / "trace.json").write_text(json.dumps(
+        {'traceEvents': events, 'displayTimeUnit': 'ms'}))
+    summary = _summary(events, root['name'], total_wall)
+    (run_dir / "summary.txt").write_text(summary + "\n")
+    print(f"\n{summary}\n\n  PROFILE: {run_dir / 'trace.json'} (chrome://tracing), "
+          f"{run_dir / 'summary.txt'}", file=sys.stderr)
+
+
+@contextlib.contextmanager
+def run(name, **args):
+    """Profile one CLI run (no-op unless SALUS_PROFILE=1).
+
+    Nested runs — or runs in processes started by a profiled parent — are
+    plain spans in the enclosing trace.
+    """
+    if not ENABLED or _root is not None or os.environ.get(RUN_DIR_ENV):
+        with span(name, 'run', **args):
+            yield
+        return
+
+    _start_run(name, time.perf_counter())
+    try:
+        with span(name, 'run', **args):
+            yield
+    finally:
+        _write_run()
+
+
+def _start_run(name, t0):
+    global _root, _ran
+    slug = re.sub(r'[^\w.-]+', '-', name).strip('-')
+    run_dir = PROFILE_OUT / f"{time.strftime('%Y%m%d-%H%M%S')}-{slug}-{os.getpid()}"
+    run_dir.mkdir(parents=True, exist_ok=True)
+    _root = {'name': name, 'dir': run_dir.resolve(), 'pid': os.getpid(), 't0': t0}
+    _ran = True
+    os.environ[RUN_DIR_ENV] = str(_root['dir'])
+
+
+def _after_fork():
+    # A forked child starts with the parent's buffer, open spans, root state
+    # and maybe a held lock
+    global _root, _ran, _lock
+    _root, _ran = None, False
+    _lock = threading.Lock()
+    _events.clear()
+    _tids.clear()
+    _stack.set(())
+
+
+def _at_exit():
+    if _root is not None and _root['pid'] == os.getpid():
+        _write_run()
+    elif os.environ.get(RUN_DIR_ENV):
+        _flush_fragment()
+    elif _events and not _ran:
+        # Spans from a script that never called run(): still write them out
+        _start_run(Path(sys.argv[0]).stem if sys.argv and sys.argv[0] else 'python', _T0)
+        _write_run()
+
+
+if ENABLED:
+    install()
+    os.register_at_fork(after_in_child=_after_fork)
+    atexit.register(_at_exit)
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Catalogue QA Batch — re-run the full QA gate suite over many sessions.
+
+Each session runs the gates its own pipeline runs (build-session-v3.py's
+14 gates for built sessions, vault-assemble.py's post-assembly set for
+vault sessions), detection only: Gate 2 scans for clicks but never patches,
+so deployed masters are not touched. Sessions fan out across a process
+pool, one session per worker process, each worker capped with RLIMIT_AS.
+
+Per session: <out>/<session>.json (verdict, gate results, timing, peak RSS),
+<session>.log (gate output) and the Gate 9 report PNG. Every run rewrites
+<out>/summary.json and <out>/summary.txt for the sessions it covers.
+
+--resume skips sessions whose JSON already has a verdict for the same gate
+code (build-session-v3.py, vault-assemble.py, qa_runner.py), the same audio
+and manifest files and the same options. A threshold change therefore
+re-runs everything; an interrupted batch picks up where it stopped; errors
+are always retried.
+
+Whisper (Gates 8, 10) is best served from asr-server.py so workers don't
+each load a model under the memory cap.
+
+Usage:
+    python3 qa-batch.py 01 38 52-the-court-of-your-mind
+    python3 qa-batch.py --all --resume
+    python3 qa-batch.py --all --workers 3 --max-memory-gb 8
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+# qa_runner.py must be importable by name in the batch's pool workers
+sys.path.insert(0, str(Path(__file__).parent))
+import profiling
+import qa_runner
+
+_build_spec = importlib.util.spec_from_file_location(
+    "build_session_v3", Path(__file__).parent / "build-session-v3.py")
+build = importlib.util.module_from_spec(_build_spec)
+_build_spec.loader.exec_module(build)
+
+REGISTRY_PATH = Path("content/session-registry.json")
+VAULT_DIR = Path("content/audio-free/vault")
+BATCH_DIR = Path("reference/qa-batch")
+DEFAULT_MAX_MEMORY_GB = 6.0
+
+# Changes to any of these can change a verdict
+GATE_CODE = ["build-session-v3.py", "vault-assemble.py", "qa_runner.py"]
+INPUT_KEYS = ('final_wav', 'raw_wav', 'voice_wav', 'final_mp3', 'raw_mp3', 'pre_cleanup_wav',
+              'manifest')
+
+
+def load_registry():
+    with open(REGISTRY_PATH) as f:
+        return json.load(f)
+
+
+def select_sessions(registry, requested=None, select_all=False):
+    """Deployed sessions (--all) or those matching the requested IDs/prefixes."""
+    deployed = sorted(sid for sid, info in registry["sessions"].items()
+                      if info.get("status") == "deployed")
+    if select_all:
+        return deployed
+
+    known = sorted(registry["sessions"])
+    selected = []
+    for req in requested or []:
+        # Match by prefix (e.g. "01" matches "01-morning-meditation")
+        match = req if req in known else next((s for s in known if s.startswith(req)), None)
+        if match is None and (VAULT_DIR / req).is_dir():
+            match = req
+        if match is None:
+            print(f"  WARNING: No session matching '{req}'")
+        elif match not in selected:
+            selected.append(match)
+    return selected
+
+
+def locate_session(session, source='auto'):
+    """The session's QA inputs: {'kind', audio paths, 'manifest'}, or None.
+
+    A vault assembly wins over a build-session-v3 build under 'auto' — it is
+    the newer pipeline, and what gets deployed once it exists.
+    """
+    final_dir = VAULT_DIR / session / "final"
+    vault = {
+        'kind': 'vault',
+        'final_wav': final_dir / f"{session}-vault.wav",
+        'raw_wav': final_dir / f"{session}-vault-raw.wav",
+        'voice_wav': final_dir / f"{session}-vault-voice.wav",
+        'final_mp3': final_dir / f"{session}-vault.mp3",
+        'manifest': final_dir / "assembly-manifest.json",
+    }
+    raw_wav = build.OUTPUT_RAW_DIR / f"{session}.wav"
+    raw_mp3 = build.OUTPUT_RAW_DIR / f"{session}.mp3"
+    built = {
+        'kind': 'build',
+        'final_mp3': build.OUTPUT_DIR / f"{session}.mp3",
+        # Same click-scan input build_session hands qa_loop
+        'raw_mp3': raw_wav if raw_wav.exists() else raw_mp3,
+        'raw_wav': raw_wav,
+        'pre_cleanup_wav': build.OUTPUT_RAW_DIR / f"{session}_precleanup.wav",
+        'manifest': build.OUTPUT_DIR / f"{session}_manifest.json",
+    }
+
+    candidates = {'vault': [vault], 'build': [built], 'auto': [vault, built]}[source]
+    for layout in candidates:
+        if layout['kind'] == 'vault':
+            required = [layout['final_wav'], layout['raw_wav'], layout['manifest']]
+        else:
+            required = [layout['manifest'], layout['final_mp3']]
+        if all(p.exists() for p in required):
+            return {k: (str(v) if v.exists() else None) if isinstance(v, Path) else v
+                    for k, v in layout.items()}
+    return None
+
+
+def code_version():
+    digest = hashlib.sha256()
+    for name in GATE_CODE:
+        digest.update((Path(__file__).parent / name).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def fingerprint(job, code):
+    """Identity of a verdict: gate code, input files (size + mtime), options."""
+    inputs = {key: [job[key], Path(job[key]).stat().st_size, Path(job[key]).stat().st_mtime_ns]
+              for key in sorted(job) if key in INPUT_KEYS and job[key]}
+    blob = json.dumps({'code': code, 'inputs': inputs, 'catalogue': job['catalogue']},
+                      sort_keys=True)
+    return hashlib.sha256(blob.encode()).hexdigest()[:16]
+
+
+def _json_default(obj):
+    # Gate details carry numpy scalars and arrays
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    return str(obj)
+
+
+def save_record(out_dir, record):
+    path = out_dir / f"{record['session']}.json"
+    path.write_text(json.dumps(record, indent=2, default=_json_default))
+
+
+def load_record(out_dir, session):
+    path = out_dir / f"{session}.json"
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text())
+    except json.JSONDecodeError:
+        return None
+
+
+def run_pool(jobs, workers, max_bytes, on_record):
+    """Run jobs across the memory-capped pool, calling on_record as each finishes.
+
+    A worker killed outright (e.g. by the OOM killer) breaks the pool and
+    fails every session in flight with it; those are recorded as errors
+    and a fresh pool takes the rest of the queue.
+    """
+    queue = list(jobs)
+    while queue:
+        executor = ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1,
+                                       initializer=qa_runner.limit_memory,
+                                       initargs=(max_bytes,))
+        running = {}
+        broken = False
+        try:
+            while (queue or running) and not broken:
+                while queue and len(running) < workers:
+                    try:
+                        fut = executor.submit(qa_runner.run_session_qa, queue[0])
+                    except BrokenProcessPool:
+                        broken = True
+                        break
+                    running[fut] = queue.pop(0)
+                if broken:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    job = running.pop(fut)
+                    try:
+                        record = fut.result()
+                    except BrokenProcessPool:
+                        broken = True
+                        running[fut] = job
+                        continue
+                    except Exception as e:
+                        record = {'session': job['session'], 'kind': job['kind'],
+                                  'status': 'error', 'error': f"{type(e).__name__}: {e}"}
+                    on_record(job, record)
+            for job in running.values():
+                on_record(job, {'session': job['session'], 'kind': job['kind'],
+                                'status': 'error',
+                                'error': 'worker process died (pool broken — out of memory?)'})
+        finally:
+            executor.shutdown(wait=not broken, cancel_futures=True)
+
+
+def summary_rows(records):
+    rows = []
+    for rec in records:
+        rows.append({
+            'session': rec['session'],
+            'kind': rec.get('kind', '-'),
+            'status': rec['status'],
+            'failed_gates': rec.get('failed_gates', []),
+            'error': rec.get('error'),
+            'wall_time_s': rec.get('wall_time_s'),
+            'peak_rss_mb': rec.get('peak_rss_mb'),
+            'finished': rec.get('finished'),
+        })
+    return rows
+
+
+def format_summary(rows):
+    counts = {}
+    for row in rows:
+        counts[row['status']] = counts.get(row['status'], 0) + 1
+    lines = [
+        f"{'SESSION':<44} {'KIND':<6} {'VERDICT':<8} {'WALL':>7} {'RSS MB':>7}  FAILED / ERROR",
+        "-" * 100,
+    ]
+    for row in rows:
+        wall = f"{row['wall_time_s']:.0f}s" if row['wall_time_s'] is not None else '-'
+        rss = f"{row['peak_rss_mb']:.0f}" if row['peak_rss_mb'] is not None else '-'
+        note = ', '.join(row['failed_gates']) or row['error'] or ''
+        lines.append(f"{row['session']:<44} {row['kind']:<6} {row['status'].upper():<8} "
+                     f"{wall:>7} {rss:>7}  {note}")
+    lines.append("-" * 100)
+    lines.append("  " + ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+                 + f" / {len(rows)} sessions")
+    return "\n".join(lines)
+
+
+def run_batch(sessions, out_dir=BATCH_DIR, workers=build.QA_WORKERS,
+              max_memory_gb=DEFAULT_MAX_MEMORY_GB, resume=False, source='auto',
+              catalogue_repeats=False):
+    """QA every session; returns the summary rows (also written to out_dir)."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    code = code_version()
+
+    records = {}
+    jobs = []
+    for session in sessions:
+        layout = locate_session(session, source)
+        if layout is None:
+            print(f"  {session}: no QA inputs found ({source}) — skipped")
+            records[session] = {'session': session, 'status': 'missing',
+                                'error': 'no audio/manifest found'}
+            continue
+        job = {'session': session, **layout, 'catalogue': catalogue_repeats,
+               'out_dir': str(out_dir), 'log': str(out_dir / f"{session}.log")}
+        job['fingerprint'] = fingerprint(job, code)
+        previous = load_record(out_dir, session) if resume else None
+        if (previous and previous.get('fingerprint') == job['fingerprint']
+                and previous.get('status') in ('passed', 'failed')):
+            records[session] = previous
+            continue
+        jobs.append(job)
+
+    resumed = sum(1 for r in records.values() if r['status'] in ('passed', 'failed'))
+    print(f"  QA batch: {len(jobs)} session(s) to run"
+          f"{f', {resumed} up to date (resume)' if resumed else ''}"
+          f" — {workers} worker(s), {max_memory_gb:g} GB cap each → {out_dir}")
+
+    def on_record(job, record):
+        record.update(fingerprint=job['fingerprint'],
+                      inputs={k: job[k] for k in INPUT_KEYS if job.get(k)},
+                      finished=time.strftime("%Y-%m-%d %H:%M:%S"))
+        save_record(out_dir, record)
+        records[job['session']] = record
+        line = f"  [{len(records)}/{len(sessions)}] {job['session']}: {record['status'].upper()}"
+        if 'wall_time_s' in record:
+            line += f" ({record['wall_time_s']:.0f}s)"
+        note = ', '.join(record.get('failed_gates', [])) or record.get('error', '')
+        print(line + (f" — {note}" if note else ""))
+
+    t0 = time.time()
+    if jobs:
+        run_pool(jobs, max(1, workers), int(max_memory_gb * 1024 ** 3), on_record)
+
+    rows = summary_rows([records[s] for s in sessions if s in records])
+    table = format_summary(rows)
+    (out_dir / "summary.json").write_text(json.dumps({
+        'generated': time.strftime("%Y-%m-%d %H:%M:%S"),
+        'code_version': code,
+        'sessions': rows,
+    }, indent=2))
+    (out_dir / "summary.txt").write_text(table + "\n")
+    print(f"\n{table}")
+    print(f"\n  QA batch: {len(jobs)} run in {(time.time() - t0) / 60:.1f} min — "
+          f"summary at {out_dir / 'summary.txt'}")
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Catalogue-wide batch QA (detection only)")
+    parser.add_argument('sessions', nargs='*',
+                        help='Session IDs or prefixes (e.g. 01 52-the-court-of-your-mind)')
+    parser.add_argument('--all', action='store_true',
+                        help='Every deployed session in session-registry.json')
+    parser.add_argument('--resume', action='store_true',
+                        help='Skip sessions already verified with the same gate code and audio')
+    parser.add_argument('--workers', type=int, default=build.QA_WORKERS,
+                        help=f'Sessions in parallel (default: {build.QA_WORKERS})')
+    parser.add_argument('--max-memory-gb', type=float, default=DEFAULT_MAX_MEMORY_GB,
+                        help=f'Address-space cap per worker (default: {DEFAULT_MAX_MEMORY_GB:g}, '
+                             f'0 = none)')
+    parser.add_argument('--source', choices=['auto', 'build', 'vault'], default='auto',
+                        help='Which master to verify (default: auto — the vault assembly if there is one)')
+    parser.add_argument('--out', type=Path, default=BATCH_DIR,
+                        help=f'Results directory (default: {BATCH_DIR})')
+    parser.add_argument('--catalogue-repeats', action='store_true',
+                        help='Gate 8: also report near-identical segments in other sessions')
+    args = parser.parse_args()
+
+    if not args.sessions and not args.all:
+        parser.print_help()
+        return
+
+    sessions = select_sessions(load_registry(), args.sessions, args.all)
+    if not sessions:
+        print("  No sessions selected")
+        sys.exit(1)
+
+    with profiling.run(f"qa-batch {len(sessions)} sessions"):
+        rows = run_batch(sessions, out_dir=args.out, workers=args.workers,
+                         max_memory_gb=args.max_memory_gb, resume=args.resume,
+                         source=args.source, catalogue_repeats=args.catalogue_repeats)
+    if any(row['status'] != 'passed' for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
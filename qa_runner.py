@@ -0,0 +1,315 @@
+"""
+Dependency-aware QA gate runner for build-session-v3.py and vault-assemble.py.
+
+Each gate is a GateSpec: the gate function (by name, in build-session-v3.py),
+its arguments, the audio files it reads and writes, and any gates it must
+wait for. run_gates() starts every gate whose dependencies have finished, so
+the read-only analyses run side by side in a ProcessPoolExecutor. A gate
+that writes a file (Gate 2's click patch rewrites the raw and final mix)
+runs before every gate that reads that file; Gate 9's report waits for the
+others because it plots their results.
+
+A plain importable module for the same reason as candidate_scoring.py:
+pool workers unpickle the task function by module name. Each worker loads
+build-session-v3.py itself and keeps one QAContext for the process, so
+gates that land in the same worker share decodes.
+
+qa-batch.py fans whole sessions out instead: run_session_qa() is its pool
+task (gates inline, one session per worker process) and limit_memory() its
+pool initializer.
+"""
+
+import contextlib
+import importlib.util
+import inspect
+import io
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import profiling
+
+_build_mod = None
+_vault_mod = None
+_worker_ctx = None
+
+
+def _build():
+    global _build_mod
+    if _build_mod is None:
+        spec = importlib.util.spec_from_file_location(
+            "build_session_v3", Path(__file__).parent / "build-session-v3.py")
+        _build_mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(_build_mod)
+    return _build_mod
+
+
+def _vault():
+    global _vault_mod
+    if _vault_mod is None:
+        spec = importlib.util.spec_from_file_location(
+            "vault_assemble", Path(__file__).parent / "vault-assemble.py")
+        _vault_mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(_vault_mod)
+    return _vault_mod
+
+
+@dataclass
+class GateSpec:
+    """One QA gate: func(*args, **kwargs) → (passed, details, ...).
+
+    func is a gate function from build-session-v3.py; pool workers look it
+    up by name in their own load of that file. Gate functions that take a
+    `ctx` argument get the shared QAContext.
+    """
+    name: str                    # gate_results key, e.g. 'Gate 6: HF Hiss'
+    func: object
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+    reads: tuple = ()            # audio paths the gate reads
+    writes: tuple = ()           # audio paths the gate rewrites
+    after: tuple = ()            # gate names that must finish first (absent ones ignored)
+    prepare: object = None       # prepare(results) → extra kwargs, run at submit time
+    optional: bool = False       # an exception is reported instead of raised (Gate 9)
+
+
+def run_gate(func, args, kwargs, ctx=None, label=None):
+    """Run one gate with stdout captured. Returns (result, log, wall_s, cpu_s).
+
+    Pool workers call this with the gate's name and ctx=None: the function
+    comes from their own build-session-v3.py load and the QAContext is
+    process-wide. label names the gate's profiling span.
+    """
+    global _worker_ctx
+    if isinstance(func, str):
+        func = getattr(_build(), func)
+    if ctx is None:
+        if _worker_ctx is None:
+            _worker_ctx = _build().QAContext()
+        ctx = _worker_ctx
+    fn = func
+    if 'ctx' in inspect.signature(fn).parameters:
+        kwargs = {**kwargs, 'ctx': ctx}
+    buf = io.StringIO()
+    t0, c0 = time.perf_counter(), time.process_time()
+    try:
+        with contextlib.redirect_stdout(buf), profiling.span(label or fn.__name__, 'qa'):
+            result = fn(*args, **kwargs)
+    except Exception as e:
+        e.qa_log = buf.getvalue()
+        raise
+    return result, buf.getvalue(), time.perf_counter() - t0, time.process_time() - c0
+
+
+def _dependencies(specs):
+    """name → set of gate names it waits for (explicit + file hazards).
+
+    A gate waits for every earlier gate that writes a path it reads or
+    writes, and for every earlier gate that reads a path it writes — a
+    rewrite must not land under a gate still measuring the old file.
+    """
+    def norm(paths):
+        return {os.path.abspath(str(p)) for p in paths if p}
+
+    names = {s.name for s in specs}
+    deps = {s.name: set(s.after) & names for s in specs}
+    for i, spec in enumerate(specs):
+        writes = norm(spec.writes)
+        touched = norm(spec.reads) | writes
+        for earlier in specs[:i]:
+            if norm(earlier.writes) & touched or norm(earlier.reads) & writes:
+                deps[spec.name].add(earlier.name)
+    return deps
+
+
+def run_gates(specs, workers=1, fail_fast=False, ctx=None, header=None):
+    """Run gate specs respecting dependencies; returns {name: result}.
+
+    Each result is {'passed', 'details', 'wall_time_s'}. workers <= 1 runs
+    the gates inline in list order with `ctx`; otherwise they go to a
+    process pool. Every gate is blocking: with fail_fast, the first
+    failure cancels the gates not yet finished. A gate's captured output
+    is printed when it completes, after header(name) if given.
+    """
+    deps = _dependencies(specs)
+    by_name = {s.name: s for s in specs}
+    results = {}
+    timings = {}
+    done = set()
+    pending = [s.name for s in specs]
+    running = {}
+    failed = False
+
+    def ready():
+        return [n for n in pending if deps[n] <= done]
+
+    def label(name):
+        return name if isinstance(name, str) else f"Gate {name}"
+
+    def kwargs_for(spec):
+        kwargs = dict(spec.kwargs)
+        if spec.prepare is not None:
+            kwargs.update(spec.prepare(dict(results)))
+        return kwargs
+
+    def finish(name, outcome, error=None):
+        nonlocal failed
+        spec = by_name[name]
+        if header:
+            print(header(name))
+        if error is not None:
+            print(getattr(error, 'qa_log', ''), end='')
+            if not spec.optional:
+                raise error
+            print(f"  {name}: ERROR — {error}")
+            done.add(name)
+            return
+        result, log, wall, cpu = outcome
+        print(log, end='')
+        passed, details = result[0], result[1]
+        results[name] = {'passed': passed, 'details': details, 'wall_time_s': round(wall, 2)}
+        timings[name] = (wall, cpu)
+        done.add(name)
+        if not passed:
+            failed = True
+
+    t_start = time.perf_counter()
+    if workers <= 1:
+        while pending and not (fail_fast and failed):
+            name = ready()[0]
+            pending.remove(name)
+            spec = by_name[name]
+            try:
+                outcome = run_gate(spec.func, spec.args, kwargs_for(spec), ctx=ctx,
+                                   label=label(name))
+            except Exception as e:
+                finish(name, None, e)
+                continue
+            finish(name, outcome)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            while pending or running:
+                if not (fail_fast and failed):
+                    for name in ready():
+                        pending.remove(name)
+                        spec = by_name[name]
+                        fut = executor.submit(run_gate, spec.func.__name__, spec.args,
+                                              kwargs_for(spec), label=label(name))
+                        running[fut] = name
+                if fail_fast and failed:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    name = running.pop(fut)
+                    error = fut.exception()
+                    finish(name, None if error else fut.result(), error)
+        finally:
+            # Gates already running after a fail-fast are abandoned, not awaited
+            executor.shutdown(wait=not (fail_fast and failed), cancel_futures=True)
+
+    cancelled = pending + list(running.values())
+    if cancelled:
+        print(f"\n  QA: fail-fast — cancelled {len(cancelled)} outstanding gate(s): "
+              f"{', '.join(str(n) for n in cancelled)}")
+    print_timings(timings, time.perf_counter() - t_start)
+    return results
+
+
+def print_timings(timings, total_wall):
+    if not timings:
+        return
+    print(f"\n  QA: gate wall time (cpu) — {total_wall:.1f}s total")
+    for name, (wall, cpu) in sorted(timings.items(), key=lambda kv: -kv[1][0]):
+        print(f"    {wall:7.2f}s ({cpu:6.2f}s)  {name}")
+
+
+# ---------------------------------------------------------------------------
+# Catalogue batches (qa-batch.py)
+# ---------------------------------------------------------------------------
+
+def limit_memory(max_bytes):
+    """Pool initializer: cap the worker's address space (RLIMIT_AS).
+
+    A session that outgrows the cap fails with MemoryError in its own
+    worker instead of pushing the machine into swap. macOS accepts the
+    limit but does not enforce it.
+    """
+    if not max_bytes:
+        return
+    import resource
+    try:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            max_bytes = min(max_bytes, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (max_bytes, hard))
+    except (ValueError, OSError) as e:
+        print(f"  QA batch: memory cap not applied ({e})", file=sys.stderr)
+
+
+def _peak_rss_mb():
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, KiB on Linux
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def _session_gates(job):
+    """The gate suite the session's own pipeline runs, inline, detection only."""
+    manifest = json.loads(Path(job['manifest']).read_text())
+    if job['kind'] == 'vault':
+        vault = _vault()
+        _, results = vault.run_vault_qa(
+            job['session'], job['final_wav'], job['raw_wav'], job['final_mp3'], manifest,
+            vault.load_script_metadata(job['session']), job['out_dir'], workers=1,
+            catalogue_repeats=job['catalogue'], voice_wav=job.get('voice_wav'))
+        return {f"Gate {k}: {r['name']}": {key: v for key, v in r.items() if key != 'name'}
+                for k, r in sorted(results.items())}
+
+    build = _build()
+    metadata = {}
+    for script_dir in (build.SCRIPT_DIR, build.SLEEP_STORY_DIR):
+        script_path = script_dir / f"{job['session']}.txt"
+        if script_path.exists():
+            metadata = build.parse_script(script_path)
+            break
+    return build.run_qa_gates(
+        job['final_mp3'], job['raw_mp3'], manifest,
+        metadata.get('ambient') or manifest.get('ambient'),
+        raw_narration_wav=job['raw_wav'], pre_cleanup_wav=job['pre_cleanup_wav'],
+        session_name=job['session'], metadata=metadata, workers=1,
+        catalogue_repeats=job['catalogue'], patch_clicks=False, report_dir=job['out_dir'])
+
+
+def run_session_qa(job):
+    """Pool task for qa-batch.py: one session's full gate suite.
+
+    job is the dict qa-batch.py builds (session, kind, audio and manifest
+    paths, output dir, log path). The gates run inline with their output
+    written to job['log']. Returns the session record: status 'passed' / 'failed' / 'error', gate results,
+    wall and CPU time, and the worker's peak RSS.
+    """
+    record = {'session': job['session'], 'kind': job['kind']}
+    t0, c0 = time.perf_counter(), time.process_time()
+    with open(job['log'], 'w') as log, contextlib.redirect_stdout(log), \
+            profiling.span('session QA', 'qa', session=job['session']):
+        try:
+            gates = _session_gates(job)
+            failed = [name for name, r in gates.items() if not r.get('passed', True)]
+            record.update(status='failed' if failed else 'passed',
+                          failed_gates=failed, gates=gates)
+        except MemoryError:
+            traceback.print_exc(file=log)
+            record.update(status='error', error='MemoryError — worker memory cap reached')
+        except Exception as e:
+            traceback.print_exc(file=log)
+            record.update(status='error', error=f"{type(e).__name__}: {e}")
+    record.update(wall_time_s=round(time.perf_counter() - t0, 1),
+                  cpu_time_s=round(time.process_time() - c0, 1),
+                  peak_rss_mb=_peak_rss_mb())
+    return record
@@ -30,21 +30,22 @@ import warnings
 from pathlib import Path
 
 import numpy as np
-import whisper
+
+sys.path.insert(0, str(Path(__file__).parent))
+import asr_client
 
 warnings.filterwarnings('ignore')
 
+TRANSCRIBE_OPTIONS = dict(
+    language='en',
+    word_timestamps=True,
+    logprob_threshold=None,
+    no_speech_threshold=0.3,
+)
 
-def score_chunk(model, audio_path):
-    """Run Whisper, return per-word confidence metrics."""
-    result = model.transcribe(
-        str(audio_path),
-        language='en',
-        word_timestamps=True,
-        logprob_threshold=None,
-        no_speech_threshold=0.3,
-    )
 
+def score_chunk(result):
+    """Per-word confidence metrics from a Whisper result."""
     word_probs = []
     for seg in result.get('segments', []):
         for word in seg.get('words', []):
@@ -86,25 +87,28 @@ def main():
         print(f"ERROR: No chunk*.mp3 files found in {chunk_dir}")
         sys.exit(1)
 
-    print(f"Loading Whisper {args.model} model...")
-    model = whisper.load_model(args.model)
-
-    print(f"Scoring {len(mp3s)} chunks...")
-    scores = {}
-
-    for i, mp3 in enumerate(mp3s):
+    chunks = []
+    for mp3 in mp3s:
         # Extract chunk number from filename
         name = mp3.stem
         # Handle both "chunk-01" and "chunk_01" patterns
         num_str = name.replace('chunk-', '').replace('chunk_', '').lstrip('0') or '0'
         try:
-            chunk_num = int(num_str)
+            chunks.append((int(num_str), mp3))
         except ValueError:
             print(f"  SKIP: can't parse chunk number from {name}")
-            continue
 
-        print(f"  [{i+1}/{len(mp3s)}] chunk {chunk_num}...", end='', flush=True)
-        result = score_chunk(model, mp3)
+    # One batch through the ASR server (or an in-process Whisper model)
+    print(f"Transcribing {len(chunks)} chunks with Whisper {args.model}...")
+    transcripts = asr_client.transcribe([mp3 for _, mp3 in chunks], args.model,
+                                        **TRANSCRIBE_OPTIONS)
+
+    print(f"Scoring {len(chunks)} chunks...")
+    scores = {}
+
+    for i, ((chunk_num, mp3), transcript) in enumerate(zip(chunks, transcripts)):
+        print(f"  [{i+1}/{len(chunks)}] chunk {chunk_num}...", end='', flush=True)
+        result = score_chunk(transcript)
 
         if result:
             scores[str(chunk_num)] = result
@@ -10,8 +10,12 @@ import struct
 import wave
 from pathlib import Path
 import os
+import sys
 import time
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import fish_client
+
 # Load .env manually
 env_path = Path(__file__).parent.parent / '.env'
 if env_path.exists():
@@ -56,41 +60,12 @@ def write_wav(path, samples, sr=44100):
 
 async def generate_candidate(session, text, out_path, emotion='calm'):
     """Generate one TTS candidate via Fish API."""
-    payload = {
-        "text": text,
-        "reference_id": FISH_VOICE_ID,
-        "format": "mp3",
-        "temperature": 0.3,
-        "version": "v3-hd",
-        "emotion": emotion,
-        "prosody": {"speed": 0.95, "volume": 0},
-        "sample_rate": SAMPLE_RATE,
-    }
-    headers = {
-        "Authorization": f"Bearer {FISH_API_KEY}",
-        "Content-Type": "application/json",
-    }
-
+    payload = fish_client.build_payload(text, emotion=emotion,
+                                        sample_rate=SAMPLE_RATE,
+                                        voice_id=FISH_VOICE_ID)
     mp3_tmp = str(out_path) + ".tmp.mp3"
-    for attempt in range(4):
-        try:
-            async with session.post(FISH_API_URL, json=payload, headers=headers,
-                                    timeout=aiohttp.ClientTimeout(total=120)) as resp:
-                if resp.status == 429:
-                    await asyncio.sleep(2 ** attempt + 1)
-                    continue
-                if resp.status != 200:
-                    body = await resp.text()
-                    raise Exception(f"Fish API {resp.status}: {body[:200]}")
-                data = await resp.read()
-                Path(mp3_tmp).write_bytes(data)
-                break
-        except (asyncio.TimeoutError, aiohttp.ClientError):
-            if attempt < 3:
-                await asyncio.sleep(2 ** attempt)
-            continue
-    else:
-        raise Exception(f"Failed after 4 attempts for: {text[:50]}")
+    client = fish_client.FishClient(FISH_API_KEY, url=FISH_API_URL)
+    await client.synthesize(session, payload, timeout=120, dest=mp3_tmp)
 
     # Convert MP3 to WAV
     subprocess.run([
@@ -191,6 +166,7 @@ async def main():
     write_wav(pick_path, combined, SAMPLE_RATE)
     print(f"\n  Replacement: {pick_path}")
     print(f"  Total duration: {total_dur:.1f}s (was 13.5s)")
+    print(f"  {fish_client.shared_limiter().format_stats()}")
     print(f"  Done.\n")
 
 
@@ -26,6 +26,7 @@ Usage:
     python3 tools/remix-session.py --all --dry-run
 """
 import argparse
+import importlib.util
 import json
 import shutil
 import subprocess
@@ -34,8 +35,6 @@ import time
 from datetime import datetime
 from pathlib import Path
 
-import numpy as np
-
 # ---------------------------------------------------------------------------
 # Paths
 # ---------------------------------------------------------------------------
@@ -67,6 +66,11 @@ DEFAULT_AMBIENT_GAINS = {
 
 GARDEN_OFFSET_SEC = 10  # Garden has 9.5s dead silence at start
 
+_mixer_spec = importlib.util.spec_from_file_location(
+    "ambient_mixer", PROJECT_ROOT / "ambient-mixer.py")
+mixer = importlib.util.module_from_spec(_mixer_spec)
+_mixer_spec.loader.exec_module(mixer)
+
 
 def load_registry():
     """Load session registry."""
@@ -99,79 +103,21 @@ def find_ambient_file(ambient_name):
     return None
 
 
-def _read_wav_as_int16(wav_path):
-    """Read WAV file as mono int16 using ffmpeg."""
-    result = subprocess.run(
-        ['ffmpeg', '-i', str(wav_path), '-f', 's16le', '-ac', '1',
-         '-ar', str(SAMPLE_RATE), '-acodec', 'pcm_s16le', '-'],
-        capture_output=True, timeout=120)
-    if result.returncode != 0:
-        raise RuntimeError(f"Failed to decode {wav_path}: {result.stderr[:300]}")
-    samples = np.frombuffer(result.stdout, dtype=np.int16)
-    return samples, SAMPLE_RATE, 1
-
-
-def _load_ambient_as_mono_int16(path, offset_sec=0):
-    """Load ambient file as mono int16, optionally skipping initial silence."""
-    cmd = ['ffmpeg', '-i', str(path)]
-    if offset_sec > 0:
-        cmd = ['ffmpeg', '-ss', str(offset_sec), '-i', str(path)]
-    cmd += ['-f', 's16le', '-ac', '1', '-ar', str(SAMPLE_RATE),
-            '-acodec', 'pcm_s16le', '-']
-    result = subprocess.run(cmd, capture_output=True, timeout=300)
-    if result.returncode != 0:
-        raise RuntimeError(f"Failed to decode ambient: {result.stderr[:300]}")
-    return np.frombuffer(result.stdout, dtype=np.int16)
-
-
-def _write_wav_int16(samples, sr, channels, path):
-    """Write int16 samples to WAV using ffmpeg."""
-    process = subprocess.Popen(
-        ['ffmpeg', '-y', '-f', 's16le', '-ar', str(sr), '-ac', str(channels),
-         '-i', '-', str(path)],
-        stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    process.communicate(input=samples.tobytes())
-    if process.returncode != 0:
-        raise RuntimeError(f"Failed to write WAV: {path}")
-
-
-def mix_single_ambient(voice_samples, ambient_name, gain_db, fade_in_sec, fade_out_sec):
-    """Load and prepare a single ambient layer."""
+def ambient_layer(ambient_name, gain_db=None):
+    """Resolve one ambient layer (file, gain, garden offset). Looped if short."""
     ambient_path = find_ambient_file(ambient_name)
     if ambient_path is None:
         raise FileNotFoundError(f"No ambient file for '{ambient_name}'")
 
     if gain_db is None:
         gain_db = DEFAULT_AMBIENT_GAINS.get(ambient_name, -14)
-    gain_linear = 10 ** (gain_db / 20.0)
 
     offset_sec = GARDEN_OFFSET_SEC if 'garden' in ambient_name else 0
 
-    total_len = len(voice_samples)
-    ambient_raw = _load_ambient_as_mono_int16(ambient_path, offset_sec=offset_sec)
-
-    if len(ambient_raw) < total_len:
-        # Loop the ambient if too short
-        repeats = (total_len // len(ambient_raw)) + 1
-        ambient_raw = np.tile(ambient_raw, repeats)
-
-    ambient = ambient_raw[:total_len].astype(np.float64)
-    ambient *= gain_linear
-
-    # Fade-in ramp
-    fade_in_samples = int(fade_in_sec * SAMPLE_RATE)
-    if fade_in_samples > 0 and fade_in_samples <= len(ambient):
-        ambient[:fade_in_samples] *= np.linspace(0.0, 1.0, fade_in_samples)
-
-    # Fade-out ramp
-    fade_out_samples = int(fade_out_sec * SAMPLE_RATE)
-    if fade_out_samples > 0 and fade_out_samples <= len(ambient):
-        ambient[-fade_out_samples:] *= np.linspace(1.0, 0.0, fade_out_samples)
-
     print(f"    Layer: {ambient_path.name} @ {gain_db}dB"
           f" (offset={offset_sec}s)")
 
-    return ambient
+    return mixer.AmbientLayer(ambient_path, gain_db, offset_sec=offset_sec, loop=True)
 
 
 def remix(session_id, ambient_override=None, fade_in=30, fade_out=60, dry_run=False):
@@ -211,57 +157,28 @@ def remix(session_id, ambient_override=None, fade_in=30, fade_out=60, dry_run=Fa
 
     t0 = time.time()
 
-    # Load voice
-    voice_samples, sr, nc = _read_wav_as_int16(voice_wav)
-    voice_len = len(voice_samples)
-    voice_dur = voice_len / sr
-
-    # Prepend 30s silence for pre-roll, append 60s silence for post-roll
-    preroll_samples = int(fade_in * sr)
-    postroll_samples = int(fade_out * sr)
-    voice_with_preroll = np.concatenate([
-        np.zeros(preroll_samples, dtype=np.int16),
-        voice_samples,
-        np.zeros(postroll_samples, dtype=np.int16)
-    ])
-    total_len = len(voice_with_preroll)
-    total_dur = total_len / sr
-
-    print(f"  Voice: {voice_dur:.1f}s → with {fade_in}s pre-roll + {fade_out}s post-roll: {total_dur:.1f}s")
-
     # Parse ambient spec (supports "birds+fire" combos)
     ambient_names = [a.strip() for a in ambient_spec.split('+')]
     print(f"  Layers: {len(ambient_names)}")
+    layers = [ambient_layer(amb_name) for amb_name in ambient_names]
 
-    # Mix all ambient layers
-    combined_ambient = np.zeros(total_len, dtype=np.float64)
-    for amb_name in ambient_names:
-        layer = mix_single_ambient(
-            voice_with_preroll, amb_name, None, fade_in, fade_out)
-        combined_ambient += layer
-
-    # Final mix: voice + ambient
-    voice_float = voice_with_preroll.astype(np.float64)
-    mixed = np.clip(voice_float + combined_ambient, -32768, 32767).astype(np.int16)
+    # Stream voice (30s pre-roll, 60s post-roll) + all layers to the mixed WAV
+    mixed_wav = session_dir / f"{session_id}-vault.wav"
+    stats = mixer.mix_to_wav(voice_wav, layers, mixed_wav,
+                             fade_in_sec=fade_in, fade_out_sec=fade_out)
+    sr = SAMPLE_RATE
+    voice_dur = stats['voice_samples'] / sr
+    total_dur = stats['total_samples'] / sr
+    print(f"  Voice: {voice_dur:.1f}s → with {fade_in}s pre-roll + {fade_out}s post-roll: {total_dur:.1f}s")
 
     # Verify pre-roll
-    def rms_db(s):
-        rms = np.sqrt(np.mean(s.astype(np.float64) ** 2))
-        return 20 * np.log10(max(rms, 1e-10) / 32768)
-
-    window = int(5 * sr)
-    preroll_end = int(fade_in * sr)
-    if preroll_end > window:
-        rms_start = rms_db(mixed[:window])
-        rms_end = rms_db(mixed[preroll_end - window:preroll_end])
+    rms = stats['rms_db']
+    if 'preroll_start' in rms:
+        rms_start, rms_end = rms['preroll_start'], rms['preroll_end']
         print(f"  Pre-roll: 0-5s={rms_start:.1f}dB → "
               f"{fade_in-5}-{fade_in}s={rms_end:.1f}dB "
               f"({'OK' if rms_end > rms_start else 'WARNING'})")
 
-    # Save mixed WAV
-    mixed_wav = session_dir / f"{session_id}-vault.wav"
-    _write_wav_int16(mixed, sr, 1, mixed_wav)
-
     # Encode MP3
     mixed_mp3 = session_dir / f"{session_id}-vault.mp3"
     subprocess.run(
@@ -10,6 +10,7 @@ Usage:
     python3 tools/vault-topup.py --target 50  # Custom target
     python3 tools/vault-topup.py --dry-run    # Show plan without generating
     python3 tools/vault-topup.py --session 09-rainfall-sleep-journey  # Single session
+    python3 tools/vault-topup.py --parallel 5 # Sessions in flight at once (default 3)
 """
 
 import asyncio
@@ -22,6 +23,7 @@ from pathlib import Path
 VAULT_DIR = Path(__file__).parent.parent / "content" / "audio-free" / "vault"
 PRIORITY_FILE = Path(__file__).parent.parent / "vault-topup-priority.json"
 STATE_FILE = Path(__file__).parent.parent / "vault-topup-state.json"
+SESSION_CONCURRENCY = 3  # Sessions generated at once (no tonal dependency between them)
 
 # Import vault-builder
 _vb_spec = importlib.util.spec_from_file_location(
@@ -31,6 +33,10 @@ _vb_spec = importlib.util.spec_from_file_location(
 vb = importlib.util.module_from_spec(_vb_spec)
 _vb_spec.loader.exec_module(vb)
 
+# profiling.py holds the process-wide span buffer (SALUS_PROFILE=1)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import profiling
+
 
 def scan_session(session_dir, target):
     """Scan a vault session and return chunks needing topup.
@@ -58,9 +64,18 @@ def scan_session(session_dir, target):
     return needs
 
 
-async def topup_all(target, dry_run=False, session_filter=None, no_upload=False):
-    """Scan all vaults and top up to target pool size."""
+@profiling.span('topup_all')
+async def topup_all(target, dry_run=False, session_filter=None, no_upload=False,
+                    parallel=SESSION_CONCURRENCY):
+    """Scan all vaults and top up to target pool size.
+
+    Up to `parallel` sessions run at once. They share one API semaphore
+    (vault-builder MAX_CONCURRENT), one scoring pool and the process-wide
+    Fish rate limiter, so one session's scoring overlaps another's network
+    waits without raising the total request budget.
+    """
 
+    profiling.phase('scan')
     sessions = sorted(d.name for d in VAULT_DIR.iterdir()
                       if d.is_dir()
                       and not d.name.endswith('-backup')
@@ -130,6 +145,7 @@ async def topup_all(target, dry_run=False, session_filter=None, no_upload=False)
         return
 
     print(f"\n  Starting generation...\n")
+    profiling.phase('generate')
 
     completed = 0
     processed_ids = set()
@@ -144,50 +160,71 @@ async def topup_all(target, dry_run=False, session_filter=None, no_upload=False)
         except Exception:
             pass
 
-    while True:
-        # Hot-reload priority file before each session
-        remaining = [p for p in plan if p['session_id'] not in processed_ids]
-        if not remaining:
-            break
-
-        remaining = _apply_priority(remaining)
-
-        item = remaining[0]
-        session_id = item['session_id']
-        chunks = item['chunks']
-        count = item['max_needed']
-
-        done_count = len(processed_ids)
-        total_count = len(plan)
+    semaphore = asyncio.Semaphore(vb.MAX_CONCURRENT)
+    executor = vb.make_score_executor(vb.SCORE_WORKERS)
+    in_flight = set()
+
+    async def session_slot():
+        nonlocal completed
+        while True:
+            # Hot-reload priority file before each session
+            remaining = [p for p in plan
+                         if p['session_id'] not in processed_ids
+                         and p['session_id'] not in in_flight]
+            if not remaining:
+                return
+
+            remaining = _apply_priority(remaining)
+
+            item = remaining[0]
+            session_id = item['session_id']
+            chunks = item['chunks']
+            count = item['max_needed']
+
+            in_flight.add(session_id)
+            started_count = len(processed_ids) + len(in_flight)
+            total_count = len(plan)
+
+            print(f"\n{'='*70}")
+            print(f"  [{started_count}/{total_count}] {session_id}")
+            print(f"  Chunks: {len(chunks)} | Adding: +{count}/chunk")
+            if len(in_flight) > 1:
+                print(f"  In flight: {', '.join(sorted(in_flight - {session_id}))}")
+
+            # Show what's next in queue
+            upcoming = [p['session_id'] for p in remaining[1:4]]
+            if upcoming:
+                print(f"  Queue: {' → '.join(upcoming)}")
+            print(f"{'='*70}")
+
+            try:
+                with profiling.span('topup session', session=session_id, chunks=len(chunks)):
+                    result = await vb.regen_chunks(session_id, chunks, count,
+                                                   semaphore=semaphore,
+                                                   executor=executor)
+                if result:
+                    print(f"  Done ({session_id}): +{result['generated']} candidates, "
+                          f"{result['uploaded']} uploaded, {result['errors']} errors")
+            except Exception as e:
+                print(f"  ERROR ({session_id}): {e}")
+                print(f"  Continuing to next session...")
+
+            in_flight.discard(session_id)
+            processed_ids.add(session_id)
+            completed += 1
+
+            # Save state for resume
+            _save_state(processed_ids)
 
-        print(f"\n{'='*70}")
-        print(f"  [{done_count + 1}/{total_count}] {session_id}")
-        print(f"  Chunks: {len(chunks)} | Adding: +{count}/chunk")
-
-        # Show what's next in queue
-        upcoming = [p['session_id'] for p in remaining[1:4]]
-        if upcoming:
-            print(f"  Queue: {' → '.join(upcoming)}")
-        print(f"{'='*70}")
-
-        try:
-            result = await vb.regen_chunks(session_id, chunks, count)
-            if result:
-                print(f"  Done: +{result['generated']} candidates, "
-                      f"{result['uploaded']} uploaded, {result['errors']} errors")
-        except Exception as e:
-            print(f"  ERROR: {e}")
-            print(f"  Continuing to next session...")
-
-        processed_ids.add(session_id)
-        completed += 1
-
-        # Save state for resume
-        _save_state(processed_ids)
+    try:
+        await asyncio.gather(*(session_slot() for _ in range(max(1, parallel))))
+    finally:
+        executor.shutdown(wait=False)
 
     print(f"\n{'='*70}")
     print(f"  TOP-UP COMPLETE")
     print(f"  Sessions processed: {completed}/{len(plan)}")
+    print(f"  {vb.fish_client.shared_limiter().format_stats()}")
     print(f"{'='*70}")
 
     # Clean up state file
@@ -236,7 +273,10 @@ if __name__ == '__main__':
                         help='Only process sessions matching this string')
     parser.add_argument('--no-upload', action='store_true',
                         help='Skip R2 upload')
+    parser.add_argument('--parallel', type=int, default=SESSION_CONCURRENCY,
+                        help=f'Sessions to generate concurrently (default: {SESSION_CONCURRENCY})')
     args = parser.parse_args()
 
-    asyncio.run(topup_all(args.target, dry_run=args.dry_run,
-                          session_filter=args.session))
+    with profiling.run("vault-topup"):
+        asyncio.run(topup_all(args.target, dry_run=args.dry_run,
+                              session_filter=args.session, parallel=args.parallel))
@@ -9,7 +9,9 @@ import json
 import sys
 import numpy as np
 from pathlib import Path
-import whisper
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import asr_client
 
 VAULT = Path("content/audio-free/vault")
 V5 = Path("reference/v5-test")
@@ -62,16 +64,11 @@ def main():
     all_samples = echo_samples + pass_samples
     print(f"Samples: {len(echo_samples)} ECHO, {len(pass_samples)} PASS\n")
 
-    print("Loading Whisper base...")
-    model = whisper.load_model("base")
-
+    # One batch through the ASR server (or an in-process Whisper base model)
     print("Transcribing with detailed output...")
-    for i, s in enumerate(all_samples):
-        result = model.transcribe(
-            s["wav"],
-            language="en",
-            word_timestamps=True,
-        )
+    transcripts = asr_client.transcribe([s["wav"] for s in all_samples],
+                                        language="en", word_timestamps=True)
+    for i, (s, result) in enumerate(zip(all_samples, transcripts)):
 
         # Segment-level features
         segs = result.get("segments", [])
@@ -181,8 +178,8 @@ def main():
             if echo_val is None:
                 continue
 
-            for alt_wav in alt_wavs:
-                result = model.transcribe(str(alt_wav), language="en", word_timestamps=True)
+            alt_results = asr_client.transcribe(alt_wavs, language="en", word_timestamps=True)
+            for result in alt_results:
                 segs = result.get("segments", [])
                 if not segs:
                     continue
@@ -18,6 +18,9 @@ import sys
 import numpy as np
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import asr_client
+
 VAULT = Path("content/audio-free/vault")
 V5 = Path("reference/v5-test")
 
@@ -51,35 +54,12 @@ def load_samples():
 
 
 def extract_whisper_embeddings(wav_paths, model_name="base"):
-    """Extract Whisper encoder embeddings for a list of WAV files."""
-    import whisper
-    import torch
-    import librosa
-
-    print(f"  Loading Whisper {model_name}...")
-    model = whisper.load_model(model_name)
-    model.eval()
-
-    embeddings = []
-    for i, wav_path in enumerate(wav_paths):
-        # Load and preprocess audio (Whisper expects 16kHz, padded to 30s)
-        audio = whisper.load_audio(wav_path)
-        audio = whisper.pad_or_trim(audio)  # 30s at 16kHz
-
-        # Get mel spectrogram (Whisper's input format)
-        mel = whisper.log_mel_spectrogram(audio).unsqueeze(0).to(model.device)
-
-        # Extract encoder output (all layers)
-        with torch.no_grad():
-            # Run through encoder
-            encoder_output = model.encoder(mel)
-            # encoder_output shape: (1, time_steps, d_model)
-            emb = encoder_output.squeeze(0).cpu().numpy()  # (T, D)
-
-        embeddings.append(emb)
-        if (i + 1) % 10 == 0:
-            print(f"  Extracted: {i+1}/{len(wav_paths)}")
+    """Extract Whisper encoder embeddings (first 30s, padded) for a list of WAV files.
 
+    Batched through the ASR server when it is running, else an in-process model.
+    """
+    print(f"  Encoding {len(wav_paths)} files with Whisper {model_name}...")
+    embeddings = asr_client.embed(wav_paths, model_name)
     print(f"  Extracted: {len(wav_paths)}/{len(wav_paths)} done")
     return embeddings
 
@@ -161,12 +141,7 @@ def compute_auc(echo_vals, pass_vals):
 def within_chunk_ranking_embeddings(echo_samples, echo_embeddings, model_name="base"):
     """For each echo chunk, compute embedding distance from pool centroid.
     If echo candidates are outliers, they should be farther from centroid."""
-    import whisper
-    import torch
-
-    print("\n  Loading Whisper for within-chunk ranking...")
-    model = whisper.load_model(model_name)
-    model.eval()
+    print("\n  Within-chunk ranking...")
 
     correct_centroid = 0
     correct_nearest = 0
@@ -195,12 +170,7 @@ def within_chunk_ranking_embeddings(echo_samples, echo_embeddings, model_name="b
         all_embeddings = [echo_embeddings[idx]]  # echo candidate embedding
         all_labels = [True]  # True = echo
 
-        for alt_wav in alt_wavs:
-            audio = whisper.load_audio(str(alt_wav))
-            audio = whisper.pad_or_trim(audio)
-            mel = whisper.log_mel_spectrogram(audio).unsqueeze(0).to(model.device)
-            with torch.no_grad():
-                enc = model.encoder(mel).squeeze(0).cpu().numpy()
+        for enc in asr_client.embed(alt_wavs, model_name):
             all_embeddings.append(enc)
             all_labels.append(False)
 
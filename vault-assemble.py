@@ -8,22 +8,27 @@ inserts humanized pauses, concatenates, loudnorm, runs 14 QA gates.
 Usage:
     python3 vault-assemble.py 52-the-court-of-your-mind
     python3 vault-assemble.py 52-the-court-of-your-mind --skip-qa
+    python3 vault-assemble.py 52-the-court-of-your-mind --full   # ignore splice cache
 """
 
 import argparse
+import hashlib
 import importlib.util
 import json
-import os
 import re
 import shutil
 import subprocess
 import sys
-import tempfile
 import wave
 from pathlib import Path
 
 import numpy as np
 
+# qa_runner.py must be importable by name in QA process-pool workers
+sys.path.insert(0, str(Path(__file__).parent))
+import profiling
+import qa_runner
+
 # ---------------------------------------------------------------------------
 # Load build-session-v3.py
 # ---------------------------------------------------------------------------
@@ -34,6 +39,13 @@ _build_spec = importlib.util.spec_from_file_location(
 build = importlib.util.module_from_spec(_build_spec)
 _build_spec.loader.exec_module(build)
 
+r128 = build.loudness_module()
+
+_mixer_spec = importlib.util.spec_from_file_location(
+    "ambient_mixer", Path(__file__).parent / "ambient-mixer.py")
+mixer = importlib.util.module_from_spec(_mixer_spec)
+_mixer_spec.loader.exec_module(mixer)
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -58,6 +70,13 @@ DEFAULT_AMBIENT_GAINS = {
 # Garden ambient has 9.5s dead silence at start (Bible Production Rule 16)
 GARDEN_OFFSET_SEC = 10
 
+# Incremental re-assembly: faded chunk buffers + last layout live here (under final/)
+SPLICE_CACHE_DIR = "splice-cache"
+SPLICE_STATE_FILE = "splice-state.json"
+# Keep the previous loudnorm gain while the new mix stays this close to target,
+# so a pick swap doesn't rescale (and re-mix) the whole session
+GAIN_REUSE_TOLERANCE_LU = 0.5
+
 # CDN cache purge — load from .env
 _env_path = Path(__file__).parent / ".env"
 _env_vars = {}
@@ -177,80 +196,213 @@ def copy_picks(session_dir, picks_data):
     return copied
 
 
-def apply_edge_fades(wav_path, output_path, fade_ms=15):
-    """Apply 15ms cosine edge fades to a WAV chunk."""
-    fade_sec = fade_ms / 1000
-    duration = build.get_audio_duration(str(wav_path))
-    fade_out_start = max(0, duration - fade_sec)
-    subprocess.run([
+def _fade_length(fade_ms, sample_rate=SAMPLE_RATE):
+    """Fade length in samples, rounded the way ffmpeg rescales afade's d=."""
+    return int(fade_ms * sample_rate / 1000 + 0.5)
+
+
+def hsin_fade(samples, fade_samples, fade_in):
+    """Apply an afade curve=hsin ramp in place to an int16 array.
+
+    Mirrors ffmpeg's s16 path: gain = (1 - cos(pi * pos / N)) / 2, product
+    truncated toward zero. A fade-out ends on the last sample.
+    """
+    n = min(fade_samples, len(samples))
+    if n <= 0:
+        return samples
+    if fade_in:
+        pos = np.arange(n)
+        seg = samples[:n]
+    else:
+        pos = np.arange(fade_samples, fade_samples - n, -1)
+        seg = samples[-n:]
+    gain = (1.0 - np.cos(np.pi * pos / fade_samples)) / 2.0
+    seg[:] = np.trunc(seg * gain).astype(np.int16)
+    return samples
+
+
+def load_pick(wav_path):
+    """Read a picked chunk as mono int16 at SAMPLE_RATE.
+
+    Fish output is already 44.1kHz mono PCM and is read straight from the
+    header; anything else goes through ffmpeg once.
+    """
+    samples, sr, nc = _read_wav_as_int16(wav_path)
+    if sr == SAMPLE_RATE and nc == 1:
+        return samples.copy()
+    result = subprocess.run([
         'ffmpeg', '-y', '-i', str(wav_path),
-        '-af', (f'afade=t=in:st=0:d={fade_sec}:curve=hsin,'
-                f'afade=t=out:st={fade_out_start}:d={fade_sec}:curve=hsin'),
-        '-c:a', 'pcm_s16le', '-ar', str(SAMPLE_RATE),
-        str(output_path)
-    ], capture_output=True, check=True)
-    return output_path
+        '-ac', '1', '-ar', str(SAMPLE_RATE),
+        '-f', 's16le', '-acodec', 'pcm_s16le', 'pipe:1'
+    ], capture_output=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to decode {wav_path}: {result.stderr[:500]}")
+    return np.frombuffer(result.stdout, dtype=np.int16).copy()
 
 
-def generate_silence(duration_sec, output_path):
-    """Generate a silent WAV of the given duration."""
-    subprocess.run([
-        'ffmpeg', '-y', '-f', 'lavfi',
-        '-i', f'anullsrc=channel_layout=mono:sample_rate={SAMPLE_RATE}',
-        '-t', str(duration_sec),
-        '-c:a', 'pcm_s16le',
-        str(output_path)
-    ], capture_output=True, check=True)
-    return output_path
+def _chunk_key(wav_path, closing, edge_n, tail_n):
+    """Cache key for a faded chunk buffer: pick content + fades applied."""
+    wav_hash = build.audio_features_module().default_store().wav_hash(wav_path)
+    blob = f"{wav_hash}:{int(closing)}:{edge_n}:{tail_n if closing else 0}"
+    return hashlib.sha256(blob.encode()).hexdigest()[:24]
 
 
-def concatenate_wavs(file_list, output_path):
-    """Concatenate WAV files using ffmpeg concat demuxer."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-        for wav in file_list:
-            f.write(f"file '{wav}'\n")
-        list_path = f.name
+def splice_chunks(chunks, edge_fade_ms=15, tail_fade_ms=150, cache_dir=None):
+    """Splice picked chunks and pauses into one int16 voice buffer.
 
-    try:
-        subprocess.run([
-            'ffmpeg', '-y', '-f', 'concat', '-safe', '0',
-            '-i', list_path,
-            '-c:a', 'pcm_s16le', '-ar', str(SAMPLE_RATE),
-            str(output_path)
-        ], capture_output=True, check=True)
-    finally:
-        os.remove(list_path)
+    chunks: list of (chunk_index, wav_path, text, pause_sec, closing).
+    Each WAV is read once; the closing chunk gets the 150ms tail fade
+    (Bible Section 13), every chunk gets 15ms hsin edge fades, pauses are
+    zero runs. Segment times come from sample counts. With `cache_dir`,
+    faded buffers are stored as .npy keyed by pick content and reused.
 
-    return output_path
+    Returns (samples, segments, layout) — layout is one
+    {index, key, samples, pause_samples} per chunk, for changed_spans().
+    """
+    edge_n = _fade_length(edge_fade_ms)
+    tail_n = _fade_length(tail_fade_ms)
+
+    pieces = []
+    total = 0
+    reused = 0
+    for ci, wav_path, text, pause, closing in chunks:
+        key = cached = None
+        if cache_dir is not None:
+            key = _chunk_key(wav_path, closing, edge_n, tail_n)
+            cached = cache_dir / f"{key}.npy"
+        if cached is not None and cached.exists():
+            samples = np.load(cached)
+            reused += 1
+        else:
+            samples = load_pick(wav_path)
+            if closing:
+                hsin_fade(samples, tail_n, fade_in=False)
+            hsin_fade(samples, edge_n, fade_in=True)
+            hsin_fade(samples, edge_n, fade_in=False)
+            if cached is not None:
+                np.save(cached, samples)
+        silence_n = int(pause * SAMPLE_RATE + 0.5) if pause > 0 else 0
+        pieces.append((ci, key, text, samples, silence_n, closing))
+        total += len(samples) + silence_n
+
+    out = np.zeros(total, dtype=np.int16)
+    segments = []
+    layout = []
+    pos = 0
+    for ci, key, text, samples, silence_n, closing in pieces:
+        if closing:
+            print(f"  c{ci:02d}: {tail_fade_ms}ms closing tail fade applied")
+        n = len(samples)
+        out[pos:pos + n] = samples
+        segments.append({
+            'type': 'text', 'index': ci,
+            'start_time': pos / SAMPLE_RATE,
+            'end_time': (pos + n) / SAMPLE_RATE,
+            'duration': n / SAMPLE_RATE, 'text': text
+        })
+        layout.append({'index': ci, 'key': key, 'samples': n,
+                       'pause_samples': silence_n})
+        pos += n
+        print(f"  c{ci:02d}: {n / SAMPLE_RATE:.1f}s", end="")
+
+        if silence_n:
+            segments.append({
+                'type': 'silence',
+                'start_time': pos / SAMPLE_RATE,
+                'end_time': (pos + silence_n) / SAMPLE_RATE,
+                'duration': silence_n / SAMPLE_RATE
+            })
+            pos += silence_n
+            print(f" + {silence_n / SAMPLE_RATE:.1f}s silence", end="")
+        print()
 
+    if cache_dir is not None:
+        print(f"  Splice cache: {reused}/{len(pieces)} chunks reused")
+    return out, segments, layout
+
+
+def changed_spans(previous, layout):
+    """Voice-sample ranges [start, end) that differ between two splice layouts.
+
+    Chunks are compared in order. A swapped chunk of the same length (and
+    same pause) is a span of its own; once a length, pause or chunk index
+    differs every later sample has moved, so the last span runs to the end
+    of the voice (and the ambient tail after it).
+    """
+    total = sum(e['samples'] + e['pause_samples'] for e in layout)
+    spans = []
+    pos = 0
+    for i, entry in enumerate(layout):
+        old = previous[i] if i < len(previous) else None
+        shape = (entry['index'], entry['samples'], entry['pause_samples'])
+        if old is None or (old['index'], old['samples'], old['pause_samples']) != shape:
+            spans.append((pos, total))
+            return spans
+        if old['key'] != entry['key']:
+            spans.append((pos, pos + entry['samples']))
+        pos += entry['samples'] + entry['pause_samples']
+    if len(previous) != len(layout):
+        spans.append((total, total))    # trailing chunks dropped — tail moved
+    return spans
+
+
+def load_splice_state(cache_dir):
+    """Layout, gain and ambient settings of the last completed assembly (or None)."""
+    path = cache_dir / SPLICE_STATE_FILE
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text())
+    except json.JSONDecodeError:
+        return None
+
+
+def save_splice_state(cache_dir, state):
+    """Record a completed assembly and drop cached buffers it no longer uses."""
+    (cache_dir / SPLICE_STATE_FILE).write_text(json.dumps(state, indent=2))
+    keep = {f"{e['key']}.npy" for e in state['layout']}
+    for npy in cache_dir.glob("*.npy"):
+        if npy.name not in keep:
+            npy.unlink()
+
+
+def measure_loudness(voice, segments):
+    """BS.1770 measurement of the spliced voice, assembled from per-segment
+    measurements. Chunk measurements are cached by content hash, so after a
+    pick swap only the new chunk is analysed; pauses are zero runs."""
+    parts = []
+    for seg in segments:
+        start = int(round(seg['start_time'] * SAMPLE_RATE))
+        end = int(round(seg['end_time'] * SAMPLE_RATE))
+        if seg['type'] == 'silence':
+            parts.append(r128.silence_measurement(end - start, SAMPLE_RATE))
+        else:
+            parts.append(r128.measure_segment(voice[start:end], SAMPLE_RATE))
+    return r128.combine(parts)
 
-def loudnorm(input_path, output_path):
-    """Apply whole-file loudness normalisation (I=-26, TP=-2, LRA=11)."""
-    subprocess.run([
-        'ffmpeg', '-y', '-i', str(input_path),
-        '-af', 'loudnorm=I=-26:TP=-2:LRA=11',
-        '-c:a', 'pcm_s16le', '-ar', str(SAMPLE_RATE),
-        str(output_path)
-    ], capture_output=True, check=True)
-    return output_path
 
+def loudnorm(voice, segments, previous_gain=None):
+    """Whole-file loudness normalisation (I=-26, TP=-2), linear two-pass.
 
-def apply_closing_tail_fade(wav_path, output_path, fade_ms=150):
-    """Apply 150ms fade-out to closing chunk WAV (Bible Section 13).
+    If `previous_gain` still lands within GAIN_REUSE_TOLERANCE_LU of target
+    (and under the peak ceiling) it is kept, leaving unchanged spans
+    bit-identical to the last assembly.
 
-    Fish truncates final generations regardless of text. The tail fade
-    smooths any abrupt ending on the last chunk of a session.
+    Returns (normalised int16 samples, loudness report, gain in dB).
     """
-    fade_sec = fade_ms / 1000
-    duration = build.get_audio_duration(str(wav_path))
-    fade_out_start = max(0, duration - fade_sec)
-    subprocess.run([
-        'ffmpeg', '-y', '-i', str(wav_path),
-        '-af', f'afade=t=out:st={fade_out_start}:d={fade_sec}:curve=hsin',
-        '-c:a', 'pcm_s16le', '-ar', str(SAMPLE_RATE),
-        str(output_path)
-    ], capture_output=True, check=True)
-    return output_path
+    measurement = measure_loudness(voice, segments)
+    summary = r128.summarise(measurement)
+    gain = r128.normalisation_gain(summary, target_i=-26, target_tp=-2)
+    reused = (previous_gain is not None
+              and abs(summary['integrated'] + previous_gain + 26) <= GAIN_REUSE_TOLERANCE_LU
+              and summary['true_peak'] + previous_gain <= -2)
+    if reused:
+        gain = previous_gain
+    normed, report = r128.loudnorm(voice, SAMPLE_RATE, target_i=-26, target_tp=-2,
+                                   measurement=measurement, gain_db=gain)
+    if reused:
+        report['gain_reused'] = True
+    return normed.reshape(-1), report, gain
 
 
 def encode_mp3(input_wav, output_mp3):
@@ -282,26 +434,6 @@ def _write_wav_int16(samples, sample_rate, n_channels, output_path):
         wf.writeframes(samples.astype(np.int16).tobytes())
 
 
-def _load_ambient_as_mono_int16(ambient_path, offset_sec=0):
-    """Load an ambient file (MP3 or WAV) as mono int16 numpy array.
-
-    Uses ffmpeg to decode to raw PCM, skipping offset_sec from start.
-    """
-    cmd = ['ffmpeg', '-y']
-    if offset_sec > 0:
-        cmd += ['-ss', str(offset_sec)]
-    cmd += [
-        '-i', str(ambient_path),
-        '-ac', '1', '-ar', str(SAMPLE_RATE),
-        '-f', 's16le', '-acodec', 'pcm_s16le',
-        'pipe:1'
-    ]
-    result = subprocess.run(cmd, capture_output=True)
-    if result.returncode != 0:
-        raise RuntimeError(f"Failed to decode ambient: {result.stderr[:500]}")
-    return np.frombuffer(result.stdout, dtype=np.int16)
-
-
 def find_ambient_file(ambient_name):
     """Find an ambient file by name, preferring 8hr versions then extended."""
     project_root = Path(__file__).parent
@@ -356,7 +488,6 @@ def mix_ambient(voice_wav, ambient_name, output_wav, gain_db=None,
     # Determine gain
     if gain_db is None:
         gain_db = DEFAULT_AMBIENT_GAINS.get(ambient_name, -14)
-    gain_linear = 10 ** (gain_db / 20.0)
 
     # Determine garden offset
     offset_sec = GARDEN_OFFSET_SEC if 'garden' in ambient_name else 0
@@ -366,77 +497,78 @@ def mix_ambient(voice_wav, ambient_name, output_wav, gain_db=None,
     if offset_sec:
         print(f"  Garden offset: skipping first {offset_sec}s")
 
-    # Load voice (already loudnormed)
-    voice_samples, sr, nc = _read_wav_as_int16(voice_wav)
-    voice_len = len(voice_samples)
+    # Stream voice (already loudnormed) + ambient frame by frame:
+    # pre-roll silence, voice, post-roll silence; numpy direct addition
+    # (Bible: NEVER use ffmpeg amix)
+    layer = mixer.AmbientLayer(ambient_path, gain_db, offset_sec=offset_sec)
+    stats = mixer.mix_to_wav(voice_wav, [layer], output_wav,
+                             fade_in_sec=fade_in_sec, fade_out_sec=fade_out_sec)
 
-    # Prepend structural pre-roll silence (voice delayed by fade_in_sec)
-    preroll_samples = int(fade_in_sec * sr)
-    silence_preroll = np.zeros(preroll_samples, dtype=np.int16)
-
-    # Append post-roll silence (ambient fades out after voice ends)
-    postroll_samples = int(fade_out_sec * sr)
-    silence_postroll = np.zeros(postroll_samples, dtype=np.int16)
-
-    voice_with_preroll = np.concatenate([silence_preroll, voice_samples, silence_postroll])
-    total_len = len(voice_with_preroll)
-
-    voice_dur = voice_len / sr
-    total_dur = total_len / sr
-    print(f"  Voice: {voice_dur:.1f}s → with {fade_in_sec}s pre-roll + {fade_out_sec}s post-roll: {total_dur:.1f}s")
-
-    # Load ambient
-    ambient_raw = _load_ambient_as_mono_int16(ambient_path, offset_sec=offset_sec)
-    if len(ambient_raw) < total_len:
-        raise ValueError(
-            f"Ambient too short ({len(ambient_raw)/sr:.0f}s) for voice "
-            f"({total_dur:.0f}s). Bible: ambient must be longer than voice, NEVER loop.")
-
-    # Trim ambient to match voice length
-    ambient = ambient_raw[:total_len].astype(np.float64)
-
-    # Apply gain
-    ambient *= gain_linear
-
-    # Apply fade-in ramp (linear, over first fade_in_sec)
-    fade_in_samples = int(fade_in_sec * sr)
-    if fade_in_samples > 0 and fade_in_samples <= len(ambient):
-        fade_in_ramp = np.linspace(0.0, 1.0, fade_in_samples)
-        ambient[:fade_in_samples] *= fade_in_ramp
-
-    # Apply fade-out ramp (linear, over last fade_out_sec)
-    fade_out_samples = int(fade_out_sec * sr)
-    if fade_out_samples > 0 and fade_out_samples <= len(ambient):
-        fade_out_ramp = np.linspace(1.0, 0.0, fade_out_samples)
-        ambient[-fade_out_samples:] *= fade_out_ramp
-
-    # Mix using numpy direct addition (Bible: NEVER use ffmpeg amix)
-    voice_float = voice_with_preroll.astype(np.float64)
-    mixed = np.clip(voice_float + ambient, -32768, 32767).astype(np.int16)
-
-    # Write output
-    _write_wav_int16(mixed, sr, 1, output_wav)
+    sr = SAMPLE_RATE
+    voice_dur = stats['voice_samples'] / sr
+    mixed_dur = stats['total_samples'] / sr
+    print(f"  Voice: {voice_dur:.1f}s → with {fade_in_sec}s pre-roll + "
+          f"{fade_out_sec}s post-roll: {mixed_dur:.1f}s")
 
     # Verification checklist (Bible Section 11)
-    _verify_mix(mixed, sr, fade_in_sec, voice_dur)
+    _verify_mix(stats['rms_db'], fade_in_sec)
 
-    mixed_dur = len(mixed) / sr
     print(f"  Mixed output: {mixed_dur:.1f}s ({mixed_dur/60:.1f} min)")
     return output_wav
 
 
-def _verify_mix(mixed, sr, fade_in_sec, voice_dur):
-    """Run Bible verification checklist on the mixed audio."""
-    def rms_db(samples):
-        rms = np.sqrt(np.mean(samples.astype(np.float64) ** 2))
-        return 20 * np.log10(max(rms, 1e-10) / 32768)
+def ambient_settings(ambient_name, gain_db=None, fade_in_sec=30, fade_out_sec=60):
+    """Everything that determines the ambient bed, for comparing assemblies."""
+    ambient_path = find_ambient_file(ambient_name)
+    if ambient_path is None:
+        return None
+    st = ambient_path.stat()
+    return {
+        'name': ambient_name,
+        'path': str(ambient_path), 'size': st.st_size, 'mtime_ns': st.st_mtime_ns,
+        'gain_db': gain_db if gain_db is not None else DEFAULT_AMBIENT_GAINS.get(ambient_name, -14),
+        'fade_in': fade_in_sec, 'fade_out': fade_out_sec,
+    }
+
 
+def remix_ambient_spans(voice_wav, spans, mixed_wav, settings):
+    """Re-mix only `spans` of an existing ambient mix.
+
+    voice_wav is the new loudnormed voice; spans are voice-sample ranges
+    from changed_spans(). Samples outside the spans are kept from mixed_wav,
+    which must be the mix of the previous assembly with the same settings.
+    A span that reaches the end of the voice also re-mixes the post-roll
+    (and lengthens or shortens the file). Ambient comes from the memmapped
+    PCM cache, so each span is a slice.
+    """
+    sr = SAMPLE_RATE
+    offset_sec = GARDEN_OFFSET_SEC if 'garden' in settings['name'] else 0
+    layer = mixer.AmbientLayer(Path(settings['path']), settings['gain_db'],
+                               offset_sec=offset_sec)
+    preroll = int(settings['fade_in'] * sr)
+    with wave.open(str(voice_wav), 'rb') as wf:
+        voice_len = wf.getnframes()
+    total_len = preroll + voice_len + int(settings['fade_out'] * sr)
+    mix_spans = [(preroll + a, total_len if b >= voice_len else preroll + b)
+                 for a, b in spans]
+
+    stats = mixer.mix_to_wav(voice_wav, [layer], mixed_wav,
+                             fade_in_sec=settings['fade_in'],
+                             fade_out_sec=settings['fade_out'],
+                             base_wav=mixed_wav, spans=mix_spans)
+    remixed = sum(b - a for a, b in mix_spans)
+    print(f"  Ambient: re-mixed {len(spans)} span(s), {remixed / sr:.1f}s of "
+          f"{total_len / sr:.1f}s")
+    _verify_mix(stats['rms_db'], settings['fade_in'])
+    return mixed_wav
+
+
+def _verify_mix(rms, fade_in_sec):
+    """Run Bible verification checklist on the mix's window RMS levels
+    (dBFS per window, as collected by ambient-mixer.py while streaming)."""
     # Check 1: Pre-roll RMS should rise from ~-76dB to ~-38dB over fade_in_sec
-    window = int(5 * sr)  # 5s windows
-    preroll_end = int(fade_in_sec * sr)
-    if preroll_end > window:
-        rms_start = rms_db(mixed[:window])
-        rms_end = rms_db(mixed[preroll_end - window:preroll_end])
+    if 'preroll_start' in rms:
+        rms_start, rms_end = rms['preroll_start'], rms['preroll_end']
         print(f"  Verify: Pre-roll RMS 0-5s={rms_start:.1f}dB, "
               f"{fade_in_sec-5}-{fade_in_sec}s={rms_end:.1f}dB "
               f"(should rise)")
@@ -444,18 +576,13 @@ def _verify_mix(mixed, sr, fade_in_sec, voice_dur):
             print(f"  WARNING: Pre-roll RMS not rising — check ambient mix")
 
     # Check 2: Voice entry should show >20dB RMS jump
-    voice_start = preroll_end
-    if voice_start + window < len(mixed):
-        rms_before = rms_db(mixed[voice_start - window:voice_start])
-        rms_after = rms_db(mixed[voice_start:voice_start + window])
-        jump = rms_after - rms_before
+    if 'voice_after' in rms:
+        jump = rms['voice_after'] - rms['voice_before']
         print(f"  Verify: Voice entry RMS jump={jump:.1f}dB (should be >20dB)")
 
     # Check 3: Tail should fade
-    tail_5s = int(5 * sr)
-    if len(mixed) > tail_5s:
-        rms_tail = rms_db(mixed[-tail_5s:])
-        print(f"  Verify: Tail 5s RMS={rms_tail:.1f}dB (should be < -60dB)")
+    if 'tail' in rms:
+        print(f"  Verify: Tail 5s RMS={rms['tail']:.1f}dB (should be < -60dB)")
 
 
 def conditioning_chain_hf_scan(wav_path, window_sec=10, threshold_db=-36):
@@ -504,100 +631,82 @@ def conditioning_chain_hf_scan(wav_path, window_sec=10, threshold_db=-36):
     return passed, flagged
 
 
+def load_script_metadata(session_id):
+    """Script header metadata for the QA gates ({} if there is no script)."""
+    script_path = Path("content/scripts") / f"{session_id}.txt"
+    if not script_path.exists():
+        print(f"  WARNING: No script found at {script_path} — Gate 12 will skip")
+        return {}
+    script_metadata = build.parse_script(script_path)
+    # parse_script captures 'duration' but not 'duration-target' —
+    # vault scripts use Duration-Target header (just a number)
+    if not script_metadata.get('duration'):
+        header = script_path.read_text().split('---')[0]
+        match = re.search(r'Duration-Target:\s*(\d+)', header)
+        if match:
+            script_metadata['duration'] = f"{match.group(1)} min"
+    return script_metadata
+
+
 def run_vault_qa(session_id, final_wav, raw_wav, final_mp3, assembly_manifest,
-                 metadata, output_dir):
+                 metadata, output_dir, fail_fast=False, workers=build.QA_WORKERS,
+                 catalogue_repeats=False, voice_wav=None):
     """Run post-assembly QA gates (1,2,3,5,7,8,9,10,11,12,13) per Bible v4.1.
 
     Gates 4, 6, 14 are pre-vault advisory only (handled by human A/B picking).
+    Gates run in parallel via qa_runner (nothing here rewrites the audio);
+    Gate 9 runs last. fail_fast stops at the first failed gate.
+    catalogue_repeats has Gate 8 report near-duplicates in other sessions.
+    voice_wav (the voice-only -vault-voice.wav) is what Gates 8 and 10
+    transcribe: its timeline matches the manifest, which final_wav's ambient
+    pre-roll shifts.
     Returns True if all gates pass, False otherwise.
     """
-    gate_results = {}
-    any_failed = False
     normed = str(final_wav)
     raw = str(raw_wav)
+    voice = str(voice_wav) if voice_wav else normed
+    names = {
+        1: 'Quality Benchmarks', 2: 'Click Artifacts', 3: 'Spectral Comparison',
+        5: 'Loudness Consistency', 7: 'Volume Surge/Drop', 8: 'Repeated Content',
+        10: 'Speech Rate', 11: 'Silence Integrity', 12: 'Duration Accuracy',
+        9: 'Energy Spike',
+    }
 
-    # Gate 1: Quality Benchmarks
-    print(f"\n  --- Gate 1: Quality Benchmarks ---")
-    passed, details = build.qa_quality_check(normed, assembly_manifest)
-    gate_results[1] = {'name': 'Quality Benchmarks', 'passed': passed, 'details': details}
-    if not passed:
-        any_failed = True
-
-    # Gate 2: Click Scan (detection only — no auto-patching in vault)
-    print(f"\n  --- Gate 2: Click Artifacts ---")
-    clicks = build.scan_for_clicks(normed, assembly_manifest)
-    passed = len(clicks) == 0
-    gate_results[2] = {'name': 'Click Artifacts', 'passed': passed,
-                       'details': {'clicks_found': len(clicks), 'clicks': clicks}}
-    if not passed:
-        any_failed = True
-        print(f"  FAIL: {len(clicks)} click(s) detected")
-    else:
-        print(f"  PASS: No clicks detected")
-
-    # Gate 3: Spectral Comparison
-    print(f"\n  --- Gate 3: Spectral Comparison ---")
-    passed, details = build.qa_independent_check(normed, assembly_manifest)
-    gate_results[3] = {'name': 'Spectral Comparison', 'passed': passed, 'details': details}
-    if not passed:
-        any_failed = True
-
-    # Gate 5: Loudness Consistency
-    print(f"\n  --- Gate 5: Loudness Consistency ---")
-    passed, details = build.qa_loudness_consistency_check(normed, assembly_manifest)
-    gate_results[5] = {'name': 'Loudness Consistency', 'passed': passed, 'details': details}
-    if not passed:
-        any_failed = True
-
-    # Gate 7: Volume Surge/Drop (raw pre-loudnorm for natural dynamics)
-    print(f"\n  --- Gate 7: Volume Surge/Drop ---")
-    passed, details = build.qa_volume_surge_check(raw, assembly_manifest)
-    gate_results[7] = {'name': 'Volume Surge/Drop', 'passed': passed, 'details': details}
-    if not passed:
-        any_failed = True
-
-    # Gate 8: Repeated Content
-    print(f"\n  --- Gate 8: Repeated Content ---")
-    expected_reps = metadata.get('expected_repetitions')
-    passed, details = build.qa_repeated_content_check(normed, assembly_manifest,
-                                                       expected_repetitions=expected_reps)
-    gate_results[8] = {'name': 'Repeated Content', 'passed': passed, 'details': details}
-    if not passed:
-        any_failed = True
-
-    # Gate 10: Speech Rate
-    print(f"\n  --- Gate 10: Speech Rate ---")
-    passed, details = build.qa_speech_rate_check(normed, assembly_manifest)
-    gate_results[10] = {'name': 'Speech Rate', 'passed': passed, 'details': details}
-    if not passed:
-        any_failed = True
-
-    # Gate 11: Silence Integrity
-    print(f"\n  --- Gate 11: Silence Integrity ---")
-    passed, details = build.qa_silence_integrity_check(normed, assembly_manifest)
-    gate_results[11] = {'name': 'Silence Integrity', 'passed': passed, 'details': details}
-    if not passed:
-        any_failed = True
-
-    # Gate 12: Duration Accuracy
-    print(f"\n  --- Gate 12: Duration Accuracy ---")
-    passed, details = build.qa_duration_accuracy_check(str(final_mp3), metadata)
-    gate_results[12] = {'name': 'Duration Accuracy', 'passed': passed, 'details': details}
-    if not passed:
-        any_failed = True
+    def gate9_input(results):
+        return {'gate_results': {f"Gate {k}: {names[k]}": v for k, v in results.items()}}
+
+    G = qa_runner.GateSpec
+    specs = [
+        G(1, build.qa_quality_check, (normed, assembly_manifest), reads=(normed,)),
+        # Detection only — no auto-patching in vault
+        G(2, build.qa_click_scan_check, (normed, assembly_manifest), reads=(normed,)),
+        G(3, build.qa_independent_check, (normed, assembly_manifest), reads=(normed,)),
+        G(5, build.qa_loudness_consistency_check, (normed, assembly_manifest), reads=(normed,)),
+        # Raw pre-loudnorm for natural dynamics
+        G(7, build.qa_volume_surge_check, (raw, assembly_manifest), reads=(raw,)),
+        G(8, build.qa_repeated_content_check, (voice, assembly_manifest),
+          {'expected_repetitions': metadata.get('expected_repetitions'),
+           'session_name': session_id, 'catalogue': catalogue_repeats}, reads=(voice,)),
+        # After Gate 8: reads the Whisper transcript Gate 8 cached beside the WAV
+        G(10, build.qa_speech_rate_check, (voice, assembly_manifest), reads=(voice,),
+          after=(8,)),
+        G(11, build.qa_silence_integrity_check, (normed, assembly_manifest), reads=(normed,)),
+        G(12, build.qa_duration_accuracy_check, (str(final_mp3), metadata), reads=(str(final_mp3),)),
+    ]
+    # Gate 9: Energy Spike + Visual Report (always last — uses cumulative results)
+    specs.append(G(9, build.qa_visual_report, (normed, assembly_manifest, session_id),
+                   {'output_dir': str(output_dir)}, reads=(normed,),
+                   after=tuple(s.name for s in specs), prepare=gate9_input))
+
+    results = qa_runner.run_gates(specs, workers=workers, fail_fast=fail_fast,
+                                  ctx=build.QAContext(),
+                                  header=lambda k: f"\n  --- Gate {k}: {names[k]} ---")
+    gate_results = {k: {'name': names[k], **v} for k, v in results.items()}
 
     # Gate 13: Ambient Continuity — skipped (ambient not mixed yet at assembly)
     print(f"\n  --- Gate 13: Ambient Continuity --- SKIPPED (pre-ambient)")
     gate_results[13] = {'name': 'Ambient Continuity', 'passed': True, 'skipped': True}
-
-    # Gate 9: Energy Spike + Visual Report (always last — uses cumulative results)
-    print(f"\n  --- Gate 9: Energy Spike + Visual Report ---")
-    g9_input = {f"Gate {k}: {v['name']}": v for k, v in gate_results.items()}
-    passed, details, report_path = build.qa_visual_report(
-        normed, assembly_manifest, session_id, g9_input, output_dir=str(output_dir))
-    gate_results[9] = {'name': 'Energy Spike', 'passed': passed, 'details': details}
-    if not passed:
-        any_failed = True
+    any_failed = any(not v.get('passed') for v in gate_results.values())
 
     # Summary
     passed_count = sum(1 for v in gate_results.values()
@@ -621,15 +730,23 @@ def run_vault_qa(session_id, final_wav, raw_wav, final_mp3, assembly_manifest,
     return not any_failed, gate_results
 
 
+@profiling.span('assemble')
 def assemble(session_id, skip_qa=False, no_humanize=False,
              ambient=None, ambient_gain=None, fade_in=30, fade_out=60,
-             picks_path=None, output_dir=None):
+             picks_path=None, output_dir=None, incremental=True, fail_fast=False,
+             catalogue_repeats=False):
     """Full assembly pipeline for a vault session.
 
     Bible v4.6 Section 16D pipeline:
       voice WAV → prepend silence → loudnorm voice-only →
       mix ambient (post-loudnorm, numpy) → MP3 (no second loudnorm)
+
+    incremental=True reuses the splice cache in final/: unchanged picks are
+    not re-read, and if the loudnorm gain and ambient settings carry over
+    only the spans whose chunks changed (to the end, once a length changes)
+    are re-mixed before the MP3 re-encode.
     """
+    profiling.annotate(session=session_id)
     session_dir = VAULT_DIR / session_id
 
     if not session_dir.exists():
@@ -657,6 +774,7 @@ def assemble(session_id, skip_qa=False, no_humanize=False,
         print(f"  Only {len(picked_chunks)}/{total_chunks} chunks will be assembled.")
 
     # Copy picks
+    profiling.phase('copy picks')
     copied = copy_picks(session_dir, picks_data)
 
     # Get pause data from manifest
@@ -687,112 +805,96 @@ def assemble(session_id, skip_qa=False, no_humanize=False,
         if n_explicit:
             print(f"  Pauses: {n_explicit} explicit [SILENCE] kept exact, rest humanized")
 
-    # Process in temp directory
-    with tempfile.TemporaryDirectory() as tmp:
-        tmp = Path(tmp)
-        concat_files = []
-        segments = []
-        current_time = 0.0
-
-        is_last_chunk = {copied[-1][0]} if copied else set()
-
-        for i, (ci, pick_wav) in enumerate(copied):
-            text, pause = humanized[i]
-
-            # Apply 150ms closing tail fade on final chunk (Bible Section 13)
-            if ci in is_last_chunk:
-                tail_faded = tmp / f"c{ci:02d}_tailfade.wav"
-                apply_closing_tail_fade(pick_wav, tail_faded, fade_ms=150)
-                pick_wav = tail_faded
-                print(f"  c{ci:02d}: 150ms closing tail fade applied")
-
-            # Apply edge fades
-            faded = tmp / f"c{ci:02d}_faded.wav"
-            apply_edge_fades(pick_wav, faded)
-            concat_files.append(str(faded))
-
-            dur = build.get_audio_duration(str(faded))
-            segments.append({
-                'type': 'text', 'index': ci,
-                'start_time': current_time,
-                'end_time': current_time + dur,
-                'duration': dur, 'text': text
-            })
-            current_time += dur
-            print(f"  c{ci:02d}: {dur:.1f}s", end="")
-
-            # Insert silence after chunk (if any)
-            if pause > 0:
-                silence = tmp / f"silence_{ci:02d}_{pause:.1f}s.wav"
-                generate_silence(pause, silence)
-                concat_files.append(str(silence))
-                segments.append({
-                    'type': 'silence',
-                    'start_time': current_time,
-                    'end_time': current_time + pause,
-                    'duration': pause
-                })
-                current_time += pause
-                print(f" + {pause:.1f}s silence", end="")
-
-            print()
-
-        # Concatenate
-        print(f"\n  Concatenating {len(concat_files)} segments...")
-        raw_concat = tmp / "concat_raw.wav"
-        concatenate_wavs(concat_files, raw_concat)
-        raw_dur = build.get_audio_duration(str(raw_concat))
-        print(f"  Raw concatenation: {raw_dur:.1f}s ({raw_dur/60:.1f} min)")
-
-        # Loudnorm
-        print(f"  Applying loudnorm (I=-26, TP=-2, LRA=11)...")
-        normed = tmp / "concat_normed.wav"
-        loudnorm(raw_concat, normed)
-
-        # Copy to final directory
-        if output_dir:
-            final_dir = Path(output_dir)
-        else:
-            final_dir = session_dir / "final"
-        final_dir.mkdir(parents=True, exist_ok=True)
-
-        # Save voice-only loudnormed WAV (always useful for re-mixing)
-        voice_wav = final_dir / f"{session_id}-vault-voice.wav"
-        shutil.copy2(normed, voice_wav)
-        print(f"  Voice WAV (loudnormed): {voice_wav}")
-
-        # Also save raw concat for QA (click scanner needs pre-loudnorm)
-        raw_copy = final_dir / f"{session_id}-vault-raw.wav"
-        shutil.copy2(raw_concat, raw_copy)
-
-        # Post-assembly HF scan for conditioning chain contamination (L-30)
-        print(f"\n  --- Conditioning Chain HF Scan (Production Rule 19) ---")
-        hf_passed, hf_flagged = conditioning_chain_hf_scan(voice_wav)
-        if not hf_passed:
-            print(f"  WARNING: HF scan flagged {len(hf_flagged)} windows — "
-                  f"review for conditioning chain contamination before deploy")
-
-        # Ambient mixing (Bible v4.6: voice-first loudnorm, then ambient)
-        if ambient:
-            print(f"\n  --- Ambient Mixing (voice-first loudnorm pipeline) ---")
-            mixed_wav = final_dir / f"{session_id}-vault.wav"
-            mix_ambient(voice_wav, ambient, mixed_wav,
+    if output_dir:
+        final_dir = Path(output_dir)
+    else:
+        final_dir = session_dir / "final"
+    final_dir.mkdir(parents=True, exist_ok=True)
+
+    # Splice cache: faded chunk buffers by pick content + the last layout.
+    # The state file is removed until this run completes, so an interrupted
+    # assembly never leaves a mix that doesn't match its recorded layout.
+    cache_dir = final_dir / SPLICE_CACHE_DIR
+    cache_dir.mkdir(exist_ok=True)
+    previous = load_splice_state(cache_dir) if incremental else None
+    (cache_dir / SPLICE_STATE_FILE).unlink(missing_ok=True)
+
+    # Splice in memory: one read per changed pick, fades and pauses in numpy
+    profiling.phase('splice')
+    closing = copied[-1][0] if copied else None
+    chunks = [(ci, pick_wav, humanized[i][0], humanized[i][1], ci == closing)
+              for i, (ci, pick_wav) in enumerate(copied)]
+    voice, segments, layout = splice_chunks(chunks, cache_dir=cache_dir)
+
+    print(f"\n  Spliced {len(segments)} segments")
+    # Raw concat for QA (click scanner needs pre-loudnorm)
+    raw_copy = final_dir / f"{session_id}-vault-raw.wav"
+    _write_wav_int16(voice, SAMPLE_RATE, 1, raw_copy)
+    raw_dur = len(voice) / SAMPLE_RATE
+    print(f"  Raw concatenation: {raw_dur:.1f}s ({raw_dur/60:.1f} min)")
+
+    # Loudnorm
+    profiling.phase('loudnorm')
+    print(f"  Applying loudnorm (I=-26, TP=-2, linear two-pass)...")
+    normed_samples, loudness, gain = loudnorm(
+        voice, segments, previous_gain=previous['gain_db'] if previous else None)
+    print(f"  Loudness: {loudness['input_i']:.1f} → {loudness['output_i']:.1f} LUFS "
+          f"(gain {loudness['gain_db']:+.1f}dB"
+          f"{' reused' if loudness.get('gain_reused') else ''}, "
+          f"TP {loudness['output_tp']:.1f}dBTP, LRA {loudness['input_lra']:.1f} LU)")
+    if loudness.get('lra_over_target'):
+        print(f"  WARNING: LRA above 11 LU — linear gain does not compress dynamics")
+
+    # Save voice-only loudnormed WAV (always useful for re-mixing)
+    voice_wav = final_dir / f"{session_id}-vault-voice.wav"
+    _write_wav_int16(normed_samples, SAMPLE_RATE, 1, voice_wav)
+    del voice, normed_samples
+    print(f"  Voice WAV (loudnormed): {voice_wav}")
+
+    # Post-assembly HF scan for conditioning chain contamination (L-30)
+    profiling.phase('hf scan')
+    print(f"\n  --- Conditioning Chain HF Scan (Production Rule 19) ---")
+    hf_passed, hf_flagged = conditioning_chain_hf_scan(voice_wav)
+    if not hf_passed:
+        print(f"  WARNING: HF scan flagged {len(hf_flagged)} windows — "
+              f"review for conditioning chain contamination before deploy")
+
+    # Ambient mixing (Bible v4.6: voice-first loudnorm, then ambient)
+    profiling.phase('ambient')
+    settings = None
+    final_wav = final_dir / f"{session_id}-vault.wav"
+    if ambient:
+        print(f"\n  --- Ambient Mixing (voice-first loudnorm pipeline) ---")
+        settings = ambient_settings(ambient, ambient_gain, fade_in, fade_out)
+        spans = None
+        if (previous and settings and previous.get('ambient') == settings
+                and previous['gain_db'] == gain and final_wav.exists()):
+            spans = changed_spans(previous['layout'], layout)
+        if spans is None:
+            mix_ambient(voice_wav, ambient, final_wav,
                         gain_db=ambient_gain, fade_in_sec=fade_in,
                         fade_out_sec=fade_out)
-            final_wav = mixed_wav
+        elif spans:
+            remix_ambient_spans(voice_wav, spans, final_wav, settings)
         else:
-            # No ambient — just copy voice-only as final
-            final_wav = final_dir / f"{session_id}-vault.wav"
-            if final_wav != voice_wav:
-                shutil.copy2(voice_wav, final_wav)
-            print(f"  No ambient specified — voice-only output")
+            print(f"  Ambient: voice unchanged — keeping previous mix")
+    else:
+        # No ambient — just copy voice-only as final
+        shutil.copy2(voice_wav, final_wav)
+        print(f"  No ambient specified — voice-only output")
 
-        final_mp3 = final_dir / f"{session_id}-vault.mp3"
+    final_mp3 = final_dir / f"{session_id}-vault.mp3"
 
-        # Encode MP3 (the ONLY lossy step — no second loudnorm)
-        encode_mp3(final_wav, final_mp3)
-        mp3_size = final_mp3.stat().st_size / (1024 * 1024)
-        print(f"  Final MP3: {final_mp3} ({mp3_size:.1f} MB)")
+    # Encode MP3 (the ONLY lossy step — no second loudnorm)
+    profiling.phase('encode')
+    encode_mp3(final_wav, final_mp3)
+    mp3_size = final_mp3.stat().st_size / (1024 * 1024)
+    print(f"  Final MP3: {final_mp3} ({mp3_size:.1f} MB)")
+
+    save_splice_state(cache_dir, {
+        'layout': layout, 'gain_db': gain,
+        'ambient': settings if ambient else None,
+    })
 
     # Duration check
     final_dur = build.get_audio_duration(str(final_wav))
@@ -805,21 +907,10 @@ def assemble(session_id, skip_qa=False, no_humanize=False,
     print(f"  Assembly manifest: {manifest_out}")
 
     # Parse script metadata for Gate 12 (Duration Accuracy)
-    script_path = Path("content/scripts") / f"{session_id}.txt"
-    script_metadata = {}
-    if script_path.exists():
-        script_metadata = build.parse_script(script_path)
-        # parse_script captures 'duration' but not 'duration-target' —
-        # vault scripts use Duration-Target header (just a number)
-        if not script_metadata.get('duration'):
-            header = script_path.read_text().split('---')[0]
-            match = re.search(r'Duration-Target:\s*(\d+)', header)
-            if match:
-                script_metadata['duration'] = f"{match.group(1)} min"
-    else:
-        print(f"  WARNING: No script found at {script_path} — Gate 12 will skip")
+    script_metadata = load_script_metadata(session_id)
 
     # Run post-assembly QA gates (1,2,3,5,7,8,9,10,11,12,13)
+    profiling.phase('qa')
     qa_passed = None
     qa_gate_results = None
     if not skip_qa:
@@ -828,11 +919,13 @@ def assemble(session_id, skip_qa=False, no_humanize=False,
         print(f"{'='*70}")
         qa_passed, qa_gate_results = run_vault_qa(
             session_id, final_wav, raw_copy, final_mp3,
-            assembly_manifest, script_metadata, final_dir)
+            assembly_manifest, script_metadata, final_dir, fail_fast=fail_fast,
+            catalogue_repeats=catalogue_repeats, voice_wav=voice_wav)
     else:
         print(f"\n  QA skipped (--skip-qa)")
 
     # Build report
+    profiling.phase(None)
     report = {
         'session_id': session_id,
         'chunks_assembled': len(copied),
@@ -842,13 +935,15 @@ def assemble(session_id, skip_qa=False, no_humanize=False,
         'duration_seconds': round(final_dur, 1),
         'duration_minutes': round(final_dur / 60, 1),
         'picks_source': str(picks_data.get('reviewed', 'unknown')),
+        'loudness': loudness,
     }
     if qa_passed is not None:
         report['qa_passed'] = qa_passed
         report['qa_gates'] = 'post-assembly (1,2,3,5,7,8,9,10,11,12,13)'
         report['qa_summary'] = {
             str(gnum): {'name': r['name'], 'passed': r['passed'],
-                        **({'skipped': True} if r.get('skipped') else {})}
+                        **({'skipped': True} if r.get('skipped') else {}),
+                        **({'wall_time_s': r['wall_time_s']} if 'wall_time_s' in r else {})}
             for gnum, r in sorted(qa_gate_results.items())
         }
     report_path = final_dir / f"{session_id}-build-report.json"
@@ -894,13 +989,22 @@ def main():
                         help='Path to custom picks JSON (overrides vault picks)')
     parser.add_argument('--output-dir', type=str, default=None,
                         help='Output directory for assembled audio (default: vault dir)')
+    parser.add_argument('--full', action='store_true',
+                        help='Ignore the splice cache — re-splice and re-mix everything')
+    parser.add_argument('--fail-fast', action='store_true',
+                        help='Stop QA at the first failed gate (cancels outstanding gates)')
+    parser.add_argument('--catalogue-repeats', action='store_true',
+                        help='Gate 8: also report near-identical segments in other sessions')
     args = parser.parse_args()
 
-    success = assemble(args.session_id, skip_qa=args.skip_qa,
-                       no_humanize=args.no_humanize, ambient=args.ambient,
-                       ambient_gain=args.ambient_gain,
-                       fade_in=args.fade_in, fade_out=args.fade_out,
-                       picks_path=args.picks, output_dir=args.output_dir)
+    with profiling.run(f"vault-assemble {args.session_id}"):
+        success = assemble(args.session_id, skip_qa=args.skip_qa,
+                           no_humanize=args.no_humanize, ambient=args.ambient,
+                           ambient_gain=args.ambient_gain,
+                           fade_in=args.fade_in, fade_out=args.fade_out,
+                           picks_path=args.picks, output_dir=args.output_dir,
+                           incremental=not args.full, fail_fast=args.fail_fast,
+                           catalogue_repeats=args.catalogue_repeats)
 
     # Auto-regenerate the audit report
     try:
@@ -11,22 +11,43 @@ Usage:
     python3 vault-builder.py --batch content/scripts/
     python3 vault-builder.py --dry-run content/scripts/52-the-court-of-your-mind.txt
     python3 vault-builder.py 01-morning-meditation --regen-chunks 3,11 --count 50
+    python3 vault-builder.py --adaptive --wave-size 10 --survivors 10 content/scripts/52-the-court-of-your-mind.txt
 """
 
 import asyncio
 import aiohttp
 import argparse
+import base64
+import functools
 import importlib.util
 import json
 import os
 import re
+import shutil
 import subprocess
 import sys
+import tempfile
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import soundfile as sf
+    _SF_MP3 = 'MP3' in sf.available_formats()  # libsndfile ≥ 1.1 (mpg123)
+except (ImportError, OSError):
+    sf = None
+    _SF_MP3 = False
+
+# candidate_scoring.py must be importable by name in process-pool workers;
+# fish_client.py holds the process-wide Fish rate limiter
+sys.path.insert(0, str(Path(__file__).parent))
+import candidate_scoring
+import fish_client
+import profiling
+
 # ---------------------------------------------------------------------------
 # Load build-session-v3.py via importlib (hyphenated filename can't be imported normally)
 # ---------------------------------------------------------------------------
@@ -46,7 +67,10 @@ FISH_API_URL = "https://api.fish.audio/v1/tts"
 FISH_VOICE_ID = "0165567b33324f518b02336ad232e31a"
 FISH_API_KEY = os.getenv("FISH_API_KEY")
 SAMPLE_RATE = 44100
+MP3_SPOOL_BYTES = 1 << 20  # Fish response held in memory up to this (~65 s at 128k), then spilled to disk
 MAX_CONCURRENT = 15  # Fish Elevated tier (auto at $100+ spend, was 5 Starter)
+SCORE_WORKERS = max(1, (os.cpu_count() or 4) - 1)  # Process-pool scoring (0 = legacy 4-thread pool)
+DECODE_CONCURRENCY = 4  # Concurrent MP3→WAV decodes per chunk pipeline
 
 # Candidate counts by character range
 CANDIDATE_COUNTS = [
@@ -57,6 +81,12 @@ CANDIDATE_COUNTS = [
 ]
 
 SCORE_FILTER_THRESHOLD = 0.30  # Below this = pre-filter flagged (kept, not deleted)
+
+# Adaptive generation (--adaptive): generate in waves, stop once the pool holds
+# ADAPTIVE_SURVIVORS candidates that clear both the pre-filter and auto-picker's
+# elimination stage. The cap defaults to get_candidate_count() (+ --extra).
+ADAPTIVE_WAVE_SIZE = 10
+ADAPTIVE_SURVIVORS = 10
 # Chunk 0 conditioning: use a clean human-picked chunk from a deployed session
 # instead of marco-master WAV (per 12 Feb 2026 debrief — mid-sentence conditioning)
 CHUNK0_REFERENCE_WAV = Path(__file__).parent / "content/audio-free/vault/42-seven-day-mindfulness-day5/c04/c04_v19.wav"
@@ -233,6 +263,7 @@ def generate_inventory(scripts_dir, output_path=None):
                 'emotion': meta.get('api_emotion', 'calm'),
                 'is_opening': ci == 0,
                 'is_closing': ci == len(blocks) - 1,
+                'library_key': _library_key(text, meta.get('api_emotion', 'calm')),
             })
 
     if output_path:
@@ -241,6 +272,18 @@ def generate_inventory(scripts_dir, output_path=None):
         print(f"Inventory: {len(inventory)} blocks across "
               f"{len(set(e['script_id'] for e in inventory))} scripts → {output_path}")
 
+        # Identical text + params across scripts → candidate-library reuse
+        seen = set()
+        dup_blocks = 0
+        dup_candidates = 0
+        for e in inventory:
+            if e['library_key'] in seen:
+                dup_blocks += 1
+                dup_candidates += get_candidate_count(e['char_count'], e['is_opening'])
+            seen.add(e['library_key'])
+        print(f"Duplicate chunk text: {dup_blocks} blocks repeat an earlier block "
+              f"({len(seen)} unique) — ~{dup_candidates} candidates reusable via library")
+
     return inventory
 
 
@@ -248,107 +291,199 @@ def generate_inventory(scripts_dir, output_path=None):
 # Async TTS Generation
 # ---------------------------------------------------------------------------
 
-async def _generate_one(session, text, wav_path, chunk_num, semaphore,
-                        emotion='calm', api_log=None, ref_audio_path=None,
-                        ref_text=None):
-    """Generate a single TTS candidate via Fish API, save as WAV.
-
-    If ref_audio_path is provided, it is base64-encoded and sent as a
-    conditioning reference so Fish can match tonal quality.
-    Returns wav_path on success, raises on failure.
+def _tts_payload(text, emotion='calm', references=None):
+    """Fish request body for one vault candidate."""
+    return fish_client.build_payload(text, emotion=emotion, references=references,
+                                     sample_rate=SAMPLE_RATE, voice_id=FISH_VOICE_ID)
+
+
+@functools.lru_cache(maxsize=8)
+def _reference_payload(ref_audio_path, mtime_ns, ref_text):
+    """Base64 conditioning reference, encoded once and shared by every candidate
+    of the chunk (keyed on mtime so a rewritten best WAV is re-read)."""
+    ref_b64 = base64.b64encode(Path(ref_audio_path).read_bytes()).decode('ascii')
+    return [{
+        "audio": ref_b64,
+        "text": ref_text,
+    }]
+
+
+async def _fetch_one(session, text, wav_path, chunk_num, semaphore,
+                     emotion='calm', api_log=None, ref_audio_path=None,
+                     ref_text=None):
+    """Fetch a single TTS candidate from the Fish API into a spooled buffer.
+
+    The response streams into a SpooledTemporaryFile: held in memory up to
+    MP3_SPOOL_BYTES, spilled to an unnamed temp file beside wav_path beyond
+    that, so each in-flight or queued response costs at most MP3_SPOOL_BYTES
+    of RAM whatever its length.
+    If ref_audio_path is provided, it is sent (base64, see _reference_payload)
+    as a conditioning reference so Fish can match tonal quality.
+    Returns the buffer (the caller closes it) on success, raises on failure.
     """
-    import base64
-    mp3_tmp = str(wav_path) + ".tmp.mp3"
     call_id = f"c{chunk_num:02d}_{Path(wav_path).stem}"
-    started = time.time()
 
     async with semaphore:
-        payload = {
-            "text": text,
-            "reference_id": FISH_VOICE_ID,
-            "format": "mp3",
-            "temperature": 0.3,
-            "version": "v3-hd",
-            "emotion": emotion,
-            "prosody": {"speed": 0.95, "volume": 0},
-            "sample_rate": SAMPLE_RATE,
-        }
         # Audio conditioning: pass reference audio for tonal consistency
+        references = None
         if ref_audio_path and Path(ref_audio_path).exists():
-            ref_bytes = Path(ref_audio_path).read_bytes()
-            ref_b64 = base64.b64encode(ref_bytes).decode('ascii')
-            payload["references"] = [{
-                "audio": ref_b64,
-                "text": ref_text or "",
-            }]
-        headers = {
-            "Authorization": f"Bearer {FISH_API_KEY}",
-            "Content-Type": "application/json",
-        }
+            references = _reference_payload(
+                str(ref_audio_path), Path(ref_audio_path).stat().st_mtime_ns,
+                ref_text or "")
+        payload = _tts_payload(text, emotion, references)
+
+        # Shared AIMD limiter: paces every session in this process
+        client = fish_client.FishClient(FISH_API_KEY, url=FISH_API_URL)
+        buf = tempfile.SpooledTemporaryFile(max_size=MP3_SPOOL_BYTES,
+                                            dir=Path(wav_path).parent)
+        try:
+            return await client.synthesize(session, payload, call_id=call_id,
+                                           api_log=api_log, dest=buf)
+        except BaseException:
+            buf.close()
+            raise
 
-        last_err = None
-        for attempt in range(4):
-            try:
-                async with session.post(
-                    FISH_API_URL, json=payload, headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=300)
-                ) as resp:
-                    if resp.status == 429:
-                        wait = 2 ** attempt + 1
-                        print(f"      429 rate-limit → wait {wait}s")
-                        if api_log is not None:
-                            api_log.append({
-                                'call_id': call_id, 'status': 429,
-                                'attempt': attempt, 'ts': _now_iso()
-                            })
-                        await asyncio.sleep(wait)
-                        continue
-                    if resp.status != 200:
-                        body = await resp.text()
-                        raise Exception(f"Fish API {resp.status}: {body[:200]}")
-                    data = await resp.read()
-                    Path(mp3_tmp).write_bytes(data)
-                    elapsed = time.time() - started
-                    if api_log is not None:
-                        api_log.append({
-                            'call_id': call_id, 'status': 200,
-                            'attempt': attempt, 'ts': _now_iso(),
-                            'elapsed_s': round(elapsed, 2),
-                            'chars': len(text),
-                        })
-                    break
-            except asyncio.TimeoutError:
-                last_err = "timeout"
-                if attempt < 3:
-                    await asyncio.sleep(2 ** attempt)
-                continue
-            except aiohttp.ClientError as e:
-                last_err = str(e)
-                if attempt < 3:
-                    await asyncio.sleep(2 ** attempt)
-                continue
-        else:
-            raise Exception(f"Failed after 4 attempts: {last_err}")
 
-    # Convert MP3 → WAV
-    subprocess.run([
-        'ffmpeg', '-y', '-i', mp3_tmp,
-        '-c:a', 'pcm_s16le', '-ar', str(SAMPLE_RATE), '-ac', '1',
-        str(wav_path)
-    ], capture_output=True, check=True)
+def _decode_mp3_file(mp3, wav_path):
+    """Decode an MP3 (path or file object) → 44.1k mono int16 WAV in-process
+    (libsndfile/mpg123).
+
+    Float → int16 uses the same round-and-clip as ffmpeg's pcm_s16le path.
+    Returns False when libsndfile can't read MP3 or the stream would need
+    resampling/downmixing — the caller falls back to ffmpeg.
+    """
+    if not _SF_MP3:
+        return False
+    try:
+        pcm, sr = sf.read(mp3 if hasattr(mp3, 'read') else str(mp3),
+                          dtype='float32', always_2d=True)
+    except RuntimeError:  # sf.LibsndfileError
+        return False
+    if sr != SAMPLE_RATE or pcm.shape[1] != 1:
+        return False
+
+    pcm16 = np.clip(np.rint(pcm[:, 0] * 32768.0), -32768, 32767).astype(np.int16)
+    part = str(wav_path) + ".part"  # not matched by the c{NN}_v*.wav resume glob
+    sf.write(part, pcm16, SAMPLE_RATE, format='WAV', subtype='PCM_16')
+    os.replace(part, wav_path)
+    return True
+
+
+async def _decode_mp3(mp3_buf, wav_path):
+    """Convert a fetched MP3 buffer → 44.1k mono PCM WAV without blocking the event loop.
+
+    Decodes in-process on a worker thread; ffmpeg (via a temp MP3) is the
+    fallback for streams libsndfile can't handle. Closes the buffer.
+    """
+    try:
+        loop = asyncio.get_event_loop()
+        if await loop.run_in_executor(None, _decode_mp3_file, mp3_buf, wav_path):
+            return str(wav_path)
+
+        mp3_path = str(wav_path) + ".tmp.mp3"
+        mp3_buf.seek(0)
+        with open(mp3_path, 'wb') as f:
+            shutil.copyfileobj(mp3_buf, f)
+    finally:
+        mp3_buf.close()
+
+    with profiling.span('ffmpeg', 'subprocess', cmd=f"ffmpeg decode {Path(mp3_path).name}"):
+        proc = await asyncio.create_subprocess_exec(
+            'ffmpeg', '-y', '-i', str(mp3_path),
+            '-c:a', 'pcm_s16le', '-ar', str(SAMPLE_RATE), '-ac', '1',
+            str(wav_path),
+            stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE)
+        _, stderr = await proc.communicate()
 
     try:
-        os.remove(mp3_tmp)
+        os.remove(mp3_path)
     except OSError:
         pass
+    if proc.returncode != 0:
+        raise Exception(f"ffmpeg decode failed for {Path(wav_path).name}: "
+                        f"{stderr.decode(errors='replace')[-200:]}")
 
     return str(wav_path)
 
 
-def _score_wav(wav_path, prev_mfcc=None):
-    """Score a WAV candidate. Returns (details_dict, mfcc_array)."""
-    details = build.score_chunk_quality(str(wav_path))
-    mfcc = build.compute_mfcc_profile(str(wav_path))
+async def _generate_one(session, text, wav_path, chunk_num, semaphore,
+                        emotion='calm', api_log=None, ref_audio_path=None,
+                        ref_text=None):
+    """Generate a single TTS candidate via Fish API, save as WAV (fetch + decode).
+
+    Returns wav_path on success, raises on failure.
+    """
+    mp3_buf = await _fetch_one(session, text, wav_path, chunk_num, semaphore,
+                               emotion, api_log, ref_audio_path, ref_text)
+    return await _decode_mp3(mp3_buf, wav_path)
+
+
+_auto_picker_mod = None
+_library_mod = None
+
+
+def _auto_picker():
+    """Load auto-picker.py via importlib (hyphenated filename) on first use."""
+    global _auto_picker_mod
+    if _auto_picker_mod is None:
+        spec = importlib.util.spec_from_file_location(
+            "auto_picker", Path(__file__).parent / "auto-picker.py")
+        _auto_picker_mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(_auto_picker_mod)
+    return _auto_picker_mod
+
+
+def _candidate_library():
+    """Load candidate-library.py via importlib (hyphenated filename) on first use."""
+    global _library_mod
+    if _library_mod is None:
+        spec = importlib.util.spec_from_file_location(
+            "candidate_library", Path(__file__).parent / "candidate-library.py")
+        _library_mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(_library_mod)
+    return _library_mod
+
+
+def _library_key(text, emotion):
+    """Candidate-library key for a chunk — the payload _fetch_one sends, minus reference."""
+    return _candidate_library().library_key(_tts_payload(text, emotion))
+
+
+def _high_confidence_survivors(chunk_idx, text, chunk_dir, entries):
+    """Versions that pass the pre-filter AND auto-picker's elimination filters.
+
+    `entries` are c{NN}_meta.json candidate dicts. Gate features are read from
+    the feature store (warmed by candidate_features(picker_features=True)).
+    """
+    ap = _auto_picker()
+    chunk_data = {
+        'text': text,
+        'char_count': len(text),
+        'is_opening': chunk_idx == 0,
+        'is_closing': False,
+        'candidates': [ap.candidate_from_meta(e, chunk_dir)
+                       for e in entries if not e.get('error')],
+    }
+    if not chunk_data['candidates']:
+        return []
+    ap.precompute_gate_scores(None, {chunk_idx: chunk_data}, verbose=False)
+    survivors = set(ap.elimination_survivors(chunk_idx, chunk_data))
+    return sorted(e['version'] for e in entries
+                  if e['version'] in survivors and not e.get('filtered'))
+
+
+def _score_wav(wav_path, prev_mfcc=None, feats=None):
+    """Score a WAV candidate. Returns (details_dict, mfcc_array).
+
+    `feats` is the candidate_scoring.candidate_features() result — computed in
+    the scoring pool so this step is cheap arithmetic. Quality + MFCC profile
+    come from the shared feature store (content-hash keyed), so re-scoring
+    existing candidates on resume/regen skips the decode.
+    """
+    if feats is None:
+        feats = candidate_scoring.candidate_features(wav_path)
+    details = dict(feats['quality'])
+    mfcc = feats['mfcc_profile']
 
     quality = details['score']
     tone_dist = build.tonal_distance(prev_mfcc, mfcc)
@@ -358,7 +493,7 @@ def _score_wav(wav_path, prev_mfcc=None):
     details['tone_dist'] = round(tone_dist, 6)
     details['tone_penalty'] = round(tone_penalty, 3)
     details['combined_score'] = round(combined, 4)
-    details['duration'] = round(build.get_audio_duration(str(wav_path)), 2)
+    details['duration'] = round(feats['duration'], 2)
     details['filtered'] = combined < SCORE_FILTER_THRESHOLD
 
     # Over-generation check
@@ -373,14 +508,158 @@ def _score_wav(wav_path, prev_mfcc=None):
     return details, mfcc
 
 
+def make_score_executor(score_workers=SCORE_WORKERS):
+    """Executor for candidate feature extraction.
+
+    score_workers > 0 → ProcessPoolExecutor (decode + STFT run truly in
+    parallel); 0 → the legacy 4-worker ThreadPoolExecutor.
+    """
+    if score_workers and score_workers > 0:
+        return ProcessPoolExecutor(max_workers=score_workers)
+    return ThreadPoolExecutor(max_workers=4)
+
+
+def _submit_features(loop, executor, wav_path, picker_features=False):
+    """Schedule candidate_features() for one WAV on the scoring executor."""
+    return loop.run_in_executor(
+        executor, functools.partial(candidate_scoring.candidate_features,
+                                    picker_features=picker_features),
+        str(wav_path))
+
+
+async def _score_candidates(wav_paths, feature_futs, prev_best_mfcc, char_count,
+                            executor):
+    """Collect scored candidate entries for `wav_paths`, in version order.
+
+    feature_futs maps version → pending candidate_features() future (already
+    fanned out to the pool, possibly while generation was still running);
+    WAVs without one are submitted here. Output order follows wav_paths, so
+    c{NN}_meta.json is deterministic regardless of completion order.
+
+    Returns list of (entry_dict, details, mfcc) — details/mfcc are None on error.
+    """
+    loop = asyncio.get_event_loop()
+    for wav_path in wav_paths:
+        v = int(Path(wav_path).stem.split('_v')[1])
+        if v not in feature_futs:
+            feature_futs[v] = _submit_features(loop, executor, wav_path)
+
+    results = []
+    for wav_path in wav_paths:
+        wav_path = Path(wav_path)
+        v = int(wav_path.stem.split('_v')[1])
+        try:
+            feats = await feature_futs[v]
+            details, mfcc = _score_wav(str(wav_path), prev_best_mfcc, feats=feats)
+            details['_char_count'] = char_count  # For overgen check
+            status = "FILTERED" if details.get('filtered') else "OK"
+            tone_info = (f" tone={details['tone_dist']:.4f}"
+                         if prev_best_mfcc is not None else "")
+            print(f"    v{v:02d}: {details['combined_score']:.3f} "
+                  f"(q={details['score']:.3f}{tone_info} "
+                  f"dur={details['duration']:.1f}s) {status}")
+
+            entry = {
+                'version': v,
+                'filename': wav_path.name,
+                'duration_seconds': details['duration'],
+                'composite_score': details['combined_score'],
+                'quality_score': details['score'],
+                'echo_risk': details['echo_risk'],
+                'hiss_risk': details['hiss_risk'],
+                'sp_contrast': details['sp_contrast'],
+                'sp_flatness': details['sp_flatness'],
+                'tonal_distance_to_prev': details['tone_dist'],
+                'filtered': details.get('filtered', False),
+                'filter_reason': details.get('filter_reason', ''),
+                'generated_at': _now_iso(),
+            }
+            results.append((entry, details, mfcc))
+        except Exception as e:
+            print(f"    v{v:02d}: SCORE FAILED — {e}")
+            results.append(({
+                'version': v, 'filename': wav_path.name,
+                'error': str(e), 'filtered': True,
+            }, None, None))
+    return results
+
+
+def _mfcc_profile(wav_path):
+    """MFCC profile of a previous chunk's best WAV, via the feature store."""
+    return candidate_scoring.candidate_features(wav_path)['mfcc_profile']
+
+
+async def _run_candidate_pipeline(http_session, text, chunk_idx, wav_paths, semaphore,
+                                  executor, feature_futs, emotion='calm', api_log=None,
+                                  ref_audio_path=None, ref_text=None,
+                                  picker_features=False):
+    """Fetch → decode → score for new candidates, stages joined by asyncio queues.
+
+    Stage 1 streams each Fish response into a spooled buffer (bounded by
+    `semaphore`; see _fetch_one) and queues it;
+    stage 2 decodes to WAV (DECODE_CONCURRENCY in-process decodes) and
+    hands each WAV to stage 3, the scoring executor, recording its future in
+    feature_futs[version]. The API never waits on ffmpeg or librosa.
+
+    wav_paths: list of (version, wav_path). Returns list of failures.
+    """
+    loop = asyncio.get_event_loop()
+    decode_q = asyncio.Queue()
+    failures = []
+
+    async def fetch(v, wav_path):
+        try:
+            mp3_buf = await _fetch_one(http_session, text, wav_path, chunk_idx,
+                                       semaphore, emotion, api_log,
+                                       ref_audio_path=ref_audio_path,
+                                       ref_text=ref_text)
+        except Exception as e:
+            failures.append(e)
+            return
+        await decode_q.put((v, wav_path, mp3_buf))
+
+    async def decoder():
+        while True:
+            item = await decode_q.get()
+            if item is None:
+                return
+            v, wav_path, mp3_buf = item
+            try:
+                await _decode_mp3(mp3_buf, wav_path)
+                feature_futs[v] = _submit_features(loop, executor, wav_path,
+                                                   picker_features)
+            except Exception as e:
+                failures.append(e)
+
+    decoders = [asyncio.ensure_future(decoder()) for _ in range(DECODE_CONCURRENCY)]
+    await asyncio.gather(*(fetch(v, wav_path) for v, wav_path in wav_paths))
+    for _ in decoders:
+        await decode_q.put(None)
+    await asyncio.gather(*decoders)
+    return failures
+
+
+@profiling.span('generate_chunk_candidates')
 async def generate_chunk_candidates(
     http_session, chunk_idx, text, chunk_dir, semaphore,
     emotion='calm', prev_best_mfcc=None, executor=None, api_log=None,
-    extra=0, ref_audio_path=None, ref_text=None
+    extra=0, ref_audio_path=None, ref_text=None, adaptive=None, library=None
 ):
-    """Generate all candidates for one chunk. Chunks are processed sequentially
-    (tonal distance needs previous chunk's best), but candidates within a chunk
-    run in parallel up to the semaphore limit.
+    """Generate all candidates for one chunk. A chunk can only start once the
+    previous chunk's best is known (conditioning + tonal distance), but
+    candidates within a chunk run through the fetch → decode → score pipeline
+    (see _run_candidate_pipeline) up to the semaphore limit. prev_best_mfcc is
+    fixed for the whole chunk, so every candidate is scored concurrently on
+    `executor` (see make_score_executor) as soon as its WAV is decoded.
+
+    adaptive: None for the fixed get_candidate_count() pool, or a dict with
+    optional 'wave_size', 'survivors' and 'cap' — candidates are then generated
+    in waves until `survivors` of them clear the pre-filter and auto-picker's
+    elimination stage (see _high_confidence_survivors), or `cap` is reached.
+
+    library: a CandidateLibrary (candidate-library.py) or None. Candidates
+    generated for identical text + params in other sessions are linked in
+    first, and only the shortfall is generated; new candidates are added to it.
 
     Returns (chunk_meta_dict, best_mfcc, scores_list).
     """
@@ -398,89 +677,126 @@ async def generate_chunk_candidates(
         print(f"  Chunk {chunk_idx}: resuming from v{start_v:02d} "
               f"({len(existing)} existing)")
 
+    if adaptive is not None:
+        n_candidates = adaptive.get('cap') or n_candidates
     remaining = max(0, n_candidates - start_v)
     total = start_v + remaining
 
+    mode = " max (adaptive)" if adaptive is not None else " total"
     print(f"\n  Chunk {chunk_idx}: \"{text[:60]}{'...' if len(text) > 60 else ''}\" "
-          f"({len(text)} chars, {remaining} new / {total} total candidates)")
+          f"({len(text)} chars, {remaining} new / {total}{mode} candidates)")
 
     if remaining == 0 and existing:
         print(f"    All {n_candidates} candidates already exist — scoring only")
 
-    # Generate new candidates
+    # Cross-session library: link in candidates for identical text + params
+    imported = {}  # version → "session/cNN/file.wav" it was linked from
+    lib_key = _library_key(text, emotion) if library is not None else None
+    if library is not None and remaining > 0:
+        present = {library.wav_hash(w) for w in existing}
+        rows = library.lookup(lib_key, exclude_session=chunk_dir.parent.name,
+                              exclude_hashes=present, limit=remaining)
+        for row in rows:
+            dest = chunk_dir / f"{prefix}_v{start_v:02d}.wav"
+            library.materialise(row, dest)
+            imported[start_v] = (f"{row['session_id']}/c{row['chunk_index']:02d}/"
+                                 f"{Path(row['path']).name}")
+            existing.append(dest)
+            start_v += 1
+            remaining -= 1
+        if rows:
+            print(f"    Library: linked {len(rows)} candidate(s) from "
+                  f"{len({r['session_id'] for r in rows})} session(s) — "
+                  f"{remaining} left to generate")
+
+    # Generate new candidates through the fetch → decode → score pipeline.
+    # Existing WAVs (resume) go straight to the scoring stage.
     loop = asyncio.get_event_loop()
-    gen_tasks = []
-    for v in range(start_v, start_v + remaining):
-        wav_path = chunk_dir / f"{prefix}_v{v:02d}.wav"
-        gen_tasks.append(
-            _generate_one(http_session, text, wav_path, chunk_idx,
-                          semaphore, emotion, api_log,
-                          ref_audio_path=ref_audio_path,
-                          ref_text=ref_text)
-        )
-
-    if gen_tasks:
-        results = await asyncio.gather(*gen_tasks, return_exceptions=True)
-        failures = sum(1 for r in results if isinstance(r, Exception))
+    feature_futs = {}
+    picker_features = adaptive is not None
+    for wav_path in existing:
+        v = int(wav_path.stem.split('_v')[1])
+        feature_futs[v] = _submit_features(loop, executor, wav_path, picker_features)
+
+    scored_by_v = {}  # version → (entry, details, mfcc), filled as waves land
+
+    async def score_pending():
+        pending = [w for w in sorted(chunk_dir.glob(f"{prefix}_v*.wav"))
+                   if int(w.stem.split('_v')[1]) not in scored_by_v]
+        for entry, details, mfcc in await _score_candidates(
+                pending, feature_futs, prev_best_mfcc, len(text), executor):
+            scored_by_v[entry['version']] = (entry, details, mfcc)
+
+    async def generate(versions):
+        failures = await _run_candidate_pipeline(
+            http_session, text, chunk_idx,
+            [(v, chunk_dir / f"{prefix}_v{v:02d}.wav") for v in versions],
+            semaphore, executor, feature_futs, emotion, api_log,
+            ref_audio_path=ref_audio_path, ref_text=ref_text,
+            picker_features=picker_features)
         if failures:
-            print(f"    {failures} generation(s) failed")
-            for r in results:
-                if isinstance(r, Exception):
-                    print(f"      → {r}")
+            print(f"    {len(failures)} generation(s) failed")
+            for r in failures:
+                print(f"      → {r}")
+
+    adaptive_report = None
+    if adaptive is None:
+        if remaining:
+            await generate(range(start_v, start_v + remaining))
+    else:
+        wave_size = adaptive.get('wave_size') or ADAPTIVE_WAVE_SIZE
+        want = adaptive.get('survivors') or ADAPTIVE_SURVIVORS
+        next_v = start_v
+        waves = 0
+        while True:
+            await score_pending()
+            survivors = await loop.run_in_executor(
+                None, _high_confidence_survivors, chunk_idx, text, chunk_dir,
+                [entry for entry, _, _ in scored_by_v.values()])
+            if len(survivors) >= want or next_v >= n_candidates:
+                break
+            wave_end = min(next_v + wave_size, n_candidates)
+            waves += 1
+            print(f"    Wave {waves}: v{next_v:02d}-v{wave_end - 1:02d} "
+                  f"({len(survivors)}/{want} survivors so far)")
+            await generate(range(next_v, wave_end))
+            next_v = wave_end
+
+        adaptive_report = {
+            'waves': waves,
+            'survivors': len(survivors),
+            'target_survivors': want,
+            'generated': next_v - start_v,
+            'saved_calls': n_candidates - next_v,
+        }
+        print(f"    Adaptive: {len(survivors)} survivors after {waves} wave(s) — "
+              f"generated {next_v - start_v}, saved {n_candidates - next_v} calls")
 
-    # Score ALL candidates (existing + new)
-    all_wavs = sorted(chunk_dir.glob(f"{prefix}_v*.wav"))
+    # Score ALL candidates (existing + new) — collected in version order
+    await score_pending()
     candidates = []
     best_score = None
     best_mfcc = prev_best_mfcc
     best_version = None
 
-    for wav_path in all_wavs:
-        v = int(wav_path.stem.split('_v')[1])
-        try:
-            details, mfcc = await loop.run_in_executor(
-                executor, _score_wav, str(wav_path), prev_best_mfcc
-            )
-            details['_char_count'] = len(text)  # For overgen check
-            status = "FILTERED" if details.get('filtered') else "OK"
-            tone_info = (f" tone={details['tone_dist']:.4f}"
-                         if prev_best_mfcc is not None else "")
-            print(f"    v{v:02d}: {details['combined_score']:.3f} "
-                  f"(q={details['score']:.3f}{tone_info} "
-                  f"dur={details['duration']:.1f}s) {status}")
-
-            entry = {
-                'version': v,
-                'filename': wav_path.name,
-                'duration_seconds': details['duration'],
-                'composite_score': details['combined_score'],
-                'quality_score': details['score'],
-                'echo_risk': details['echo_risk'],
-                'hiss_risk': details['hiss_risk'],
-                'sp_contrast': details['sp_contrast'],
-                'sp_flatness': details['sp_flatness'],
-                'tonal_distance_to_prev': details['tone_dist'],
-                'filtered': details.get('filtered', False),
-                'filter_reason': details.get('filter_reason', ''),
-                'generated_at': _now_iso(),
-            }
-            candidates.append(entry)
-
-            # Track best unfiltered (or best overall if all filtered)
-            if not details.get('filtered') or best_score is None:
-                score = details['combined_score']
-                if best_score is None or score > best_score:
-                    if not details.get('filtered') or best_version is None:
-                        best_score = score
-                        best_mfcc = mfcc
-                        best_version = v
+    scored = [scored_by_v[v] for v in sorted(scored_by_v)]
+    for v, source in imported.items():
+        if v in scored_by_v:
+            scored_by_v[v][0]['library_source'] = source
+    for entry, details, mfcc in scored:
+        candidates.append(entry)
+        if details is None:
+            continue
+        v = entry['version']
 
-        except Exception as e:
-            print(f"    v{v:02d}: SCORE FAILED — {e}")
-            candidates.append({
-                'version': v, 'filename': wav_path.name,
-                'error': str(e), 'filtered': True,
-            })
+        # Track best unfiltered (or best overall if all filtered)
+        if not details.get('filtered') or best_score is None:
+            score = details['combined_score']
+            if best_score is None or score > best_score:
+                if not details.get('filtered') or best_version is None:
+                    best_score = score
+                    best_mfcc = mfcc
+                    best_version = v
 
     if best_version is not None:
         print(f"    → Best: v{best_version:02d} ({best_score:.3f})")
@@ -511,13 +827,31 @@ async def generate_chunk_candidates(
             'filtered': c.get('filtered', False),
         } for c in candidates],
     }
+    if adaptive_report is not None:
+        scores['adaptive'] = adaptive_report
+    if imported:
+        scores['library_imported'] = len(imported)
 
     (chunk_dir / f"{prefix}_meta.json").write_text(json.dumps(meta, indent=2))
     (chunk_dir / f"{prefix}_scores.json").write_text(json.dumps(scores, indent=2))
 
+    if library is not None:
+        _register_candidates(library, lib_key, chunk_dir, chunk_idx, candidates)
+
     return meta, best_mfcc, scores
 
 
+def _register_candidates(library, key, chunk_dir, chunk_idx, candidates):
+    """Add this chunk's own (not library-linked) candidates to the library."""
+    for c in candidates:
+        if c.get('error') or c.get('library_source'):
+            continue
+        wav_path = Path(chunk_dir) / c['filename']
+        if wav_path.exists():
+            library.add(key, wav_path, Path(chunk_dir).parent.name, chunk_idx,
+                        c['version'], c.get('quality_score'), c.get('filtered', False))
+
+
 # ---------------------------------------------------------------------------
 # Picker Page Generation
 # ---------------------------------------------------------------------------
@@ -1254,11 +1588,17 @@ def _save_gen_log(log, path):
 # Main Build Orchestration
 # ---------------------------------------------------------------------------
 
-async def build_session(script_path, dry_run=False, extra=0, only_chunks=None):
+@profiling.span('vault build_session')
+async def build_session(script_path, dry_run=False, extra=0, only_chunks=None,
+                        score_workers=SCORE_WORKERS, adaptive=None, library=True):
     """Generate vault candidates for a single session script.
 
+    adaptive: see generate_chunk_candidates (None = fixed candidate counts).
+    library: reuse candidates for identical chunk text from other sessions
+    (candidate-library.py) before generating.
     Returns session manifest dict.
     """
+    profiling.annotate(script=Path(script_path).name)
     script_path = Path(script_path)
     if not script_path.exists():
         print(f"ERROR: Script not found: {script_path}")
@@ -1373,20 +1713,83 @@ async def build_session(script_path, dry_run=False, extra=0, only_chunks=None):
     total_api_calls = 0
     total_chars_sent = 0
     total_filtered = 0
-
-    # Generate candidates chunk-by-chunk (sequential for tonal distance)
+    total_saved_calls = 0
+    total_library = 0
+
+    # Generate candidates. Each chunk is conditioned on the previous chunk's
+    # best WAV (and scored for tonal distance against its MFCC), so a chunk
+    # task waits only on its predecessor's `ref` future — resolved the moment
+    # that chunk's best is picked. Chunks whose predecessor is fixed on disk
+    # (gaps in --only-chunks) start immediately and run concurrently.
     semaphore = asyncio.Semaphore(MAX_CONCURRENT)
-    executor = ThreadPoolExecutor(max_workers=4)
+    executor = make_score_executor(score_workers)
+    loop = asyncio.get_event_loop()
+    candidate_library = _candidate_library().default_library() if library else None
+
+    def _resolved(value):
+        fut = loop.create_future()
+        fut.set_result(value)
+        return fut
 
     async with aiohttp.ClientSession() as http_session:
-        prev_best_mfcc = None
-        prev_best_wav = None   # Track best WAV path for audio conditioning
-        prev_text = None       # Track previous chunk text for reference
+
+        async def run_chunk(ci, text, prev_ref, ref_out):
+            """Generate one chunk once its conditioning reference is known."""
+            try:
+                prev_best_mfcc, prev_best_wav, prev_text = await prev_ref
+                chunk_dir = session_dir / f"c{ci:02d}"
+
+                # Determine conditioning reference for this chunk
+                if ci == 0:
+                    # Chunk 0: condition on marco-master to avoid cold-start
+                    ref_audio = str(MARCO_MASTER_WAV) if MARCO_MASTER_WAV.exists() else None
+                    ref_text_val = CHUNK0_REFERENCE_TEXT
+                    if ref_audio:
+                        print(f"  Chunk 0: conditioning on marco-master reference")
+                else:
+                    # Chunks 1+: condition on previous chunk's best candidate
+                    ref_audio = prev_best_wav
+                    ref_text_val = prev_text
+                    if ref_audio:
+                        print(f"  Chunk {ci}: conditioning on {Path(ref_audio).name}")
+
+                chunk_meta, best_mfcc, scores = await generate_chunk_candidates(
+                    http_session, ci, text, chunk_dir, semaphore,
+                    emotion=emotion, prev_best_mfcc=prev_best_mfcc,
+                    executor=executor, api_log=api_log,
+                    extra=extra, ref_audio_path=ref_audio, ref_text=ref_text_val,
+                    adaptive=adaptive, library=candidate_library
+                )
+            except BaseException as e:
+                if not ref_out.done():
+                    ref_out.set_exception(e)
+                raise
+
+            # Release the next chunk's generation before our bookkeeping
+            if scores.get('best_version') is not None:
+                ref_out.set_result((
+                    best_mfcc,
+                    str(chunk_dir / f"c{ci:02d}_v{scores['best_version']:02d}.wav"),
+                    text))
+            else:
+                ref_out.set_result((best_mfcc, prev_best_wav, prev_text))
+
+            # Mark closing chunk
+            if ci == len(blocks) - 1:
+                chunk_meta['is_closing'] = True
+                (chunk_dir / f"c{ci:02d}_meta.json").write_text(
+                    json.dumps(chunk_meta, indent=2))
+
+            return chunk_meta, scores
+
+        # (best_mfcc, best_wav, text) of the chunk before the one being scheduled
+        prev_ref = _resolved((None, None, None))
 
         only_set = None
         if only_chunks:
             only_set = set(int(x) for x in only_chunks.split(',')) if isinstance(only_chunks, str) else set(only_chunks)
 
+        chunk_tasks = []
         for ci, (text, pause) in enumerate(blocks):
             if only_set is not None and ci not in only_set:
                 # Still need prev_best_mfcc + wav for tonal distance & conditioning
@@ -1397,49 +1800,30 @@ async def build_session(script_path, dry_run=False, extra=0, only_chunks=None):
                     best_v = sd.get('best_version', 0)
                     best_wav = chunk_dir / f"c{ci:02d}_v{best_v:02d}.wav"
                     if best_wav.exists():
-                        prev_best_mfcc = build.compute_mfcc_profile(str(best_wav))
-                        prev_best_wav = str(best_wav)
-                        prev_text = text
+                        prev_ref = _resolved((_mfcc_profile(best_wav), str(best_wav), text))
                 print(f"  Chunk {ci}: skipped (not in --only-chunks)")
                 continue
 
-            chunk_dir = session_dir / f"c{ci:02d}"
-
-            # Determine conditioning reference for this chunk
-            if ci == 0:
-                # Chunk 0: condition on marco-master to avoid cold-start
-                ref_audio = str(MARCO_MASTER_WAV) if MARCO_MASTER_WAV.exists() else None
-                ref_text_val = CHUNK0_REFERENCE_TEXT
-                if ref_audio:
-                    print(f"  Chunk 0: conditioning on marco-master reference")
-            else:
-                # Chunks 1+: condition on previous chunk's best candidate
-                ref_audio = prev_best_wav
-                ref_text_val = prev_text
-                if ref_audio:
-                    print(f"  Chunk {ci}: conditioning on {Path(ref_audio).name}")
-
-            chunk_meta, prev_best_mfcc, scores = await generate_chunk_candidates(
-                http_session, ci, text, chunk_dir, semaphore,
-                emotion=emotion, prev_best_mfcc=prev_best_mfcc,
-                executor=executor, api_log=api_log,
-                extra=extra, ref_audio_path=ref_audio, ref_text=ref_text_val
-            )
-            # Update prev_best_wav for next chunk's conditioning
-            if scores.get('best_version') is not None:
-                prev_best_wav = str(chunk_dir / f"c{ci:02d}_v{scores['best_version']:02d}.wav")
-                prev_text = text
-
-            # Mark closing chunk
-            if ci == len(blocks) - 1:
-                chunk_meta['is_closing'] = True
-                (chunk_dir / f"c{ci:02d}_meta.json").write_text(
-                    json.dumps(chunk_meta, indent=2))
+            ref_out = loop.create_future()
+            chunk_tasks.append((text, asyncio.ensure_future(
+                run_chunk(ci, text, prev_ref, ref_out))))
+            prev_ref = ref_out
 
-            all_meta.append(chunk_meta)
-            total_api_calls += sum(1 for c in chunk_meta['candidates'] if not c.get('error'))
-            total_chars_sent += len(text) * len(chunk_meta['candidates'])
-            total_filtered += scores['filtered_count']
+        try:
+            for text, task in chunk_tasks:
+                chunk_meta, scores = await task
+                all_meta.append(chunk_meta)
+                generated = [c for c in chunk_meta['candidates'] if not c.get('library_source')]
+                total_api_calls += sum(1 for c in generated if not c.get('error'))
+                total_chars_sent += len(text) * len(generated)
+                total_filtered += scores['filtered_count']
+                total_saved_calls += scores.get('adaptive', {}).get('saved_calls', 0)
+                total_library += scores.get('library_imported', 0)
+        except BaseException:
+            for _, task in chunk_tasks:
+                task.cancel()
+            await asyncio.gather(*(t for _, t in chunk_tasks), return_exceptions=True)
+            raise
 
     executor.shutdown(wait=False)
 
@@ -1464,6 +1848,9 @@ async def build_session(script_path, dry_run=False, extra=0, only_chunks=None):
              datetime.fromisoformat(run_started.replace('Z', '+00:00'))).total_seconds()
         ),
         'chunks_below_prefilter': total_filtered,
+        'library_linked_candidates': total_library,
+        **(({'adaptive': {**adaptive, 'saved_calls': total_saved_calls}}
+            if adaptive is not None else {})),
         'preprocessing_log': preprocess_log,
         'blocks': [
             {
@@ -1503,7 +1890,13 @@ async def build_session(script_path, dry_run=False, extra=0, only_chunks=None):
     print(f"  Chunks: {len(blocks)}")
     print(f"  Candidates generated: {total_api_calls}")
     print(f"  Pre-filter failures: {total_filtered}")
+    if total_library:
+        print(f"  Library: {total_library} candidates linked from other sessions")
+    if adaptive is not None:
+        print(f"  Adaptive: saved {total_saved_calls} API calls "
+              f"(~£{total_saved_calls * total_chars / max(total_candidates, 1) / 1000 * 0.003:.2f})")
     print(f"  API calls logged: {len(api_log)}")
+    print(f"  {fish_client.shared_limiter().format_stats()}")
     print(f"  Estimated cost: £{manifest['estimated_cost_usd']:.2f}")
     print(f"  R2: {uploaded} uploaded, {r2_errors} errors")
     print(f"  Picker: {session_dir / 'review.html'}")
@@ -1512,12 +1905,52 @@ async def build_session(script_path, dry_run=False, extra=0, only_chunks=None):
     return manifest
 
 
-async def regen_chunks(session_id, chunk_indices, count):
+def _upload_regen_wavs(session_id, session_dir, chunk_indices, regen_start_versions):
+    """Upload WAVs from version regen_start_versions[ci] onward. Returns (uploaded, errors)."""
+    uploaded = 0
+    errors = 0
+    r2_prefix = f"vault/{session_id}"
+    for ci in sorted(chunk_indices):
+        start_v = regen_start_versions.get(ci)
+        if start_v is None:
+            continue
+        chunk_dir = session_dir / f"c{ci:02d}"
+        prefix = f"c{ci:02d}"
+        for wav_path in sorted(chunk_dir.glob(f"{prefix}_v*.wav")):
+            v = int(wav_path.stem.split('_v')[1])
+            if v < start_v:
+                continue  # Skip pre-existing versions
+            r2_key = f"{r2_prefix}/c{ci:02d}/{wav_path.name}"
+            try:
+                subprocess.run([
+                    "npx", "wrangler", "r2", "object", "put",
+                    f"{R2_BUCKET}/{r2_key}",
+                    f"--file={wav_path}",
+                    "--remote",
+                    "--content-type=audio/wav",
+                ], capture_output=True, check=True, timeout=120)
+                uploaded += 1
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+                print(f"    FAILED: {r2_key} — {e}")
+                errors += 1
+
+    return uploaded, errors
+
+
+@profiling.span('regen_chunks')
+async def regen_chunks(session_id, chunk_indices, count, score_workers=SCORE_WORKERS,
+                       semaphore=None, executor=None, library=True):
     """Generate additional candidates for specific chunks without rebuilding the whole session.
 
     For each chunk: finds highest existing version, generates `count` new candidates
     starting from that+1, computes all metrics, appends to existing meta, uploads to R2.
+
+    semaphore / executor: pass shared ones to run several sessions concurrently
+    under one API concurrency budget and one scoring pool (tools/vault-topup.py);
+    by default each call creates its own. New candidates are added to the
+    candidate library unless library=False.
     """
+    profiling.annotate(session=session_id, chunks=len(chunk_indices), count=count)
     if not FISH_API_KEY:
         print("ERROR: FISH_API_KEY not set in .env")
         return None
@@ -1539,21 +1972,37 @@ async def regen_chunks(session_id, chunk_indices, count):
     print(f"  Chunks: {sorted(chunk_indices)} | Count: {count} per chunk")
     print(f"{'='*70}")
 
-    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
-    executor = ThreadPoolExecutor(max_workers=4)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+    own_executor = executor is None
+    if own_executor:
+        executor = make_score_executor(score_workers)
     api_log = []
     total_generated = 0
     regen_start_versions = {}  # chunk_idx → first new version number
+    candidate_library = _candidate_library().default_library() if library else None
+
+    # Chunks regenerate concurrently; a chunk only waits when the chunk it is
+    # conditioned on (ci-1) is also being regenerated, since that chunk's
+    # best_version may change.
+    chunk_tasks = {}
 
     async with aiohttp.ClientSession() as http_session:
-        for ci in sorted(chunk_indices):
+
+        @profiling.span('regen chunk')
+        async def regen_one(ci):
+            profiling.annotate(session=session_id, chunk=ci)
             chunk_dir = session_dir / f"c{ci:02d}"
             prefix = f"c{ci:02d}"
             meta_path = chunk_dir / f"{prefix}_meta.json"
 
             if not meta_path.exists():
                 print(f"\n  c{ci:02d}: ERROR — no meta file found, skipping")
-                continue
+                return 0
+
+            # c{ci-1}'s best may change in this run — read its scores after it lands
+            if ci - 1 in chunk_tasks:
+                await asyncio.shield(chunk_tasks[ci - 1])
 
             meta = json.loads(meta_path.read_text())
             text = meta['text']
@@ -1586,7 +2035,7 @@ async def regen_chunks(session_id, chunk_indices, count):
                         best_wav = prev_dir / f"c{ci-1:02d}_v{best_v:02d}.wav"
                         if best_wav.exists():
                             ref_audio = str(best_wav)
-                            prev_best_mfcc = build.compute_mfcc_profile(str(best_wav))
+                            prev_best_mfcc = _mfcc_profile(best_wav)
                             prev_meta_path = prev_dir / f"c{ci-1:02d}_meta.json"
                             if prev_meta_path.exists():
                                 ref_text_val = json.loads(prev_meta_path.read_text()).get('text', '')
@@ -1597,68 +2046,37 @@ async def regen_chunks(session_id, chunk_indices, count):
                     ref_text_val = CHUNK0_REFERENCE_TEXT
                     print(f"    Conditioning on marco-master reference")
 
-            # Generate new candidates
-            gen_tasks = []
-            for v in range(start_v, start_v + count):
-                wav_path = chunk_dir / f"{prefix}_v{v:02d}.wav"
-                gen_tasks.append(
-                    _generate_one(http_session, text, wav_path, ci,
-                                  semaphore, emotion, api_log,
-                                  ref_audio_path=ref_audio, ref_text=ref_text_val)
-                )
-
-            results = await asyncio.gather(*gen_tasks, return_exceptions=True)
-            failures = sum(1 for r in results if isinstance(r, Exception))
-            successes = count - failures
+            # Generate new candidates through the fetch → decode → score pipeline
+            profiling.phase('generate')
+            feature_futs = {}
+            failures = await _run_candidate_pipeline(
+                http_session, text, ci,
+                [(v, chunk_dir / f"{prefix}_v{v:02d}.wav")
+                 for v in range(start_v, start_v + count)],
+                semaphore, executor, feature_futs, emotion, api_log,
+                ref_audio_path=ref_audio, ref_text=ref_text_val)
+            successes = count - len(failures)
             if failures:
-                print(f"    {failures} generation(s) failed")
-                for r in results:
-                    if isinstance(r, Exception):
-                        print(f"      → {r}")
-
-            # Score new candidates and append to meta
-            loop = asyncio.get_event_loop()
-            new_candidates = []
-            for v in range(start_v, start_v + count):
-                wav_path = chunk_dir / f"{prefix}_v{v:02d}.wav"
-                if not wav_path.exists():
-                    continue
-                try:
-                    details, mfcc = await loop.run_in_executor(
-                        executor, _score_wav, str(wav_path), prev_best_mfcc
-                    )
-                    details['_char_count'] = char_count
-                    status = "FILTERED" if details.get('filtered') else "OK"
-                    print(f"    v{v:02d}: {details['combined_score']:.3f} "
-                          f"(q={details['score']:.3f} dur={details['duration']:.1f}s) {status}")
-
-                    entry = {
-                        'version': v,
-                        'filename': wav_path.name,
-                        'duration_seconds': details['duration'],
-                        'composite_score': details['combined_score'],
-                        'quality_score': details['score'],
-                        'echo_risk': details['echo_risk'],
-                        'hiss_risk': details['hiss_risk'],
-                        'sp_contrast': details['sp_contrast'],
-                        'sp_flatness': details['sp_flatness'],
-                        'tonal_distance_to_prev': details['tone_dist'],
-                        'filtered': details.get('filtered', False),
-                        'filter_reason': details.get('filter_reason', ''),
-                        'generated_at': _now_iso(),
-                    }
-                    new_candidates.append(entry)
-                except Exception as e:
-                    print(f"    v{v:02d}: SCORE FAILED — {e}")
-                    new_candidates.append({
-                        'version': v, 'filename': wav_path.name,
-                        'error': str(e), 'filtered': True,
-                    })
+                print(f"    {len(failures)} generation(s) failed")
+                for r in failures:
+                    print(f"      → {r}")
+
+            # Score new candidates (version order) and append to meta
+            profiling.phase('score')
+            new_wavs = [chunk_dir / f"{prefix}_v{v:02d}.wav"
+                        for v in range(start_v, start_v + count)]
+            new_wavs = [w for w in new_wavs if w.exists()]
+            scored = await _score_candidates(new_wavs, feature_futs, prev_best_mfcc,
+                                             char_count, executor)
+            new_candidates = [entry for entry, _, _ in scored]
 
             # Append new candidates to existing meta
+            profiling.phase('save')
             meta['candidates'].extend(new_candidates)
             meta_path.write_text(json.dumps(meta, indent=2))
-            total_generated += successes
+            if candidate_library is not None:
+                _register_candidates(candidate_library, _library_key(text, emotion),
+                                     chunk_dir, ci, new_candidates)
 
             # Update scores file
             scores_path = chunk_dir / f"{prefix}_scores.json"
@@ -1687,43 +2105,34 @@ async def regen_chunks(session_id, chunk_indices, count):
             scores_path.write_text(json.dumps(scores_data, indent=2))
 
             print(f"    → {successes} new candidates added (total now: {len(meta['candidates'])})")
+            return successes
 
-    executor.shutdown(wait=False)
-
-    # Upload only NEW WAVs to R2
+        for ci in sorted(chunk_indices):
+            chunk_tasks[ci] = asyncio.ensure_future(regen_one(ci))
+        try:
+            for ci in sorted(chunk_indices):
+                total_generated += await chunk_tasks[ci]
+        except BaseException:
+            for task in chunk_tasks.values():
+                task.cancel()
+            await asyncio.gather(*chunk_tasks.values(), return_exceptions=True)
+            raise
+
+    if own_executor:
+        executor.shutdown(wait=False)
+
+    # Upload only NEW WAVs to R2 (off the event loop — other sessions may share it)
+    profiling.phase('upload')
     print(f"\n  Uploading new candidates to R2...")
-    uploaded = 0
-    errors = 0
-    r2_prefix = f"vault/{session_id}"
-    for ci in sorted(chunk_indices):
-        start_v = regen_start_versions.get(ci)
-        if start_v is None:
-            continue
-        chunk_dir = session_dir / f"c{ci:02d}"
-        prefix = f"c{ci:02d}"
-        for wav_path in sorted(chunk_dir.glob(f"{prefix}_v*.wav")):
-            v = int(wav_path.stem.split('_v')[1])
-            if v < start_v:
-                continue  # Skip pre-existing versions
-            r2_key = f"{r2_prefix}/c{ci:02d}/{wav_path.name}"
-            try:
-                subprocess.run([
-                    "npx", "wrangler", "r2", "object", "put",
-                    f"{R2_BUCKET}/{r2_key}",
-                    f"--file={wav_path}",
-                    "--remote",
-                    "--content-type=audio/wav",
-                ], capture_output=True, check=True, timeout=120)
-                uploaded += 1
-            except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
-                print(f"    FAILED: {r2_key} — {e}")
-                errors += 1
-
+    uploaded, errors = await asyncio.get_event_loop().run_in_executor(
+        None, _upload_regen_wavs, session_id, session_dir, chunk_indices,
+        regen_start_versions)
     print(f"  R2 upload: {uploaded} uploaded, {errors} failed")
 
     print(f"\n{'='*70}")
     print(f"  REGEN COMPLETE — {session_id}")
     print(f"  New candidates: {total_generated}")
+    print(f"  {fish_client.shared_limiter().format_stats()}")
     print(f"  R2: {uploaded} uploaded, {errors} errors")
     print(f"  NEXT: Run auto-picker.py {session_id} --rechunk {','.join(str(c) for c in sorted(chunk_indices))}")
     print(f"{'='*70}")
@@ -1753,8 +2162,26 @@ async def main():
                              'Appends to existing pool without rebuilding whole session.')
     parser.add_argument('--count', type=int, default=50,
                         help='Number of new candidates per chunk for --regen-chunks (default: 50)')
+    parser.add_argument('--score-workers', type=int, default=SCORE_WORKERS,
+                        help=f'Scoring worker processes (default: {SCORE_WORKERS}; 0 = legacy thread pool)')
+    parser.add_argument('--adaptive', action='store_true',
+                        help='Generate in waves; stop each chunk once enough candidates '
+                             'survive auto-picker elimination')
+    parser.add_argument('--wave-size', type=int, default=ADAPTIVE_WAVE_SIZE,
+                        help=f'Candidates per adaptive wave (default: {ADAPTIVE_WAVE_SIZE})')
+    parser.add_argument('--survivors', type=int, default=ADAPTIVE_SURVIVORS,
+                        help=f'Adaptive stop: survivors needed per chunk (default: {ADAPTIVE_SURVIVORS})')
+    parser.add_argument('--no-library', action='store_true',
+                        help='Do not reuse (or record) candidates in the cross-session library')
+    parser.add_argument('--cap', type=int, default=None,
+                        help='Adaptive cap on candidates per chunk (default: standard count + --extra)')
     args = parser.parse_args()
 
+    adaptive = None
+    if args.adaptive:
+        adaptive = {'wave_size': args.wave_size, 'survivors': args.survivors,
+                    'cap': args.cap}
+
     # Ensure vault directory exists
     VAULT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -1767,7 +2194,9 @@ async def main():
             print("ERROR: --regen-chunks requires a session ID or script path as positional argument")
             return
         chunk_indices = [int(x.strip()) for x in args.regen_chunks.split(',')]
-        await regen_chunks(session_id, chunk_indices, args.count)
+        await regen_chunks(session_id, chunk_indices, args.count,
+                           score_workers=args.score_workers,
+                           library=not args.no_library)
         return
 
     if args.inventory_only:
@@ -1798,7 +2227,10 @@ async def main():
 
         results = []
         for script in scripts:
-            manifest = await build_session(script, dry_run=args.dry_run, extra=args.extra, only_chunks=args.only_chunks)
+            manifest = await build_session(script, dry_run=args.dry_run, extra=args.extra, only_chunks=args.only_chunks,
+                                           score_workers=args.score_workers,
+                                           adaptive=adaptive,
+                                           library=not args.no_library)
             if manifest:
                 results.append(manifest)
 
@@ -1813,7 +2245,10 @@ async def main():
                 f"Pre-filter failures: {sum(m['chunks_below_prefilter'] for m in results)}"
             )
     elif args.script:
-        manifest = await build_session(args.script, dry_run=args.dry_run, extra=args.extra, only_chunks=args.only_chunks)
+        manifest = await build_session(args.script, dry_run=args.dry_run, extra=args.extra, only_chunks=args.only_chunks,
+                                       score_workers=args.score_workers,
+                                       adaptive=adaptive,
+                                       library=not args.no_library)
         if manifest and not args.dry_run:
             send_notification(
                 f"Vault Build Complete — {manifest['script_id']}",
@@ -1845,4 +2280,5 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    with profiling.run(f"vault-builder {' '.join(sys.argv[1:])}"):
+        asyncio.run(main())
@@ -16,7 +16,9 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
-import whisper
+
+sys.path.insert(0, str(Path(__file__).parent))
+import asr_client
 
 warnings.filterwarnings('ignore')
 
@@ -24,6 +26,14 @@ PROJECT_ROOT = Path(__file__).parent
 OUTPUT_DIR = PROJECT_ROOT / "reference" / "echo-training"
 AUDIO_DIR = OUTPUT_DIR / "audio"
 LABELS_DIR = PROJECT_ROOT / "reference" / "human-labels"
+ASR_BATCH = 8  # chunks per transcription request (cache is saved after each)
+
+TRANSCRIBE_OPTIONS = dict(
+    language='en',
+    word_timestamps=True,
+    logprob_threshold=None,  # Don't filter low-confidence segments
+    no_speech_threshold=0.3,
+)
 
 AUDIO_MAP = {
     "36-loving-kindness-intro-v3a": {
@@ -90,16 +100,8 @@ def load_labels():
     return results
 
 
-def analyse_chunk(model, audio_path):
-    """Run Whisper on a chunk, extract confidence metrics."""
-    result = model.transcribe(
-        audio_path,
-        language='en',
-        word_timestamps=True,
-        logprob_threshold=None,  # Don't filter low-confidence segments
-        no_speech_threshold=0.3,
-    )
-
+def analyse_chunk(result):
+    """Extract confidence metrics from a chunk's Whisper result."""
     metrics = {}
 
     # Segment-level metrics
@@ -479,35 +481,39 @@ def main():
                 cached[key] = item
         print(f"Cached: {len(cached)}")
 
-    print("Loading Whisper base model...")
-    model = whisper.load_model("base")
-    print("Model loaded.")
+    def cache_key(entry):
+        return f"{entry['session']}_chunk{entry['chunk']}"
 
+    # Uncached chunks go to Whisper (ASR server, else in-process) ASR_BATCH at a time
     results = []
-    for i, entry in enumerate(labels):
-        session = entry['session']
-        chunk = entry['chunk']
-        verdict = entry['verdict']
-        cache_key = f"{session}_chunk{chunk}"
+    for start in range(0, len(labels), ASR_BATCH):
+        batch = labels[start:start + ASR_BATCH]
+        todo = [e['audio_path'] for e in batch if cache_key(e) not in cached]
+        transcripts = dict(zip(todo, asr_client.transcribe(todo, **TRANSCRIBE_OPTIONS))) if todo else {}
 
-        if cache_key in cached:
-            print(f"  [{i+1}/{len(labels)}] {session} chunk {chunk} ({verdict}) — CACHED")
-            results.append(cached[cache_key])
-            continue
+        for i, entry in enumerate(batch, start):
+            session = entry['session']
+            chunk = entry['chunk']
+            verdict = entry['verdict']
 
-        print(f"  [{i+1}/{len(labels)}] {session} chunk {chunk} ({verdict}) — analysing...")
+            if cache_key(entry) in cached:
+                print(f"  [{i+1}/{len(labels)}] {session} chunk {chunk} ({verdict}) — CACHED")
+                results.append(cached[cache_key(entry)])
+                continue
 
-        metrics = analyse_chunk(model, entry['audio_path'])
+            print(f"  [{i+1}/{len(labels)}] {session} chunk {chunk} ({verdict}) — analysing...")
 
-        result = {
-            'session': session,
-            'chunk': chunk,
-            'verdict': verdict,
-            'notes': entry['notes'],
-            'script_text': entry['script_text'],
-        }
-        result.update(metrics)
-        results.append(result)
+            metrics = analyse_chunk(transcripts[entry['audio_path']])
+
+            result = {
+                'session': session,
+                'chunk': chunk,
+                'verdict': verdict,
+                'notes': entry['notes'],
+                'script_text': entry['script_text'],
+            }
+            result.update(metrics)
+            results.append(result)
 
         # Save cache incrementally
         with open(cache_path, 'w') as f: